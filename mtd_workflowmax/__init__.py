@@ -17,8 +17,6 @@ from .services.workflowmax_linkedin_service import WorkflowMaxLinkedInService
 from .services.relationship_service import RelationshipService
 from .services.job_service import JobService
 
-# Initialize logging with default settings
-LogManager.configure_logging()
 logger = get_logger('workflowmax')
 
 class WorkflowMax:
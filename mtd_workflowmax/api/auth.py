@@ -97,6 +97,9 @@ class OAuthManager:
         
         if self.auth_config.token_storage.encryption_key:
             self._encryption_key = Fernet.generate_key()
+        
+        # Keep-alive session for token endpoint calls
+        self.session = requests.Session()
     
     def _generate_state(self) -> str:
         """Generate secure state parameter.
@@ -234,7 +237,7 @@ class OAuthManager:
             TokenRefreshError: If refresh fails
         """
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.auth_config.oauth2_endpoints.token_url,
                 data={
                     'grant_type': 'refresh_token',
@@ -345,7 +348,7 @@ class OAuthManager:
                     raise AuthenticationError("Invalid state parameter")
                 
                 # Exchange code for tokens
-                token_response = requests.post(
+                token_response = self.session.post(
                     self.auth_config.oauth2_endpoints.token_url,
                     data={
                         'grant_type': 'authorization_code',
@@ -2,7 +2,8 @@
 
 import time
 import asyncio
-from typing import Dict, Optional, List, Any, AsyncGenerator
+import threading
+from typing import Dict, Optional, List, Any, AsyncGenerator, Union
 from contextlib import contextmanager
 from urllib.parse import urljoin
 import requests
@@ -43,6 +44,10 @@ class RateLimiter:
         self.minute_reset = time.time() + 60
         self.daily_reset = time.time() + 86400
         
+        # Guards the counters; callers may acquire from several threads and
+        # wait on it for a call slot to be released
+        self._capacity = threading.Condition()
+        
         # Initialize rate limit metrics
         metrics.RATE_LIMIT_REMAINING.set(self.minute_limit)
     
@@ -59,49 +64,62 @@ class RateLimiter:
         self._wait_for_capacity()
         
         try:
-            self.active_calls += 1
-            self.minute_calls += 1
-            self.daily_calls += 1
-            
-            # Update metrics
-            metrics.RATE_LIMIT_REMAINING.set(self.minute_limit - self.minute_calls)
-            
             yield
         finally:
-            self.active_calls -= 1
+            with self._capacity:
+                self.active_calls -= 1
+                self._capacity.notify()
     
     def _wait_for_capacity(self):
-        """Wait until capacity is available."""
-        start_time = time.time()
-        max_wait = 60  # Maximum wait time in seconds
+        """Wait until capacity is available, then reserve a call slot.
         
-        while True:
-            now = time.time()
-            
-            # Check if we've waited too long
-            if now - start_time > max_wait:
-                raise RateLimitError(
-                    "Rate limit wait timeout exceeded",
-                    reset_time=int(min(self.minute_reset, self.daily_reset) - now)
-                )
-            
-            # Reset counters if time windows have elapsed
-            if now > self.minute_reset:
-                self.minute_calls = 0
-                self.minute_reset = now + 60
+        Waiters sleep on a condition rather than polling: they are woken as
+        soon as a concurrent call finishes, or when the exhausted minute or
+        daily window resets.
+        """
+        deadline = time.monotonic() + 60  # Maximum wait time in seconds
+        
+        with self._capacity:
+            while True:
+                now = time.time()
                 
-            if now > self.daily_reset:
-                self.daily_calls = 0
-                self.daily_reset = now + 86400
-            
-            # Check if we have capacity
-            if (self.active_calls < self.concurrent_limit and
-                self.minute_calls < self.minute_limit and
-                self.daily_calls < self.daily_limit):
-                break
-            
-            # Wait before checking again
-            time.sleep(0.1)
+                # Reset counters if time windows have elapsed
+                if now > self.minute_reset:
+                    self.minute_calls = 0
+                    self.minute_reset = now + 60
+                    
+                if now > self.daily_reset:
+                    self.daily_calls = 0
+                    self.daily_reset = now + 86400
+                
+                # Check and reserve capacity in one step
+                if (self.active_calls < self.concurrent_limit and
+                    self.minute_calls < self.minute_limit and
+                    self.daily_calls < self.daily_limit):
+                    self.active_calls += 1
+                    self.minute_calls += 1
+                    self.daily_calls += 1
+                    
+                    # Update metrics
+                    metrics.RATE_LIMIT_REMAINING.set(self.minute_limit - self.minute_calls)
+                    return
+                
+                # Check if we've waited too long
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise RateLimitError(
+                        "Rate limit wait timeout exceeded",
+                        reset_time=int(min(self.minute_reset, self.daily_reset) - now)
+                    )
+                
+                # A released slot notifies us; an exhausted window only frees
+                # up when it resets, so don't sleep past that
+                timeout = remaining
+                if self.minute_calls >= self.minute_limit:
+                    timeout = min(timeout, self.minute_reset - now)
+                if self.daily_calls >= self.daily_limit:
+                    timeout = min(timeout, self.daily_reset - now)
+                self._capacity.wait(max(timeout, 0.01))
 
 class CustomPoolManager(PoolManager):
     """Enhanced connection pool manager."""
@@ -155,6 +173,15 @@ class APIClient:
         self.session.mount("https://", adapter)
         self.session.mount("http://", adapter)
         
+        # Headers common to every call live on the session, so each request
+        # reuses them (and a kept-alive connection) instead of rebuilding them
+        self.session.headers.update({
+            'Accept': 'application/xml',
+            'Content-Type': 'application/xml',
+            'User-Agent': f'WorkflowMaxAPI/{config.api.api_version}',
+            'Connection': 'keep-alive'
+        })
+        
         # Initialize rate limiter
         self.rate_limiter = RateLimiter()
         
@@ -169,6 +196,7 @@ class APIClient:
         """
         self.tokens = tokens
         self.org_id = org_id
+        self.session.headers.update(self._get_default_headers())
         logger.info("Authentication set for organization", org_id=org_id)
     
     @contextmanager
@@ -197,7 +225,7 @@ class APIClient:
             logger.debug("Rate limit reset", seconds=reset)
     
     def _get_default_headers(self) -> Dict[str, str]:
-        """Get default headers for API requests.
+        """Get authentication headers for API requests.
         
         Returns:
             Dict[str, str]: Headers dictionary
@@ -211,10 +239,7 @@ class APIClient:
             
         return {
             'Authorization': f"Bearer {self.tokens['access_token']}",
-            'account_id': self.org_id,
-            'Accept': 'application/xml',
-            'Content-Type': 'application/xml',
-            'User-Agent': f'WorkflowMaxAPI/{config.api.api_version}'
+            'account_id': self.org_id
         }
     
     @handle_api_errors()
@@ -235,21 +260,18 @@ class APIClient:
             Various exceptions defined in exceptions.py
         """
         with Timer(f"{method} {endpoint}"), self.rate_limiter.acquire(), self._track_connection():
-            # Merge default headers with any custom headers
-            headers = self._get_default_headers()
-            if 'headers' in kwargs:
-                headers.update(kwargs['headers'])
-            kwargs['headers'] = headers
+            # Default and auth headers are set on the session; requests
+            # merges any custom headers over them
+            if not self.tokens or not self.org_id:
+                logger.error("Attempted to make a request without authentication")
+                raise AuthenticationError("Not authenticated")
             
             # Remove leading slash if present
             endpoint = endpoint.lstrip('/')
             url = urljoin(self.base_url, endpoint)
             logger.debug("Making request", method=method, url=url)
             
-            with metrics.API_REQUEST_DURATION.labels(
-                endpoint=endpoint,
-                method=method
-            ).time():
+            with metrics.api_request_timer(endpoint, method).time():
                 response = self.session.request(
                     method,
                     url,
@@ -258,10 +280,10 @@ class APIClient:
                 )
             
             # Update metrics
-            metrics.API_REQUESTS.labels(
-                endpoint=endpoint,
-                method=method,
-                status=response.status_code
+            metrics.api_request_counter(
+                endpoint,
+                method,
+                str(response.status_code)
             ).inc()
             
             self._update_rate_limit_metrics(response)
@@ -271,15 +293,22 @@ class APIClient:
                        reason=response.reason)
             return response
 
-    def get(self, endpoint: str, params: Optional[Dict] = None) -> requests.Response:
-        """Make a GET request."""
+    def get(self, endpoint: str, params: Optional[Dict] = None, stream: bool = False) -> requests.Response:
+        """Make a GET request.
+        
+        With ``stream=True`` the body is left unread for the caller to parse
+        from ``response.raw`` with ``core.xml_utils.iter_elements``, which
+        checks the response Status in place of validate_response.
+        """
+        if stream:
+            return self.request('GET', endpoint, params=params, stream=True)
         return self.request('GET', endpoint, params=params)
 
-    def post(self, endpoint: str, data: str) -> requests.Response:
+    def post(self, endpoint: str, data: Union[str, bytes]) -> requests.Response:
         """Make a POST request."""
         return self.request('POST', endpoint, data=data)
 
-    def put(self, endpoint: str, data: str) -> requests.Response:
+    def put(self, endpoint: str, data: Union[str, bytes]) -> requests.Response:
         """Make a PUT request."""
         return self.request('PUT', endpoint, data=data)
 
@@ -119,11 +119,18 @@ def validate_response(expected_status: Optional[str] = 'OK') -> Callable:
         @validate_response('Created')  # With custom status
         def my_func():
             pass
+    
+    Streamed requests (``stream=True``) are not read here, since that would
+    consume the stream. Their Status is checked instead by
+    ``core.xml_utils.iter_elements``, which is how streamed bodies are parsed.
     """
     def decorator(func: Callable[..., Response]) -> Callable[..., Response]:
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Response:
             response = func(*args, **kwargs)
+            if kwargs.get('stream'):
+                # Checked by xml_utils.iter_elements as the body is parsed
+                return response
             try:
                 xml_root = ET.fromstring(response.text.encode('utf-8'))
                 status = xml_root.find('Status')
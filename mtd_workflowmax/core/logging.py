@@ -19,6 +19,8 @@ from functools import wraps
 # Context variables for request tracking
 request_id: ContextVar[str] = ContextVar('request_id', default='')
 correlation_id: ContextVar[str] = ContextVar('correlation_id', default='')
+# UUID of the WorkflowMax contact being processed, if any
+contact_uuid: ContextVar[str] = ContextVar('contact_uuid', default='')
 
 def get_app_log_dir() -> Path:
     """Get application-specific log directory in system temp."""
@@ -72,10 +74,18 @@ COLORS = {
 }
 
 class JsonFormatter(logging.Formatter):
-    """Formatter that outputs JSON formatted logs."""
+    """Formatter that outputs JSON formatted logs.
+    
+    The formatted text is cached on the record, so the file handlers sharing
+    this formatter serialize each record once rather than once per handler.
+    """
     
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON."""
+        cached = record.__dict__.get('_json_formatted')
+        if cached is not None:
+            return cached
+        
         # Extract the message
         message = record.msg
         if isinstance(message, dict):
@@ -99,6 +109,7 @@ class JsonFormatter(logging.Formatter):
             # Request tracking next
             **({"request_id": request_id.get()} if request_id.get() else {}),
             **({"correlation_id": correlation_id.get()} if correlation_id.get() else {}),
+            **({"contact_uuid": contact_uuid.get()} if contact_uuid.get() else {}),
             
             # Message and context
             **log_dict
@@ -125,9 +136,15 @@ class JsonFormatter(logging.Formatter):
             .replace('"context":', f'{COLORS["MAGENTA"]}"context":{COLORS["RESET"]}')
             .replace('"request_id":', f'{COLORS["CYAN"]}"request_id":{COLORS["RESET"]}')
             .replace('"correlation_id":', f'{COLORS["CYAN"]}"correlation_id":{COLORS["RESET"]}')
+            .replace('"contact_uuid":', f'{COLORS["CYAN"]}"contact_uuid":{COLORS["RESET"]}')
         )
         
-        return separator + json_str + '\n'
+        formatted = separator + json_str + '\n'
+        record._json_formatted = formatted
+        return formatted
+
+# Shared by all file handlers
+JSON_FORMATTER = JsonFormatter()
 
 class PrettyFormatter(logging.Formatter):
     """Formatter that outputs clean, readable logs."""
@@ -291,42 +308,48 @@ class StructuredLogger:
         self.logger = logging.getLogger(name)
         self.name = name
     
-    def _format_log(self, level: str, message: str, **kwargs) -> Dict[str, Any]:
-        """Format log entry as structured dictionary."""
+    def _format_log(self, level: str, message: str, *args, **kwargs) -> Dict[str, Any]:
+        """Format log entry as structured dictionary.
+        
+        ``%``-style ``args`` are merged into the message here, so callers
+        passing them only pay for formatting when the level is enabled.
+        """
+        if args:
+            message = message % args
         log_dict = {'message': message}
         if kwargs:
             log_dict['context'] = kwargs
         return log_dict
 
-    def debug(self, message: str, **kwargs):
+    def debug(self, message: str, *args, **kwargs):
         """Log debug message."""
         if self.logger.isEnabledFor(logging.DEBUG):
-            self.logger.debug(self._format_log('DEBUG', message, **kwargs))
+            self.logger.debug(self._format_log('DEBUG', message, *args, **kwargs))
 
-    def info(self, message: str, **kwargs):
+    def info(self, message: str, *args, **kwargs):
         """Log info message."""
         if self.logger.isEnabledFor(logging.INFO):
-            self.logger.info(self._format_log('INFO', message, **kwargs))
+            self.logger.info(self._format_log('INFO', message, *args, **kwargs))
 
-    def warning(self, message: str, **kwargs):
+    def warning(self, message: str, *args, **kwargs):
         """Log warning message."""
         if self.logger.isEnabledFor(logging.WARNING):
-            self.logger.warning(self._format_log('WARNING', message, **kwargs))
+            self.logger.warning(self._format_log('WARNING', message, *args, **kwargs))
 
-    def error(self, message: str, **kwargs):
+    def error(self, message: str, *args, **kwargs):
         """Log error message."""
         if self.logger.isEnabledFor(logging.ERROR):
-            self.logger.error(self._format_log('ERROR', message, **kwargs))
+            self.logger.error(self._format_log('ERROR', message, *args, **kwargs))
 
-    def critical(self, message: str, **kwargs):
+    def critical(self, message: str, *args, **kwargs):
         """Log critical message."""
         if self.logger.isEnabledFor(logging.CRITICAL):
-            self.logger.critical(self._format_log('CRITICAL', message, **kwargs))
+            self.logger.critical(self._format_log('CRITICAL', message, *args, **kwargs))
 
 class LogManager:
     """Manages logging configuration and setup."""
     
-    _instance = None
+    _instance: Optional['LogManager'] = None
     _debug_enabled = None
     _current_level = logging.INFO
     _initialized = False
@@ -340,16 +363,9 @@ class LogManager:
     }
     
     def __new__(cls):
-        """Ensure singleton instance."""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
+        """Return the module-level singleton instance."""
         return cls._instance
     
-    def __init__(self):
-        """Initialize logging configuration."""
-        # Initialization is now handled by configure_logging
-        pass
-    
     @classmethod
     def is_debug_enabled(cls) -> bool:
         """Check if debug logging is enabled."""
@@ -426,7 +442,7 @@ class LogManager:
         root_logger.addHandler(console_handler)
         
         # Add file handlers with JSON formatting
-        json_formatter = JsonFormatter()
+        json_formatter = JSON_FORMATTER
         
         # Main log file - INFO and above
         main_handler = logging.handlers.RotatingFileHandler(
@@ -465,19 +481,20 @@ class LogManager:
         
         cls._initialized = True
 
+# Configure logging once at import time. Module import is serialized by the
+# import lock, so this cannot race and get_logger needs no initialization check.
+LogManager._instance = object.__new__(LogManager)
+LogManager.configure_logging()
+
 def get_logger(name: str) -> StructuredLogger:
     """Get a structured logger instance.
     
-    This will initialize logging if not already configured.
-    
     Args:
         name: Logger name
         
     Returns:
         StructuredLogger instance
     """
-    if not LogManager._initialized:
-        LogManager.configure_logging()
     return StructuredLogger(name)
 
 def with_logging(func):
@@ -489,21 +506,24 @@ def with_logging(func):
         if not request_id.get():
             request_id.set(str(uuid.uuid4()))
         
-        log_args = [str(arg) for arg in args]
-        log_kwargs = {k: str(v) for k, v in kwargs.items()}
-        
-        logger.debug(
-            f"Calling {func.__name__}",
-            args=log_args,
-            kwargs=log_kwargs
-        )
+        # Stringifying arguments and results (whole profiles and response
+        # lists, for some callers) costs far more than most wrapped calls,
+        # so only do it when the debug lines will actually be emitted
+        debug = logger.logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(
+                f"Calling {func.__name__}",
+                args=[str(arg) for arg in args],
+                kwargs={k: str(v) for k, v in kwargs.items()}
+            )
         
         try:
             result = func(*args, **kwargs)
-            logger.debug(
-                f"Completed {func.__name__}",
-                result=str(result)
-            )
+            if debug:
+                logger.debug(
+                    f"Completed {func.__name__}",
+                    result=str(result)
+                )
             return result
         except Exception as e:
             logger.error(
@@ -1,7 +1,13 @@
 """Prometheus metrics for WorkflowMax API."""
 
+from functools import lru_cache
+
 from prometheus_client import Counter, Gauge, Histogram
 
+# Latency buckets shared by the per-call duration histograms. Kept to the
+# policy thresholds only, since every observation walks the bucket list.
+OPERATION_DURATION_BUCKETS = (0.25, 1.0, 2.5, 10.0)
+
 # API request metrics
 API_REQUESTS = Counter(
     'workflowmax_api_requests_total',
@@ -13,7 +19,7 @@ API_REQUEST_DURATION = Histogram(
     'workflowmax_api_request_duration_seconds',
     'API request duration in seconds',
     ['endpoint', 'method'],
-    buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+    buckets=OPERATION_DURATION_BUCKETS
 )
 
 # Rate limit metrics
@@ -113,7 +119,7 @@ SERVICE_OPERATION_DURATION = Histogram(
     'workflowmax_service_operation_duration_seconds',
     'Duration of service operations',
     ['service', 'operation'],
-    buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+    buckets=OPERATION_DURATION_BUCKETS
 )
 
 SERVICE_OPERATION_FAILURES = Counter(
@@ -127,7 +133,7 @@ REPOSITORY_OPERATION_DURATION = Histogram(
     'workflowmax_repository_operation_duration_seconds',
     'Duration of repository operations',
     ['repository', 'operation'],
-    buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+    buckets=OPERATION_DURATION_BUCKETS
 )
 
 REPOSITORY_OPERATION_FAILURES = Counter(
@@ -135,3 +141,107 @@ REPOSITORY_OPERATION_FAILURES = Counter(
     'Total number of repository operation failures',
     ['repository', 'operation', 'error_type']
 )
+
+
+# Pre-bound child metrics
+#
+# ``.labels()`` hashes the label values and looks up (or creates) the child
+# metric on every call. The accessors below resolve each label combination
+# once and hand back the same child on subsequent calls.
+
+@lru_cache(maxsize=1024)
+def api_request_counter(endpoint: str, method: str, status: str):
+    """Get API request counter child for a label combination."""
+    return API_REQUESTS.labels(endpoint=endpoint, method=method, status=status)
+
+
+@lru_cache(maxsize=1024)
+def api_request_timer(endpoint: str, method: str):
+    """Get API request duration histogram child for a label combination."""
+    return API_REQUEST_DURATION.labels(endpoint=endpoint, method=method)
+
+
+@lru_cache(maxsize=256)
+def circuit_breaker_state(endpoint: str):
+    """Get circuit breaker state gauge child for an endpoint."""
+    return CIRCUIT_BREAKER_STATE.labels(endpoint=endpoint)
+
+
+@lru_cache(maxsize=256)
+def circuit_breaker_failures(endpoint: str):
+    """Get circuit breaker failure counter child for an endpoint."""
+    return CIRCUIT_BREAKER_FAILURES.labels(endpoint=endpoint)
+
+
+@lru_cache(maxsize=256)
+def circuit_breaker_trips(endpoint: str):
+    """Get circuit breaker trip counter child for an endpoint."""
+    return CIRCUIT_BREAKER_TRIPS.labels(endpoint=endpoint)
+
+
+@lru_cache(maxsize=128)
+def cache_hits(cache_name: str):
+    """Get cache hit counter child for a cache."""
+    return CACHE_HITS.labels(cache_name=cache_name)
+
+
+@lru_cache(maxsize=128)
+def cache_misses(cache_name: str):
+    """Get cache miss counter child for a cache."""
+    return CACHE_MISSES.labels(cache_name=cache_name)
+
+
+@lru_cache(maxsize=128)
+def cache_size(cache_name: str):
+    """Get cache size gauge child for a cache."""
+    return CACHE_SIZE.labels(cache_name=cache_name)
+
+
+@lru_cache(maxsize=128)
+def cache_evictions(cache_name: str):
+    """Get cache eviction counter child for a cache."""
+    return CACHE_EVICTIONS.labels(cache_name=cache_name)
+
+
+@lru_cache(maxsize=8)
+def auth_attempts(status: str):
+    """Get authentication attempt counter child for a status."""
+    return AUTH_ATTEMPTS.labels(status=status)
+
+
+@lru_cache(maxsize=8)
+def auth_token_refreshes(status: str):
+    """Get token refresh counter child for a status."""
+    return AUTH_TOKEN_REFRESHES.labels(status=status)
+
+
+@lru_cache(maxsize=1024)
+def service_operation_timer(service: str, operation: str):
+    """Get service operation duration histogram child."""
+    return SERVICE_OPERATION_DURATION.labels(service=service, operation=operation)
+
+
+@lru_cache(maxsize=1024)
+def service_operation_failures(service: str, operation: str, error_type: str):
+    """Get service operation failure counter child."""
+    return SERVICE_OPERATION_FAILURES.labels(
+        service=service,
+        operation=operation,
+        error_type=error_type
+    )
+
+
+@lru_cache(maxsize=1024)
+def repository_operation_timer(repository: str, operation: str):
+    """Get repository operation duration histogram child."""
+    return REPOSITORY_OPERATION_DURATION.labels(repository=repository, operation=operation)
+
+
+@lru_cache(maxsize=1024)
+def repository_operation_failures(repository: str, operation: str, error_type: str):
+    """Get repository operation failure counter child."""
+    return REPOSITORY_OPERATION_FAILURES.labels(
+        repository=repository,
+        operation=operation,
+        error_type=error_type
+    )
@@ -1,15 +1,19 @@
 """Utility functions and helpers for WorkflowMax API."""
 
+import re
 import time
-from typing import TypeVar, Callable, Any, Dict, Optional
-from functools import wraps
+import logging
+from typing import TypeVar, Callable, Any, Optional
+from functools import wraps, lru_cache
+from concurrent.futures import ThreadPoolExecutor
 import xml.etree.ElementTree as ET
-from datetime import datetime, timezone
+from datetime import datetime, timezone, timedelta
 import hashlib
 import json
 from pathlib import Path
 
 from .logging import get_logger
+from . import metrics
 from .exceptions import ValidationError, XMLParsingError
 
 logger = get_logger('workflowmax.utils')
@@ -146,18 +150,170 @@ def validate_xml(xml_string: str) -> ET.Element:
     except ET.ParseError as e:
         raise ValidationError(f"Invalid XML: {str(e)}")
 
-def format_datetime(dt: Optional[datetime] = None) -> str:
+# (epoch second, ISO string) for the current-time case of format_datetime
+_iso_cache = (0, '')
+
+# YYYY-MM-DD, as used by WorkflowMax date fields; used with fullmatch, since
+# '$' would also match before a trailing newline
+_DATE_RE = re.compile(r'(\d{4})-(\d{2})-(\d{2})')
+
+def is_valid_ymd(value: str) -> bool:
+    """Check that a string is a valid YYYY-MM-DD calendar date.
+    
+    Cheaper than ``datetime.strptime`` for pure format validation: the
+    format is matched with a precompiled regex and the calendar is only
+    consulted for days that could overflow the month. Unlike ``strptime``,
+    month and day must be zero-padded.
+    
+    Args:
+        value: Date string to check
+        
+    Returns:
+        True if value is a valid date
+    """
+    match = _DATE_RE.fullmatch(value)
+    if match is None:
+        return False
+    
+    year, month, day = int(match[1]), int(match[2]), int(match[3])
+    if not (1 <= month <= 12 and 1 <= day <= 31):
+        return False
+    if day > 28:
+        try:
+            datetime(year, month, day)
+        except ValueError:
+            return False
+    return True
+
+# strptime directives understood by compile_date_format, with the same
+# patterns strptime uses (month, day and time fields may be unpadded)
+_FMT_DIRECTIVES = {
+    'Y': r'(?P<year>\d\d\d\d)',
+    'm': r'(?P<month>1[0-2]|0[1-9]|[1-9])',
+    'd': r'(?P<day>3[0-1]|[1-2]\d|0[1-9]|[1-9]| [1-9])',
+    'H': r'(?P<hour>2[0-3]|[0-1]\d|\d)',
+    'M': r'(?P<minute>[0-5]\d|\d)',
+    'S': r'(?P<second>6[0-1]|[0-5]\d|\d)',
+    'z': r'(?P<tz>[+-]\d\d:?[0-5]\d(:?[0-5]\d(\.\d{1,6})?)?|(?-i:Z))',
+}
+
+def _parse_utc_offset(tz: str) -> timezone:
+    """Convert a matched %z value into a fixed-offset timezone.
+    
+    Args:
+        tz: 'Z' or an offset such as '+0100', '-05:30' or '+01:00:30.5'
+        
+    Returns:
+        Timezone with that offset
+        
+    Raises:
+        ValueError: If ':' is used between some fields but not others
+    """
+    if tz == 'Z':
+        return timezone.utc
+    offset = tz
+    if offset[3] == ':':
+        offset = offset[:3] + offset[4:]
+        if len(offset) > 5:
+            if offset[5] != ':':
+                raise ValueError(f"Inconsistent use of : in {tz}")
+            offset = offset[:5] + offset[6:]
+    sign = -1 if offset[0] == '-' else 1
+    fraction = offset[8:]
+    return timezone(sign * timedelta(
+        hours=int(offset[1:3]),
+        minutes=int(offset[3:5]),
+        seconds=int(offset[5:7] or 0),
+        microseconds=int(fraction.ljust(6, '0')) if fraction else 0
+    ))
+
+@lru_cache(maxsize=8)
+def compile_date_format(fmt: str) -> Callable[[str], datetime]:
+    """Compile a strptime format into a reusable parser.
+    
+    The format is translated to a regex once per format string, avoiding the
+    per-call format parsing and locale handling of ``datetime.strptime``.
+    Inputs are accepted and rejected as ``strptime`` would: the directive
+    patterns, case-insensitive literals and whitespace handling are the
+    same. Formats using directives other than %Y %m %d %H %M %S %z fall
+    back to ``strptime``.
+    
+    Args:
+        fmt: strptime format string
+        
+    Returns:
+        Function parsing a string into a datetime, raising ValueError on
+        mismatch like ``strptime``
+    """
+    parts = []
+    i = 0
+    while i < len(fmt):
+        char = fmt[i]
+        if char == '%' and i + 1 < len(fmt):
+            directive = _FMT_DIRECTIVES.get(fmt[i + 1])
+            if directive is None:
+                return lambda value: datetime.strptime(value, fmt)
+            parts.append(directive)
+            i += 2
+        elif char.isspace():
+            # strptime lets any run of whitespace match format whitespace
+            while i < len(fmt) and fmt[i].isspace():
+                i += 1
+            parts.append(r'\s+')
+        else:
+            parts.append(re.escape(char))
+            i += 1
+    pattern = re.compile(''.join(parts), re.IGNORECASE)
+    
+    def parse(value: str) -> datetime:
+        # Matched and then length-checked as strptime does; '$' would also
+        # accept a trailing newline
+        match = pattern.match(value)
+        if match is None:
+            raise ValueError(f"time data {value!r} does not match format {fmt!r}")
+        if match.end() != len(value):
+            raise ValueError(f"unconverted data remains: {value[match.end():]}")
+        fields = match.groupdict()
+        tz = fields.get('tz')
+        return datetime(
+            int(fields.get('year') or 1900),
+            int(fields.get('month') or 1),
+            int(fields.get('day') or 1),
+            int(fields.get('hour') or 0),
+            int(fields.get('minute') or 0),
+            int(fields.get('second') or 0),
+            tzinfo=_parse_utc_offset(tz) if tz is not None else None
+        )
+    
+    return parse
+
+def format_datetime(dt: Optional[datetime] = None, precise: bool = False) -> str:
     """Format datetime in ISO 8601 format.
     
+    The current time is formatted at whole-second resolution and cached for
+    the rest of that second, unless ``precise`` is set.
+    
     Args:
         dt: Datetime to format. If None, uses current time.
+        precise: Include fractional seconds when formatting the current time
         
     Returns:
         Formatted datetime string
     """
+    global _iso_cache
+    
     if dt is None:
-        dt = datetime.now(timezone.utc)
-    elif dt.tzinfo is None:
+        if precise:
+            return datetime.now(timezone.utc).isoformat()
+        
+        sec = int(time.time())
+        cached_sec, cached = _iso_cache
+        if sec != cached_sec:
+            cached = datetime.fromtimestamp(sec, tz=timezone.utc).isoformat()
+            _iso_cache = (sec, cached)
+        return cached
+    
+    if dt.tzinfo is None:
         dt = dt.replace(tzinfo=timezone.utc)
         
     return dt.isoformat()
@@ -184,16 +340,39 @@ def generate_cache_key(*args, **kwargs) -> str:
     # Generate hash
     return hashlib.sha256(key_str.encode()).hexdigest()
 
+def fan_out_pool(task_count: int, max_workers: int, name: str = 'fan-out') -> ThreadPoolExecutor:
+    """Create a thread pool for issuing independent API calls concurrently.
+    
+    Args:
+        task_count: Number of calls to be issued
+        max_workers: Upper bound on threads (normally the API's concurrent
+            request limit; the API client's rate limiter still gates calls)
+        name: Thread name prefix
+        
+    Returns:
+        Thread pool executor
+    """
+    workers = max(1, min(task_count, max_workers))
+    return ThreadPoolExecutor(max_workers=workers, thread_name_prefix=name)
+
 class Singleton:
-    """Base class for singleton pattern implementation."""
+    """Base class for singleton pattern implementation.
+    
+    The sole instance of each subclass is allocated when the subclass is
+    defined, so instance lookup is a single attribute read and concurrent
+    first use cannot construct two instances.
+    """
+    
+    _instance: Any = None
     
-    _instances: Dict[type, Any] = {}
+    def __init_subclass__(cls, **kwargs):
+        """Allocate the subclass instance at class creation time."""
+        super().__init_subclass__(**kwargs)
+        cls._instance = object.__new__(cls)
     
     def __new__(cls, *args, **kwargs):
-        """Ensure only one instance exists."""
-        if cls not in cls._instances:
-            cls._instances[cls] = super().__new__(cls)
-        return cls._instances[cls]
+        """Return the pre-allocated instance."""
+        return cls._instance
 
 def validate_required(value: Any, name: str):
     """Validate required field is not None or empty.
@@ -290,27 +469,45 @@ def get_cache_age(timestamp: Optional[float]) -> float:
     return time.time() - timestamp
 
 class Timer:
-    """Context manager for timing code execution."""
+    """Context manager for timing code execution.
     
-    def __init__(self, name: str):
+    Uses the monotonic ``perf_counter_ns`` clock. Completion is logged at
+    info level only when the block takes at least ``threshold_ms``; shorter
+    blocks are still logged when debug logging is enabled. When ``service``
+    is given the elapsed time is also recorded in the service operation
+    duration histogram, labelled with the timer name as the operation.
+    """
+    
+    _logger = get_logger('workflowmax.timer')
+    
+    def __init__(self, name: str, service: Optional[str] = None, threshold_ms: float = 1.0):
         """Initialize timer.
         
         Args:
-            name: Name for logging
+            name: Name for logging (and operation label for metrics)
+            service: Optional service label for the duration metric
+            threshold_ms: Minimum duration in milliseconds logged at info level
         """
         self.name = name
-        self.start_time = None
-        self.logger = get_logger('workflowmax.timer')
+        self.service = service
+        self.threshold_ns = int(threshold_ms * 1_000_000)
+        self.start_ns = None
+        self.logger = self._logger
     
     def __enter__(self):
         """Start timer."""
-        self.start_time = time.time()
+        self.start_ns = time.perf_counter_ns()
         return self
     
     def __exit__(self, *args):
-        """Log elapsed time."""
-        elapsed = time.time() - self.start_time
-        self.logger.info(
-            f"{self.name} completed",
-            elapsed_seconds=elapsed
-        )
+        """Record and log elapsed time."""
+        elapsed_ns = time.perf_counter_ns() - self.start_ns
+        elapsed = elapsed_ns / 1_000_000_000
+        
+        if self.service is not None:
+            metrics.service_operation_timer(self.service, self.name).observe(elapsed)
+        
+        if elapsed_ns >= self.threshold_ns:
+            self.logger.info("%s completed", self.name, elapsed_seconds=elapsed)
+        elif self.logger.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("%s completed", self.name, elapsed_seconds=elapsed)
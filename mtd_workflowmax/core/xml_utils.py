@@ -0,0 +1,101 @@
+"""XML parsing helpers for WorkflowMax API responses."""
+
+import threading
+from typing import BinaryIO, Iterator, Tuple
+
+try:
+    from lxml import etree as ET
+    _HAS_LXML = True
+except ImportError:
+    # The stdlib module uses its C accelerator automatically
+    import xml.etree.ElementTree as ET
+    _HAS_LXML = False
+
+from .exceptions import WorkflowMaxError
+
+_local = threading.local()
+
+def _get_parser():
+    """Get this thread's response parser.
+    
+    lxml parsers must not be used by two threads at once, so each thread
+    builds its own on first use and reuses it afterwards.
+    
+    Returns:
+        lxml parser, or None when falling back to the stdlib
+    """
+    if not _HAS_LXML:
+        return None
+    parser = getattr(_local, 'parser', None)
+    if parser is None:
+        parser = _local.parser = ET.XMLParser(
+            huge_tree=False,
+            recover=False,
+            no_network=True
+        )
+    return parser
+
+def parse_xml(content: bytes) -> ET.Element:
+    """Parse an API response body.
+    
+    Args:
+        content: Raw (undecoded) response body
+    
+    Returns:
+        Root element of the document
+    
+    Raises:
+        ET.XMLSyntaxError or ET.ParseError: If the body is not well-formed
+    """
+    return ET.fromstring(content, _get_parser())
+
+def iter_elements(source: BinaryIO, path: Tuple[str, ...]) -> Iterator[ET.Element]:
+    """Stream the elements found at a fixed path below the document root.
+    
+    Each element is cleared once the caller has consumed it (and, with
+    lxml, detached from its parent), so only the element currently being
+    handled is held in memory. The response's root-level Status is checked
+    as soon as it is parsed, as validate_response does for unstreamed
+    responses.
+    
+    Args:
+        source: Binary file-like object with the raw XML response
+        path: Tags leading from the root's children to the wanted element,
+            e.g. ``('Relationships', 'Relationship')``
+    
+    Yields:
+        Matching elements, in document order
+    
+    Raises:
+        WorkflowMaxError: If the response Status is not OK
+        ET.XMLSyntaxError or ET.ParseError: If the body is not well-formed
+    """
+    depth = len(path) + 1
+    stack = []
+    if _HAS_LXML:
+        events = ET.iterparse(
+            source,
+            events=('start', 'end'),
+            remove_blank_text=True,
+            recover=False,
+            no_network=True
+        )
+    else:
+        events = ET.iterparse(source, events=('start', 'end'))
+    
+    for event, elem in events:
+        if event == 'start':
+            stack.append(elem.tag)
+            continue
+        
+        if len(stack) == 2 and elem.tag == 'Status':
+            if elem.text != 'OK':
+                raise WorkflowMaxError(f"API error: {elem.text}")
+        elif len(stack) == depth and tuple(stack[1:]) == path:
+            yield elem
+            elem.clear()
+            # Drop already-processed siblings still referenced by the parent
+            if _HAS_LXML:
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+        stack.pop()
@@ -2,7 +2,6 @@
 
 from typing import Optional, List, Dict, Any, Union
 from enum import Enum
-from datetime import datetime
 from pydantic import BaseModel, Field, validator
 import xml.etree.ElementTree as ET
 import re
@@ -10,7 +9,13 @@ from urllib.parse import urlparse
 
 from ..core.exceptions import ValidationError, XMLParsingError, CustomFieldError
 from ..core.logging import get_logger
-from ..core.utils import validate_string_length, sanitize_xml, get_xml_text
+from ..core.utils import (
+    validate_string_length,
+    sanitize_xml,
+    get_xml_text,
+    is_valid_ymd,
+    compile_date_format
+)
 
 logger = get_logger('workflowmax.models.custom_field')
 
@@ -26,6 +31,23 @@ class CustomFieldType(str, Enum):
     SELECT = "Select"
     LINK = "Link"
 
+# Text-valued definition tags, stored under the tag name
+_DEFINITION_TEXT_TAGS = frozenset({'UUID', 'Name', 'Type', 'Description', 'LinkURL'})
+
+# Boolean definition tags -> field alias
+_DEFINITION_FLAG_ALIASES = {
+    'Mandatory': 'Required',
+    'UseClient': 'UseClient',
+    'UseContact': 'UseContact',
+    'UseSupplier': 'UseSupplier',
+    'UseJob': 'UseJob',
+    'UseLead': 'UseLead',
+    'UseJobTask': 'UseJobTask',
+    'UseJobCost': 'UseJobCost',
+    'UseJobTime': 'UseJobTime',
+    'UseQuote': 'UseQuote',
+}
+
 class CustomFieldDefinition(BaseModel):
     """Custom field definition model."""
     
@@ -138,6 +160,45 @@ class CustomFieldDefinition(BaseModel):
             raise ValidationError("Select type fields must have options")
         return v
     
+    @staticmethod
+    def _fields_from_xml(xml_element: ET.Element) -> Dict[str, Any]:
+        """Read a definition element into a dict keyed by field alias.
+        
+        Walks the element's children once. The result can be inspected
+        (e.g. to remap the type) before being passed to the constructor.
+        
+        Args:
+            xml_element: XML element containing field definition
+            
+        Returns:
+            Dictionary of field values keyed by alias
+            
+        Raises:
+            XMLParsingError: If Name or Type is missing
+        """
+        data = {}
+        for child in xml_element:
+            tag = child.tag
+            if tag in _DEFINITION_TEXT_TAGS:
+                if tag not in data:
+                    data[tag] = child.text
+            elif tag in _DEFINITION_FLAG_ALIASES:
+                alias = _DEFINITION_FLAG_ALIASES[tag]
+                if alias not in data:
+                    data[alias] = (child.text or '').lower() == 'true'
+            elif tag == 'Options' and 'Options' not in data:
+                # Parse options for Select type
+                data['Options'] = [
+                    option.text for option in child.findall('Option')
+                    if option.text
+                ]
+        
+        for tag in ('Name', 'Type'):
+            if tag not in data:
+                raise XMLParsingError(f"Required tag {tag} not found")
+        
+        return data
+    
     @classmethod
     def from_xml(cls, xml_element: ET.Element) -> 'CustomFieldDefinition':
         """Create CustomFieldDefinition from XML element.
@@ -153,33 +214,7 @@ class CustomFieldDefinition(BaseModel):
             ValidationError: If data validation fails
         """
         try:
-            data = {
-                "UUID": get_xml_text(xml_element, 'UUID'),
-                "Name": get_xml_text(xml_element, 'Name', required=True),
-                "Type": get_xml_text(xml_element, 'Type', required=True),
-                "Description": get_xml_text(xml_element, 'Description'),
-                "Required": get_xml_text(xml_element, 'Mandatory', 'false').lower() == 'true',
-                "UseClient": get_xml_text(xml_element, 'UseClient', 'false').lower() == 'true',
-                "UseContact": get_xml_text(xml_element, 'UseContact', 'false').lower() == 'true',
-                "UseSupplier": get_xml_text(xml_element, 'UseSupplier', 'false').lower() == 'true',
-                "UseJob": get_xml_text(xml_element, 'UseJob', 'false').lower() == 'true',
-                "UseLead": get_xml_text(xml_element, 'UseLead', 'false').lower() == 'true',
-                "UseJobTask": get_xml_text(xml_element, 'UseJobTask', 'false').lower() == 'true',
-                "UseJobCost": get_xml_text(xml_element, 'UseJobCost', 'false').lower() == 'true',
-                "UseJobTime": get_xml_text(xml_element, 'UseJobTime', 'false').lower() == 'true',
-                "UseQuote": get_xml_text(xml_element, 'UseQuote', 'false').lower() == 'true',
-                "LinkURL": get_xml_text(xml_element, 'LinkURL')
-            }
-            
-            # Parse options for Select type
-            options_elem = xml_element.find('Options')
-            if options_elem is not None:
-                data['Options'] = [
-                    option.text for option in options_elem.findall('Option')
-                    if option.text
-                ]
-            
-            return cls(**data)
+            return cls(**cls._fields_from_xml(xml_element))
             
         except Exception as e:
             raise XMLParsingError(f"Failed to parse custom field definition: {str(e)}", xml_element)
@@ -276,7 +311,7 @@ class CustomFieldValue(BaseModel):
             return f"<{self.value}>"
         elif self.type == CustomFieldType.DATE:
             try:
-                dt = datetime.strptime(self.value, '%Y-%m-%d')
+                dt = compile_date_format('%Y-%m-%d')(self.value)
                 return dt.strftime('%d %b %Y')
             except ValueError:
                 return self.value
@@ -311,10 +346,8 @@ class CustomFieldValue(BaseModel):
                 float(v)  # Validate decimal format
             elif field_type == CustomFieldType.DATE:
                 # Support both date-only and full datetime formats
-                try:
-                    datetime.strptime(v, '%Y-%m-%d')
-                except ValueError:
-                    datetime.strptime(v, '%Y-%m-%d %H:%M:%S%z')
+                if not is_valid_ymd(v):
+                    compile_date_format('%Y-%m-%d %H:%M:%S%z')(v)
             elif field_type == CustomFieldType.BOOLEAN:
                 if v.lower() not in ('true', 'false'):
                     raise ValueError("Boolean value must be 'true' or 'false'")
@@ -364,7 +397,7 @@ class CustomFieldValue(BaseModel):
                 if date_val:
                     # Convert to standard format if needed
                     try:
-                        dt = datetime.strptime(date_val, '%Y%m%d')
+                        dt = compile_date_format('%Y%m%d')(date_val)
                         date_val = dt.strftime('%Y-%m-%d')
                     except ValueError:
                         pass  # Keep original format if parsing fails
@@ -404,7 +437,7 @@ class CustomFieldValue(BaseModel):
             if self.value:
                 try:
                     # Ensure consistent date format
-                    dt = datetime.strptime(self.value, '%Y-%m-%d')
+                    dt = compile_date_format('%Y-%m-%d')(self.value)
                     xml.append(f"<Date>{dt.strftime('%Y-%m-%d %H:%M:%S+00:00')}</Date>")
                 except ValueError:
                     # If already in datetime format, use as is
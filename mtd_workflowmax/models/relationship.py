@@ -1,89 +1,87 @@
 """Relationship model for WorkflowMax API."""
 
-from typing import Optional
-from datetime import datetime
-from pydantic import BaseModel, Field, validator
-import xml.etree.ElementTree as ET
+from typing import Optional, Iterable
+from dataclasses import dataclass
+
+try:
+    from lxml import etree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
 
 from ..core.exceptions import ValidationError, XMLParsingError
 from ..core.logging import get_logger
-from ..core.utils import validate_string_length, sanitize_xml
+from ..core.utils import validate_string_length, sanitize_xml, is_valid_ymd
 
 logger = get_logger('workflowmax.models.relationship')
 
-class Relationship(BaseModel):
-    """WorkflowMax client relationship model."""
+_VALID_RELATIONSHIP_TYPES = frozenset({
+    'Shareholder', 'Director', 'Trustee', 'Beneficiary', 'Partner',
+    'Settlor', 'Associate', 'Secretary', 'Public Officer', 'Husband',
+    'Wife', 'Spouse', 'Parent Of', 'Child Of', 'Appointer', 'Member',
+    'Auditor', 'Owner'
+})
+
+_INVALID_TYPE_MESSAGE = (
+    f"Invalid relationship type. Must be one of: {', '.join(sorted(_VALID_RELATIONSHIP_TYPES))}"
+)
+
+@dataclass(slots=True)
+class Relationship:
+    """WorkflowMax client relationship model.
+    
+    A plain slotted dataclass rather than a pydantic model: relationships are
+    built in bulk from XML, where per-instance dict storage and field
+    coercion dominated the cost. Validation runs in ``__post_init__``.
+    """
     
-    uuid: Optional[str] = Field(
-        None,
-        alias="UUID",
-        description="Relationship UUID (only for existing relationships)"
-    )
-    client_uuid: str = Field(
-        ...,
-        alias="ClientUUID",
-        description="UUID of the primary client"
-    )
-    related_client_uuid: str = Field(
-        ...,
-        alias="RelatedClientUUID",
-        description="UUID of the related client"
-    )
-    type: str = Field(
-        ...,
-        description="Type of relationship"
-    )
-    start_date: Optional[str] = Field(
-        None,
-        alias="StartDate",
-        description="Start date of relationship (YYYY-MM-DD)"
-    )
-    end_date: Optional[str] = Field(
-        None,
-        alias="EndDate",
-        description="End date of relationship (YYYY-MM-DD)"
-    )
-    number_of_shared: Optional[int] = Field(
-        None,
-        alias="NumberOfShared",
-        description="Number of shared items"
-    )
-    percentage: Optional[float] = Field(
-        None,
-        alias="Percentage",
-        description="Percentage value for relationship"
-    )
+    client_uuid: str                          # UUID of the primary client
+    related_client_uuid: str                  # UUID of the related client
+    type: str                                 # Type of relationship
+    uuid: Optional[str] = None                # Relationship UUID (only for existing relationships)
+    start_date: Optional[str] = None          # Start date of relationship (YYYY-MM-DD)
+    end_date: Optional[str] = None            # End date of relationship (YYYY-MM-DD)
+    number_of_shared: Optional[int] = None    # Number of shared items
+    percentage: Optional[float] = None        # Percentage value for relationship
+    
+    def __post_init__(self):
+        """Validate and normalize field values.
+        
+        Raises:
+            ValidationError: If a required field is missing or a value is invalid
+        """
+        for name in ('client_uuid', 'related_client_uuid', 'type'):
+            if not getattr(self, name):
+                raise ValidationError(f"{name} is required")
+        self.validate_type(self.type)
+        self.validate_date(self.start_date)
+        self.validate_date(self.end_date)
+        
+        if self.number_of_shared is not None:
+            self.number_of_shared = int(self.number_of_shared)
+        if self.percentage is not None:
+            self.percentage = self.validate_percentage(float(self.percentage))
     
     # Validation
-    @validator('type')
-    def validate_type(cls, v):
+    @staticmethod
+    def validate_type(v):
         """Validate relationship type."""
-        valid_types = {
-            'Shareholder', 'Director', 'Trustee', 'Beneficiary', 'Partner',
-            'Settlor', 'Associate', 'Secretary', 'Public Officer', 'Husband',
-            'Wife', 'Spouse', 'Parent Of', 'Child Of', 'Appointer', 'Member',
-            'Auditor', 'Owner'
-        }
-        if v not in valid_types:
-            raise ValueError(f"Invalid relationship type. Must be one of: {', '.join(valid_types)}")
+        if v not in _VALID_RELATIONSHIP_TYPES:
+            raise ValidationError(_INVALID_TYPE_MESSAGE)
         return v
     
-    @validator('start_date', 'end_date')
-    def validate_date(cls, v):
+    @staticmethod
+    def validate_date(v):
         """Validate date format."""
-        if v:
-            try:
-                datetime.strptime(v, '%Y-%m-%d')
-            except ValueError:
-                raise ValueError("Invalid date format. Use YYYY-MM-DD")
+        if v and not is_valid_ymd(v):
+            raise ValidationError("Invalid date format. Use YYYY-MM-DD")
         return v
     
-    @validator('percentage')
-    def validate_percentage(cls, v):
+    @staticmethod
+    def validate_percentage(v):
         """Validate percentage value."""
         if v is not None:
             if v < 0 or v > 100:
-                raise ValueError("Percentage must be between 0 and 100")
+                raise ValidationError("Percentage must be between 0 and 100")
         return v
     
     @classmethod
@@ -101,25 +99,25 @@ class Relationship(BaseModel):
             ValidationError: If data validation fails
         """
         try:
-            data = {
-                "UUID": cls._get_text(xml_element, 'UUID'),
-                "ClientUUID": cls._get_text(xml_element, 'ClientUUID'),
-                "RelatedClientUUID": cls._get_text(xml_element, 'RelatedClientUUID'),
-                "type": cls._get_text(xml_element, 'Type'),
-                "StartDate": cls._get_text(xml_element, 'StartDate'),
-                "EndDate": cls._get_text(xml_element, 'EndDate'),
-                "NumberOfShared": cls._get_text(xml_element, 'NumberOfShared'),
-                "Percentage": cls._get_text(xml_element, 'Percentage')
-            }
+            get_text = cls._get_text
+            number_of_shared = get_text(xml_element, 'NumberOfShared')
+            percentage = get_text(xml_element, 'Percentage')
             
-            # Convert numeric fields
-            if data["NumberOfShared"]:
-                data["NumberOfShared"] = int(data["NumberOfShared"])
-            if data["Percentage"]:
-                data["Percentage"] = float(data["Percentage"])
-            
-            return cls(**data)
+            # Missing required elements come through as '' and are
+            # rejected by __post_init__
+            return cls(
+                client_uuid=get_text(xml_element, 'ClientUUID') or '',
+                related_client_uuid=get_text(xml_element, 'RelatedClientUUID') or '',
+                type=get_text(xml_element, 'Type') or '',
+                uuid=get_text(xml_element, 'UUID'),
+                start_date=get_text(xml_element, 'StartDate'),
+                end_date=get_text(xml_element, 'EndDate'),
+                number_of_shared=int(number_of_shared) if number_of_shared else None,
+                percentage=float(percentage) if percentage else None
+            )
             
+        except ValidationError:
+            raise
         except Exception as e:
             raise XMLParsingError(f"Failed to parse relationship XML: {str(e)}")
     
@@ -129,26 +127,46 @@ class Relationship(BaseModel):
         Returns:
             XML string representation
         """
-        xml = ['<Relationship>']
+        sanitize = sanitize_xml
         
-        # Add fields
-        if self.uuid:
-            xml.append(f"<UUID>{sanitize_xml(self.uuid)}</UUID>")
-        xml.append(f"<ClientUUID>{sanitize_xml(self.client_uuid)}</ClientUUID>")
-        xml.append(f"<RelatedClientUUID>{sanitize_xml(self.related_client_uuid)}</RelatedClientUUID>")
-        xml.append(f"<Type>{sanitize_xml(self.type)}</Type>")
+        # Optional elements, each either empty or a complete line
+        uuid = f"<UUID>{sanitize(self.uuid)}</UUID>\n" if self.uuid else ''
+        start_date = f"<StartDate>{sanitize(self.start_date)}</StartDate>\n" if self.start_date else ''
+        end_date = f"<EndDate>{sanitize(self.end_date)}</EndDate>\n" if self.end_date else ''
+        number_of_shared = (
+            f"<NumberOfShared>{self.number_of_shared}</NumberOfShared>\n"
+            if self.number_of_shared is not None else ''
+        )
+        percentage = f"<Percentage>{self.percentage}</Percentage>\n" if self.percentage is not None else ''
         
-        if self.start_date:
-            xml.append(f"<StartDate>{sanitize_xml(self.start_date)}</StartDate>")
-        if self.end_date:
-            xml.append(f"<EndDate>{sanitize_xml(self.end_date)}</EndDate>")
-        if self.number_of_shared is not None:
-            xml.append(f"<NumberOfShared>{self.number_of_shared}</NumberOfShared>")
-        if self.percentage is not None:
-            xml.append(f"<Percentage>{self.percentage}</Percentage>")
+        return (
+            f"<Relationship>\n{uuid}"
+            f"<ClientUUID>{sanitize(self.client_uuid)}</ClientUUID>\n"
+            f"<RelatedClientUUID>{sanitize(self.related_client_uuid)}</RelatedClientUUID>\n"
+            f"<Type>{sanitize(self.type)}</Type>\n"
+            f"{start_date}{end_date}{number_of_shared}{percentage}"
+            f"</Relationship>"
+        )
+    
+    def to_xml_bytes(self) -> bytes:
+        """Convert relationship to a UTF-8 encoded XML request body.
         
-        xml.append('</Relationship>')
-        return '\n'.join(xml)
+        Returns:
+            XML bytes, ready to send without further encoding
+        """
+        return self.to_xml().encode('utf-8')
+    
+    @staticmethod
+    def many_to_xml(relationships: Iterable['Relationship']) -> str:
+        """Serialize several relationships into one XML string.
+        
+        Args:
+            relationships: Relationships to serialize
+            
+        Returns:
+            Concatenated XML for all relationships
+        """
+        return ''.join(r.to_xml() for r in relationships)
     
     @staticmethod
     def _get_text(element: ET.Element, tag: str, default: Optional[str] = None) -> Optional[str]:
@@ -162,5 +180,5 @@ class Relationship(BaseModel):
         Returns:
             Text content or default value
         """
-        child = element.find(tag)
-        return child.text if child is not None else default
+        # findtext returns '' for an empty element; treat that as missing
+        return element.findtext(tag) or default
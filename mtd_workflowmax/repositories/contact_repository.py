@@ -1,8 +1,8 @@
 """Repository for managing WorkflowMax contacts."""
 
-from typing import Optional, List, Dict, Any, Union, Tuple
+from typing import Optional, List, Dict, Any, Union, Set, Tuple, Iterator
 import xml.etree.ElementTree as ET
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 from ..core.exceptions import (
     ResourceNotFoundError,
@@ -13,7 +13,8 @@ from ..core.exceptions import (
     CustomFieldError
 )
 from ..core.logging import get_logger, with_logging
-from ..core.utils import Timer, get_xml_text
+from ..core.utils import Timer, get_xml_text, compile_date_format, fan_out_pool
+from ..core.xml_utils import parse_xml
 from ..models import Contact, CustomFieldValue, CustomFieldType, Position
 from ..config import config
 from .custom_field_repository import CustomFieldRepository
@@ -73,7 +74,6 @@ class ContactRepository:
                 logger.error(f"Failed to get contact: {str(e)}", exc_info=True)
                 raise WorkflowMaxError(f"Failed to get contact: {str(e)}")
     
-    @with_logging
     def get_custom_fields(self, uuid: str) -> List[CustomFieldValue]:
         """Get custom fields for contact.
         
@@ -83,6 +83,38 @@ class ContactRepository:
         Returns:
             List of custom field values
             
+        Raises:
+            ContactNotFoundError: If contact not found
+            WorkflowMaxError: If API request fails
+        """
+        return list(self.get_custom_field_map(uuid).values())
+    
+    def get_custom_field(self, uuid: str, field_name: str) -> Optional[CustomFieldValue]:
+        """Get a single custom field for contact.
+        
+        Args:
+            uuid: Contact UUID
+            field_name: Name of the field
+            
+        Returns:
+            Custom field value, or None if the field is not a contact field
+            
+        Raises:
+            ContactNotFoundError: If contact not found
+            WorkflowMaxError: If API request fails
+        """
+        return self.get_custom_field_map(uuid).get(field_name)
+    
+    @with_logging
+    def get_custom_field_map(self, uuid: str) -> Dict[str, CustomFieldValue]:
+        """Get custom fields for contact keyed by field name.
+        
+        Args:
+            uuid: Contact UUID
+            
+        Returns:
+            Dictionary mapping field names to values, in definition order
+            
         Raises:
             ContactNotFoundError: If contact not found
             WorkflowMaxError: If API request fails
@@ -106,14 +138,11 @@ class ContactRepository:
                 definitions = {}
                 if self.custom_fields:
                     # Only include fields that can be used on contacts
-                    definitions = {
-                        d.name: d for d in self.custom_fields.get_definitions()
-                        if d.use_contact
-                    }
+                    definitions = self.custom_fields.get_definitions_map('use_contact')
                     logger.debug(f"Found {len(definitions)} contact field definitions")
                 
-                # Create list of all fields, including empty ones
-                custom_fields = []
+                # Create all fields, including empty ones
+                custom_fields = {}
                 for name, definition in definitions.items():
                     field = CustomFieldValue(
                         uuid=definition.uuid,
@@ -122,7 +151,7 @@ class ContactRepository:
                         value=None,  # Default to None, will be updated if value found
                         link_url=definition.link_url  # Pass link_url template from definition
                     )
-                    custom_fields.append(field)
+                    custom_fields[name] = field
                     logger.debug(f"Added empty field: {name} ({definition.type})")
                 
                 # Update fields with actual values from response
@@ -136,33 +165,34 @@ class ContactRepository:
                                 continue
                             
                             # Find matching field and update its value
-                            for field in custom_fields:
-                                if field.name == name:
-                                    # Get value based on field type
-                                    if field.type == CustomFieldType.BOOLEAN:
-                                        value = get_xml_text(field_elem, 'Boolean')
-                                        field.value = value.lower() if value else None
-                                    elif field.type == CustomFieldType.DATE:
-                                        value = get_xml_text(field_elem, 'Date')
-                                        if value:
-                                            try:
-                                                dt = datetime.strptime(value, '%Y%m%d')
-                                                field.value = dt.strftime('%Y-%m-%d')
-                                            except ValueError:
-                                                field.value = value
-                                    elif field.type == CustomFieldType.NUMBER:
-                                        value = get_xml_text(field_elem, 'Number')
-                                        field.value = str(int(float(value))) if value else None
-                                    elif field.type == CustomFieldType.DECIMAL:
-                                        value = get_xml_text(field_elem, 'Decimal')
-                                        field.value = str(float(value)) if value else None
-                                    elif field.type == CustomFieldType.LINK:
-                                        field.value = get_xml_text(field_elem, 'LinkURL')
-                                    else:
-                                        field.value = get_xml_text(field_elem, 'Value')
-                                    
-                                    logger.debug(f"Updated field {field.name} = {field.value} ({field.type})")
-                                    break
+                            field = custom_fields.get(name)
+                            if field is None:
+                                continue
+                            
+                            # Get value based on field type
+                            if field.type == CustomFieldType.BOOLEAN:
+                                value = get_xml_text(field_elem, 'Boolean')
+                                field.value = value.lower() if value else None
+                            elif field.type == CustomFieldType.DATE:
+                                value = get_xml_text(field_elem, 'Date')
+                                if value:
+                                    try:
+                                        dt = compile_date_format('%Y%m%d')(value)
+                                        field.value = dt.strftime('%Y-%m-%d')
+                                    except ValueError:
+                                        field.value = value
+                            elif field.type == CustomFieldType.NUMBER:
+                                value = get_xml_text(field_elem, 'Number')
+                                field.value = str(int(float(value))) if value else None
+                            elif field.type == CustomFieldType.DECIMAL:
+                                value = get_xml_text(field_elem, 'Decimal')
+                                field.value = str(float(value)) if value else None
+                            elif field.type == CustomFieldType.LINK:
+                                field.value = get_xml_text(field_elem, 'LinkURL')
+                            else:
+                                field.value = get_xml_text(field_elem, 'Value')
+                            
+                            logger.debug(f"Updated field {field.name} = {field.value} ({field.type})")
                         except Exception as e:
                             logger.warning(f"Failed to parse custom field: {str(e)}")
                             continue
@@ -210,10 +240,7 @@ class ContactRepository:
                 # Get field definitions
                 definitions = {}
                 if self.custom_fields:
-                    definitions = {
-                        d.name: d for d in self.custom_fields.get_definitions()
-                        if d.use_contact
-                    }
+                    definitions = self.custom_fields.get_definitions_map('use_contact')
                 
                 # Create XML payload
                 root = ET.Element('CustomFields')
@@ -276,6 +303,209 @@ class ContactRepository:
                 logger.error(f"Failed to update custom fields: {str(e)}", exc_info=True)
                 raise WorkflowMaxError(f"Failed to update custom fields: {str(e)}")
     
+    @with_logging
+    def search(
+        self,
+        query: Optional[str] = None,
+        page: int = 1,
+        page_size: int = 100
+    ) -> List[Contact]:
+        """Search for contacts.
+        
+        WorkflowMax lists contacts under their clients, so this pages
+        through clients and returns the contacts of each page's clients.
+        With a query, clients are searched instead, which is not paged.
+        The returned contacts carry no custom fields.
+        
+        Args:
+            query: Optional client search query
+            page: Page of clients (1-based); ignored with a query
+            page_size: Clients per page; ignored with a query
+            
+        Returns:
+            Contacts of the matching clients, each listed once
+            
+        Raises:
+            ValidationError: If invalid parameters
+            WorkflowMaxError: If API request fails
+        """
+        return self._fetch_contacts(query, page, page_size)[0]
+    
+    def _fetch_contacts(
+        self,
+        query: Optional[str],
+        page: int,
+        page_size: int
+    ) -> Tuple[List[Contact], bool]:
+        """Fetch the contacts of a page of clients.
+        
+        Returns:
+            Tuple of (contacts, whether a further page of clients exists)
+        """
+        with Timer("Search contacts"):
+            if page < 1:
+                raise ValidationError("Page must be >= 1")
+            if page_size < 1:
+                raise ValidationError("Page size must be >= 1")
+            
+            if query:
+                response = self.api_client.get(
+                    'client.api/search',
+                    params={'query': query, 'detailed': 'true'}
+                )
+            else:
+                response = self.api_client.get('client.api/list', params={
+                    'detailed': 'true',
+                    'page': str(page),
+                    'pagesize': str(page_size)
+                })
+            
+            try:
+                xml_root = parse_xml(response.content)
+                
+                status = get_xml_text(xml_root, 'Status')
+                if status != 'OK':
+                    raise WorkflowMaxError(f"Failed to search contacts: {status}")
+                
+                # A contact with positions at several clients is listed
+                # under each of them; keep one entry holding every position
+                contacts: Dict[str, Contact] = {}
+                client_elems = xml_root.findall('Clients/Client')
+                for client_elem in client_elems:
+                    client_name = get_xml_text(client_elem, 'Name')
+                    client_uuid = get_xml_text(client_elem, 'UUID')
+                    for contact_elem in client_elem.findall('Contacts/Contact'):
+                        contact = Contact.from_xml(contact_elem)
+                        pos_data: Dict[str, Any] = {
+                            'Position': get_xml_text(contact_elem, 'Position'),
+                            'Name': client_name,
+                            'ClientUUID': client_uuid,
+                            'IsPrimary': contact.is_primary == 'true'
+                        }
+                        position = Position(**pos_data)
+                        existing = contacts.get(contact.uuid)
+                        if existing is None:
+                            contact.positions.append(position)
+                            contacts[contact.uuid] = contact
+                        else:
+                            existing.positions.append(position)
+                
+                has_more = not query and len(client_elems) >= page_size
+                return list(contacts.values()), has_more
+                
+            except WorkflowMaxError:
+                raise
+            except Exception as e:
+                logger.error(f"Failed to parse search response: {str(e)}")
+                raise XMLParsingError(f"Failed to parse search response: {str(e)}")
+    
+    def iter_pages(
+        self,
+        page_size: int,
+        include_custom_fields: bool = False
+    ) -> Iterator[List[Contact]]:
+        """Page through all contacts, fetching one page ahead.
+        
+        Pages are requested lazily, so only the page being worked on and
+        the one prefetched behind it are held in memory. The next page is
+        requested in the background while the caller works on the current
+        one. Paging stops at the first short page of clients, avoiding a
+        final round trip for an empty one.
+        
+        Args:
+            page_size: Number of clients per page; a page holds all of
+                their contacts
+            include_custom_fields: Also load each contact's custom fields
+                (one request per contact, made concurrently)
+            
+        Yields:
+            Non-empty lists of contacts, each contact yielded once
+        """
+        seen: Set[str] = set()
+        
+        def fetch(page: int) -> Tuple[List[Contact], bool]:
+            contacts, has_more = self._fetch_contacts(None, page, page_size)
+            # Contacts of clients on an earlier page were already yielded
+            contacts = [c for c in contacts if c.uuid not in seen]
+            seen.update(c.uuid for c in contacts)
+            if include_custom_fields and contacts:
+                contacts = self._load_custom_fields(contacts)
+            return contacts, has_more
+        
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix='contact-pages') as prefetch:
+            page = 1
+            future = prefetch.submit(fetch, page)
+            while True:
+                contacts, has_more = future.result()
+                if has_more:
+                    page += 1
+                    future = prefetch.submit(fetch, page)
+                if contacts:
+                    yield contacts
+                if not has_more:
+                    return
+    
+    def _load_custom_fields(self, contacts: List[Contact]) -> List[Contact]:
+        """Attach custom fields to contacts, fetching them concurrently.
+        
+        Returns:
+            The contacts whose custom fields were loaded; failures are
+            logged and left out rather than returned without their fields
+        """
+        def load(contact: Contact) -> bool:
+            try:
+                contact.custom_fields = list(self.get_custom_field_map(contact.uuid).values())
+                return True
+            except WorkflowMaxError as e:
+                logger.warning(
+                    f"Failed to get custom fields for contact {contact.uuid}",
+                    error=str(e)
+                )
+                return False
+        
+        with fan_out_pool(
+            len(contacts),
+            config.api.rate_limit.concurrent_limit,
+            name='contact-custom-fields'
+        ) as pool:
+            return [
+                contact for contact, loaded in zip(contacts, pool.map(load, contacts))
+                if loaded
+            ]
+    
+    @with_logging
+    def update_custom_fields_bulk(self, updates: Dict[str, Dict[str, str]]) -> Dict[str, bool]:
+        """Update custom fields for several contacts.
+        
+        Custom fields are written per contact, so the requests are issued
+        concurrently rather than one after another.
+        
+        Args:
+            updates: Dictionary mapping contact UUIDs to the field updates
+                for that contact (field name to value)
+            
+        Returns:
+            Dictionary mapping contact UUIDs to whether their update
+            succeeded. Failed updates are logged, not raised.
+        """
+        with Timer("Update contact custom fields in bulk"):
+            def update(uuid: str) -> bool:
+                try:
+                    return self.update_custom_fields(uuid, updates[uuid])
+                except WorkflowMaxError as e:
+                    logger.warning(
+                        f"Failed to update custom fields for contact {uuid}",
+                        error=str(e)
+                    )
+                    return False
+            
+            with fan_out_pool(
+                len(updates),
+                config.api.rate_limit.concurrent_limit,
+                name='contact-custom-fields'
+            ) as pool:
+                return dict(zip(updates, pool.map(update, updates)))
+    
     @with_logging
     def exists(self, uuid: str) -> bool:
         """Check if contact exists.
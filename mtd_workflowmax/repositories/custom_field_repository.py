@@ -1,9 +1,11 @@
 """Repository for managing WorkflowMax custom fields."""
 
 from typing import Optional, List, Dict, Any
-import xml.etree.ElementTree as ET
+import logging
+import sys
+import time
+from collections import defaultdict
 import re
-from datetime import datetime
 
 from ..core.exceptions import (
     ValidationError,
@@ -12,11 +14,24 @@ from ..core.exceptions import (
     CustomFieldError
 )
 from ..core.logging import get_logger, with_logging
-from ..core.utils import Timer, get_cache_age
+from ..core.utils import Timer, is_valid_ymd, compile_date_format
+from ..core.xml_utils import iter_elements
 from ..models import CustomFieldDefinition, CustomFieldType
 
 logger = get_logger('workflowmax.repositories.custom_field')
 
+# Matches XML/HTML tags to strip from submitted values
+_TAG_RE = re.compile(r'<[^>]+>')
+
+# Link values that already carry a scheme (or a www. prefix)
+_URL_RE = re.compile(r'(?:https?://|www\.)')
+
+# Accepted (lowercased) boolean values
+_BOOL_VALUES = frozenset({'true', 'false'})
+
+# Definition child tags looked up for every streamed definition
+_TAG_NAME, _TAG_TYPE = map(sys.intern, ('Name', 'Type'))
+
 class CustomFieldRepository:
     """Repository for custom field operations."""
     
@@ -32,6 +47,15 @@ class CustomFieldRepository:
         'DropDown': 'Select'             # Map dropdowns to select type
     }
     
+    # Definitions cache lifetime in seconds
+    CACHE_TTL = 300
+    
+    # API type string -> CustomFieldType, covering both native and mapped types
+    _TYPE_LOOKUP = {
+        **{t.value: t for t in CustomFieldType},
+        **{api_type: CustomFieldType(mapped) for api_type, mapped in TYPE_MAPPING.items()}
+    }
+    
     def __init__(self, api_client):
         """Initialize repository.
         
@@ -41,6 +65,9 @@ class CustomFieldRepository:
         self.api_client = api_client
         self._definitions_cache = None
         self._cache_timestamp = None
+        self._cache_expiry = 0.0  # time.monotonic() deadline for the cache
+        self._definitions_maps = {}  # usage flag -> {name: definition}
+        self._definitions_maps_source = None  # definitions list the maps were built from
         logger.debug("Initialized CustomFieldRepository")
     
     @with_logging
@@ -57,79 +84,99 @@ class CustomFieldRepository:
             WorkflowMaxError: If API request fails
         """
         with Timer("Get custom field definitions"):
+            # Evaluate once; debug messages below are only built when enabled
+            debug = logger.logger.isEnabledFor(logging.DEBUG)
+            
             # Check cache first
             if not force_refresh and self._is_cache_valid():
-                logger.debug("Using cached custom field definitions")
-                for definition in self._definitions_cache:
-                    logger.debug(f"Cached definition: name={definition.name} type={definition.type}")
+                if debug:
+                    logger.debug("Using cached custom field definitions")
+                    for definition in self._definitions_cache:
+                        logger.debug(f"Cached definition: name={definition.name} type={definition.type}")
                 return self._definitions_cache
             
             # Cache is empty or expired, fetch from API
-            logger.debug(f"Fetching custom field definitions (force_refresh={force_refresh})")
+            if debug:
+                logger.debug(f"Fetching custom field definitions (force_refresh={force_refresh})")
             
             try:
-                response = self.api_client.get('customfield.api/definition')
-                logger.debug(f"Raw API response: {response.text}")
-                
-                xml_root = ET.fromstring(response.text.encode('utf-8'))
-                definitions = []
-                
-                definitions_elem = xml_root.find('CustomFieldDefinitions')
-                if definitions_elem is not None:
-                    logger.debug(f"Found {len(definitions_elem)} custom field definitions")
-                    for def_elem in definitions_elem.findall('CustomFieldDefinition'):
+                # Stream the body so definitions are parsed as they arrive
+                response = self.api_client.get('customfield.api/definition', stream=True)
+                try:
+                    response.raw.decode_content = True
+                    if debug:
+                        logger.debug(f"Streaming API response: status={response.status_code}")
+                    
+                    definitions = []
+                    
+                    for def_elem in iter_elements(
+                        response.raw,
+                        ('CustomFieldDefinitions', 'CustomFieldDefinition')
+                    ):
                         try:
-                            # Get field name and type
-                            name = def_elem.find('Name').text
-                            field_type = def_elem.find('Type').text
-                            logger.debug(f"Processing field: name={name} original_type={field_type}")
+                            # Read the element once; name and type come from the same dict
+                            name = None
+                            raw = CustomFieldDefinition._fields_from_xml(def_elem)
+                            name = raw[_TAG_NAME]
+                            field_type = raw[_TAG_TYPE]
+                            if debug:
+                                logger.debug(f"Processing field: name={name} original_type={field_type}")
                             
-                            # Map field type if needed
-                            if field_type in self.TYPE_MAPPING:
-                                mapped_type = self.TYPE_MAPPING[field_type]
-                                logger.debug(f"Mapping field type {field_type} -> {mapped_type} for field {name}")
-                                # Create a new Type element with mapped value
-                                type_elem = ET.Element('Type')
-                                type_elem.text = mapped_type
-                                # Replace original Type element
-                                old_type = def_elem.find('Type')
-                                def_elem.remove(old_type)
-                                def_elem.append(type_elem)
-                            else:
+                            # Resolve (and map if needed) the field type
+                            resolved_type = self._TYPE_LOOKUP.get(field_type)
+                            if resolved_type is None:
+                                logger.warning(
+                                    "Skipping field definition with unknown type",
+                                    name=name,
+                                    type=field_type
+                                )
+                                continue
+                            
+                            if resolved_type.value != field_type:
+                                if debug:
+                                    logger.debug(f"Mapping field type {field_type} -> {resolved_type.value} for field {name}")
+                            elif debug:
                                 logger.debug(f"No type mapping needed for {field_type}")
+                            raw[_TAG_TYPE] = resolved_type
                             
-                            # Parse field definition
-                            definition = CustomFieldDefinition.from_xml(def_elem)
-                            logger.debug(f"Successfully parsed field definition: name={definition.name} type={definition.type}")
+                            # Build field definition
+                            definition = CustomFieldDefinition(**raw)
+                            if debug:
+                                logger.debug(f"Successfully parsed field definition: name={definition.name} type={definition.type}")
                             
                             # Log usage flags
-                            usage = []
-                            if definition.use_client:
-                                usage.append('client')
-                            if definition.use_contact:
-                                usage.append('contact')
-                            if definition.use_supplier:
-                                usage.append('supplier')
-                            if definition.use_job:
-                                usage.append('job')
-                            if definition.use_lead:
-                                usage.append('lead')
-                            logger.debug(f"Field {definition.name} usage: {', '.join(usage)}")
+                            if debug:
+                                usage = []
+                                if definition.use_client:
+                                    usage.append('client')
+                                if definition.use_contact:
+                                    usage.append('contact')
+                                if definition.use_supplier:
+                                    usage.append('supplier')
+                                if definition.use_job:
+                                    usage.append('job')
+                                if definition.use_lead:
+                                    usage.append('lead')
+                                logger.debug(f"Field {definition.name} usage: {', '.join(usage)}")
                             
                             definitions.append(definition)
-                            
+                        
                         except Exception as e:
                             logger.warning(
                                 f"Failed to parse field definition",
-                                name=name if 'name' in locals() else 'unknown',
+                                name=name or 'unknown',
                                 error=str(e)
                             )
                             continue
+                finally:
+                    response.close()
                 
                 # Update cache
                 self._definitions_cache = definitions
-                self._cache_timestamp = datetime.now().timestamp()
-                logger.debug(f"Updated definitions cache with {len(definitions)} fields")
+                self._cache_timestamp = time.time()
+                self._cache_expiry = time.monotonic() + self.CACHE_TTL
+                if debug:
+                    logger.debug(f"Updated definitions cache with {len(definitions)} fields")
                 
                 return definitions
                 
@@ -137,18 +184,66 @@ class CustomFieldRepository:
                 logger.error(f"Failed to get custom field definitions: {str(e)}")
                 raise WorkflowMaxError(f"Failed to get custom field definitions: {str(e)}")
     
-    def _is_cache_valid(self) -> bool:
-        """Check if cache is valid."""
-        if self._definitions_cache is None:
-            logger.debug("Cache is empty or timestamp missing")
-            return False
+    def get_definitions_map(self, usage: Optional[str] = None) -> Dict[str, CustomFieldDefinition]:
+        """Get definitions keyed by name, optionally limited to one usage flag.
+        
+        Maps are memoized per usage flag and rebuilt whenever the underlying
+        definitions are refetched, so they share the definitions cache TTL.
+        The returned dict is shared and must not be modified.
+        
+        Args:
+            usage: Usage flag attribute to filter on (e.g. 'use_job'), or
+                None for all definitions
+            
+        Returns:
+            Dictionary mapping field names to definitions
             
-        # Get cache age in seconds
-        age = get_cache_age(self._cache_timestamp)
-        logger.debug(f"Cache age: {age:.2f}s valid: {age < 300}")
+        Raises:
+            WorkflowMaxError: If API request fails
+        """
+        definitions = self.get_definitions()
+        if self._definitions_maps_source is not definitions:
+            self._definitions_maps = {}
+            self._definitions_maps_source = definitions
         
-        # Cache is valid for 5 minutes
-        return age < 300
+        definitions_map = self._definitions_maps.get(usage)
+        if definitions_map is None:
+            definitions_map = self._definitions_maps[usage] = {
+                d.name: d for d in definitions
+                if usage is None or getattr(d, usage)
+            }
+        return definitions_map
+    
+    def get_definition(self, field_name: str) -> Optional[CustomFieldDefinition]:
+        """Get definition for a specific field.
+        
+        Args:
+            field_name: Name of the field
+            
+        Returns:
+            Field definition if found
+            
+        Raises:
+            WorkflowMaxError: If API request fails
+        """
+        return self.get_definitions_map().get(field_name)
+    
+    def clear_cache(self) -> None:
+        """Drop cached definitions so the next lookup refetches them."""
+        self._definitions_cache = None
+        self._cache_expiry = 0.0
+        self._definitions_maps = {}
+        self._definitions_maps_source = None
+    
+    def _is_cache_valid(self) -> bool:
+        """Check if cache is valid."""
+        valid = (
+            self._definitions_cache is not None
+            and time.monotonic() < self._cache_expiry
+        )
+        if logger.logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Definitions cache valid: {valid}")
+        return valid
     
     @with_logging
     def validate_field_value(
@@ -175,7 +270,8 @@ class CustomFieldRepository:
             logger.debug(f"Validating against definition: type={definition.type} required={definition.required}")
             
             # Remove any XML tags
-            field_value = re.sub(r'<[^>]+>', '', field_value)
+            if '<' in field_value:
+                field_value = _TAG_RE.sub('', field_value)
             
             # Check required fields
             if definition.required and not field_value:
@@ -188,7 +284,7 @@ class CustomFieldRepository:
             # Validate based on type
             if definition.type == CustomFieldType.BOOLEAN:
                 logger.debug(f"Validating boolean value: {field_value}")
-                if field_value.lower() not in ('true', 'false'):
+                if field_value.lower() not in _BOOL_VALUES:
                     raise ValidationError("Boolean value must be 'true' or 'false'")
                     
             elif definition.type == CustomFieldType.NUMBER:
@@ -207,19 +303,17 @@ class CustomFieldRepository:
                     
             elif definition.type == CustomFieldType.DATE:
                 logger.debug(f"Validating date value: {field_value}")
-                try:
-                    # Support both date-only and full datetime formats
+                # Support both date-only and full datetime formats
+                if not is_valid_ymd(field_value):
                     try:
-                        datetime.strptime(field_value, '%Y-%m-%d')
+                        compile_date_format('%Y-%m-%d %H:%M:%S%z')(field_value)
                     except ValueError:
-                        datetime.strptime(field_value, '%Y-%m-%d %H:%M:%S%z')
-                except ValueError:
-                    raise ValidationError("Invalid date format (use YYYY-MM-DD)")
+                        raise ValidationError("Invalid date format (use YYYY-MM-DD)")
                     
             elif definition.type == CustomFieldType.LINK:
                 logger.debug(f"Validating link value: {field_value}")
                 # Add https:// prefix if not present
-                if not field_value.startswith(('http://', 'https://', 'www.')):
+                if not _URL_RE.match(field_value):
                     field_value = 'https://' + field_value
                 
             logger.debug(f"Field {field_name} validation successful")
@@ -232,45 +326,119 @@ class CustomFieldRepository:
             raise ValidationError(f"Invalid value for field {field_name}: {str(e)}")
     
     @with_logging
-    def validate_fields(self, fields: Dict[str, str]) -> List[str]:
+    def validate_fields(
+        self,
+        fields: Dict[str, str],
+        definitions: Optional[Dict[str, CustomFieldDefinition]] = None
+    ) -> List[str]:
         """Validate multiple field values.
         
+        Fields are grouped by definition type and each group is checked by a
+        type-specific batch validator, rather than dispatching on type once
+        per field.
+        
         Args:
             fields: Dictionary mapping field names to values
+            definitions: Optional prefetched definitions keyed by name, for
+                callers validating many field sets in a row
             
         Returns:
-            List of validation error messages (empty if all valid)
+            List of validation error messages (empty if all valid), in the
+            order the fields were given
         """
         errors = []
         
         # Get field definitions
-        definitions = {d.name: d for d in self.get_definitions()}
+        if definitions is None:
+            definitions = self.get_definitions_map()
         logger.debug(f"Loaded {len(definitions)} field definitions for validation")
         
-        # Validate each field
-        for field_name, field_value in fields.items():
-            try:
-                if field_name not in definitions:
-                    logger.warning(f"Unknown field: {field_name}")
-                    errors.append(f"Unknown field: {field_name}")
-                    continue
-                    
-                definition = definitions[field_name]
-                logger.debug(f"Validating field {field_name} with type {definition.type}")
-                
-                self.validate_field_value(
-                    field_name,
-                    field_value,
-                    definition
-                )
-                
-            except ValidationError as e:
-                logger.warning(f"Validation failed for field {field_name}: {str(e)}")
-                errors.append(f"{field_name}: {str(e)}")
+        # Partition fields by type, handling unknown/empty fields up front
+        buckets = defaultdict(list)
+        for index, (field_name, field_value) in enumerate(fields.items()):
+            definition = definitions.get(field_name)
+            if definition is None:
+                logger.warning(f"Unknown field: {field_name}")
+                errors.append((index, f"Unknown field: {field_name}"))
+                continue
+            
+            if field_value and '<' in field_value:
+                field_value = _TAG_RE.sub('', field_value)
+            
+            if not field_value:
+                if definition.required:
+                    errors.append((index, f"{field_name}: Field {field_name} is required"))
+                continue
+            
+            buckets[definition.type].append((index, field_name, field_value))
         
-        if errors:
-            logger.warning(f"Found {len(errors)} validation errors")
+        # Validate each type bucket in one pass
+        for field_type, items in buckets.items():
+            validator = self._BATCH_VALIDATORS.get(field_type)
+            if validator is not None:
+                errors.extend(validator(items))
+        
+        errors.sort(key=lambda error: error[0])
+        messages = [message for _, message in errors]
+        
+        if messages:
+            for message in messages:
+                logger.warning(f"Validation failed: {message}")
+            logger.warning(f"Found {len(messages)} validation errors")
         else:
             logger.debug("All fields validated successfully")
         
+        return messages
+    
+    @staticmethod
+    def _validate_bool_batch(items: List[tuple]) -> List[tuple]:
+        """Validate a batch of boolean field values."""
+        return [
+            (index, f"{name}: Boolean value must be 'true' or 'false'")
+            for index, name, value in items
+            if value.lower() not in _BOOL_VALUES
+        ]
+    
+    @staticmethod
+    def _validate_number_batch(items: List[tuple]) -> List[tuple]:
+        """Validate a batch of whole number field values."""
+        errors = []
+        for index, name, value in items:
+            try:
+                int(float(value))  # Allow float input but ensure it's whole number
+            except (ValueError, OverflowError):
+                errors.append((index, f"{name}: Value must be a whole number"))
+        return errors
+    
+    @staticmethod
+    def _validate_decimal_batch(items: List[tuple]) -> List[tuple]:
+        """Validate a batch of decimal field values."""
+        errors = []
+        for index, name, value in items:
+            try:
+                float(value)
+            except ValueError:
+                errors.append((index, f"{name}: Value must be a decimal number"))
+        return errors
+    
+    @staticmethod
+    def _validate_date_batch(items: List[tuple]) -> List[tuple]:
+        """Validate a batch of date field values."""
+        errors = []
+        parse_datetime = compile_date_format('%Y-%m-%d %H:%M:%S%z')
+        for index, name, value in items:
+            if is_valid_ymd(value):
+                continue
+            try:
+                parse_datetime(value)
+            except ValueError:
+                errors.append((index, f"{name}: Invalid date format (use YYYY-MM-DD)"))
         return errors
+    
+    # Batch validator per field type; types without an entry accept any value
+    _BATCH_VALIDATORS = {
+        CustomFieldType.BOOLEAN: _validate_bool_batch,
+        CustomFieldType.NUMBER: _validate_number_batch,
+        CustomFieldType.DECIMAL: _validate_decimal_batch,
+        CustomFieldType.DATE: _validate_date_batch,
+    }
@@ -11,7 +11,7 @@ from ..core.exceptions import (
     WorkflowMaxError
 )
 from ..core.logging import get_logger, with_logging
-from ..core.utils import Timer
+from ..core.utils import Timer, fan_out_pool
 from ..models import Job, CustomFieldValue, CustomFieldType
 from ..config import config
 from .custom_field_repository import CustomFieldRepository
@@ -125,6 +125,42 @@ class JobRepository:
                 logger.error(f"Failed to parse custom fields response: {str(e)}")
                 raise XMLParsingError(f"Failed to parse custom fields response: {str(e)}")
     
+    @with_logging
+    def get_custom_fields_bulk(self, uuids: List[str]) -> Dict[str, List[CustomFieldValue]]:
+        """Get custom fields for several jobs.
+        
+        Custom fields are fetched per job, so the requests are issued
+        concurrently rather than one after another.
+        
+        Args:
+            uuids: Job UUIDs
+            
+        Returns:
+            Dictionary mapping job UUIDs to custom field values. Jobs whose
+            fields could not be fetched are logged and left out.
+        """
+        with Timer("Get job custom fields in bulk"):
+            def fetch(uuid: str) -> Optional[List[CustomFieldValue]]:
+                try:
+                    return self.get_custom_fields(uuid)
+                except WorkflowMaxError as e:
+                    logger.warning(
+                        f"Failed to get custom fields for job {uuid}",
+                        error=str(e)
+                    )
+                    return None
+            
+            with fan_out_pool(
+                len(uuids),
+                config.api.rate_limit.concurrent_limit,
+                name='job-custom-fields'
+            ) as pool:
+                return {
+                    uuid: custom_fields
+                    for uuid, custom_fields in zip(uuids, pool.map(fetch, uuids))
+                    if custom_fields is not None
+                }
+    
     @with_logging
     def update_custom_field(
         self,
@@ -1,7 +1,10 @@
 """Repository for managing WorkflowMax client relationships."""
 
+import re
+import threading
 from typing import Optional, List
-import xml.etree.ElementTree as ET
+
+from cachetools import TTLCache
 
 from ..core.exceptions import (
     ResourceNotFoundError,
@@ -10,14 +13,43 @@ from ..core.exceptions import (
     WorkflowMaxError
 )
 from ..core.logging import get_logger, with_logging
-from ..core.utils import Timer
+from ..core.utils import Timer, sanitize_xml
+from ..core.xml_utils import parse_xml, iter_elements
 from ..models.relationship import Relationship
 
 logger = get_logger('workflowmax.repositories.relationship')
 
+# Status element of a write response, matched without building a tree
+_STATUS_RE = re.compile(rb'<Status>([^<]+)</Status>')
+
+# Request body for client.api/deleterelationship
+_DELETE_TMPL = b'<Relationship><UUID>%s</UUID></Relationship>'
+
+def _response_ok(content: bytes) -> bool:
+    """Check whether a write response reports an OK status.
+    
+    The common OK case is settled by a byte-level match. Anything else
+    falls back to a full parse, so malformed responses still raise.
+    
+    Args:
+        content: Raw response body
+        
+    Returns:
+        True if the response Status is OK
+    """
+    match = _STATUS_RE.search(content)
+    if match is not None and match.group(1) == b'OK':
+        return True
+    status_elem = parse_xml(content).find('Status')
+    return status_elem is not None and status_elem.text == 'OK'
+
 class RelationshipRepository:
     """Repository for client relationship operations."""
     
+    # Relationship UUID -> client UUID index, filled from client fetches
+    OWNER_CACHE_SIZE = 4096
+    OWNER_CACHE_TTL = 3600
+    
     def __init__(self, api_client):
         """Initialize repository.
         
@@ -25,6 +57,8 @@ class RelationshipRepository:
             api_client: Initialized API client instance
         """
         self.api_client = api_client
+        self._owners = TTLCache(maxsize=self.OWNER_CACHE_SIZE, ttl=self.OWNER_CACHE_TTL)
+        self._owners_lock = threading.Lock()
     
     @with_logging
     def add_relationship(self, relationship: Relationship) -> bool:
@@ -42,7 +76,7 @@ class RelationshipRepository:
         """
         with Timer("Add client relationship"):
             # Generate XML payload
-            xml_payload = relationship.to_xml()
+            xml_payload = relationship.to_xml_bytes()
             
             # Make request
             response = self.api_client.post(
@@ -51,10 +85,7 @@ class RelationshipRepository:
             )
             
             try:
-                xml_root = ET.fromstring(response.text.encode('utf-8'))
-                status_elem = xml_root.find('Status')
-                
-                if status_elem is not None and status_elem.text == 'OK':
+                if _response_ok(response.content):
                     logger.info(
                         "Successfully added client relationship",
                         client_uuid=relationship.client_uuid,
@@ -94,7 +125,7 @@ class RelationshipRepository:
                 raise ValidationError("Relationship UUID is required for updates")
             
             # Generate XML payload
-            xml_payload = relationship.to_xml()
+            xml_payload = relationship.to_xml_bytes()
             
             # Make request
             response = self.api_client.post(
@@ -103,10 +134,7 @@ class RelationshipRepository:
             )
             
             try:
-                xml_root = ET.fromstring(response.text.encode('utf-8'))
-                status_elem = xml_root.find('Status')
-                
-                if status_elem is not None and status_elem.text == 'OK':
+                if _response_ok(response.content):
                     logger.info(
                         "Successfully updated client relationship",
                         relationship_uuid=relationship.uuid
@@ -140,7 +168,7 @@ class RelationshipRepository:
         """
         with Timer("Delete client relationship"):
             # Generate XML payload
-            xml_payload = f'<Relationship><UUID>{uuid}</UUID></Relationship>'
+            xml_payload = _DELETE_TMPL % sanitize_xml(uuid).encode('utf-8')
             
             # Make request
             response = self.api_client.post(
@@ -149,10 +177,7 @@ class RelationshipRepository:
             )
             
             try:
-                xml_root = ET.fromstring(response.text.encode('utf-8'))
-                status_elem = xml_root.find('Status')
-                
-                if status_elem is not None and status_elem.text == 'OK':
+                if _response_ok(response.content):
                     logger.info(
                         "Successfully deleted client relationship",
                         relationship_uuid=uuid
@@ -182,23 +207,67 @@ class RelationshipRepository:
             
         Raises:
             ResourceNotFoundError: If client not found
-            WorkflowMaxError: If API request fails
+            WorkflowMaxError: If API request fails or the response Status
+                is not OK
         """
         with Timer("Get client relationships"):
-            # Make request
-            response = self.api_client.get(f'client.api/get/{client_uuid}')
+            # Stream the body so relationships are parsed as they arrive
+            response = self.api_client.get(f'client.api/get/{client_uuid}', stream=True)
             
             try:
-                xml_root = ET.fromstring(response.text.encode('utf-8'))
-                
-                relationships = []
-                relationships_elem = xml_root.find('Relationships')
-                if relationships_elem is not None:
-                    for rel_elem in relationships_elem.findall('Relationship'):
-                        relationships.append(Relationship.from_xml(rel_elem))
-                        
-                return relationships
+                response.raw.decode_content = True
+                from_xml = Relationship.from_xml
+                relationships = [
+                    from_xml(rel_elem)
+                    for rel_elem in iter_elements(
+                        response.raw,
+                        ('Relationships', 'Relationship')
+                    )
+                ]
                 
+            except WorkflowMaxError:
+                # Non-OK Status, raised by iter_elements
+                raise
             except Exception as e:
                 logger.error(f"Failed to parse relationships response: {str(e)}")
                 raise XMLParsingError(f"Failed to parse relationships response: {str(e)}")
+            finally:
+                response.close()
+            
+            # Remember where each relationship lives for get_by_uuid
+            with self._owners_lock:
+                for rel in relationships:
+                    if rel.uuid:
+                        self._owners[rel.uuid] = client_uuid
+            
+            return relationships
+    
+    @with_logging
+    def get_by_uuid(self, uuid: str) -> Optional[Relationship]:
+        """Get a relationship by UUID from the client it was last seen on.
+        
+        Relationships are only read here as part of their client, so this
+        relies on the index built by get_relationships_for_client.
+        
+        Args:
+            uuid: UUID of relationship
+            
+        Returns:
+            Relationship, or None if it has not been seen recently or is no
+            longer on that client
+            
+        Raises:
+            WorkflowMaxError: If API request fails
+        """
+        with self._owners_lock:
+            client_uuid = self._owners.get(uuid)
+        if client_uuid is None:
+            return None
+        
+        for rel in self.get_relationships_for_client(client_uuid):
+            if rel.uuid == uuid:
+                return rel
+        
+        with self._owners_lock:
+            self._owners.pop(uuid, None)
+        return None
@@ -46,7 +46,7 @@ class ContactService:
             ResourceNotFoundError: If contact not found
             WorkflowMaxError: If API request fails
         """
-        with Timer("Get contact"):
+        with Timer("Get contact", service='contact'):
             # Get basic contact info
             contact = self._repositories.contacts.get_by_uuid(uuid)
             
@@ -106,7 +106,7 @@ class ContactService:
             ValidationError: If validation fails
             WorkflowMaxError: If API request fails
         """
-        with Timer("Update contact custom fields"):
+        with Timer("Update contact custom fields", service='contact'):
             # Verify contact exists
             if not self._repositories.contacts.exists(uuid):
                 raise ResourceNotFoundError('Contact', uuid)
@@ -173,7 +173,7 @@ class ContactService:
             ValidationError: If invalid parameters
             WorkflowMaxError: If API request fails
         """
-        with Timer("Search contacts"):
+        with Timer("Search contacts", service='contact'):
             # Search for contacts
             contacts = self._repositories.contacts.search(query, page, page_size)
             
@@ -238,7 +238,7 @@ class ContactService:
             ResourceNotFoundError: If contact not found
             WorkflowMaxError: If API request fails
         """
-        with Timer("Get contact with field"):
+        with Timer("Get contact with field", service='contact'):
             # Get contact with custom fields
             contact = self.get_contact(uuid, include_custom_fields=True)
             
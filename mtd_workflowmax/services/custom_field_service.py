@@ -1,8 +1,11 @@
 """Service for managing WorkflowMax custom fields."""
 
+import sys
 from enum import Enum
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 
 from ..core.exceptions import (
     ValidationError,
@@ -10,7 +13,7 @@ from ..core.exceptions import (
     WorkflowMaxError
 )
 from ..core.logging import get_logger, with_logging
-from ..core.utils import Timer
+from ..core.utils import Timer, fan_out_pool
 from ..models import CustomFieldDefinition, CustomFieldType, CustomFieldValue
 from ..repositories import Repositories
 from ..config import config
@@ -30,6 +33,22 @@ class EntityType(str, Enum):
     JOB_TIME = "job_time"
     QUOTE = "quote"
 
+# Entity type -> definition usage flag attribute
+_ENTITY_ATTR = {
+    EntityType.CLIENT: 'use_client',
+    EntityType.CONTACT: 'use_contact',
+    EntityType.SUPPLIER: 'use_supplier',
+    EntityType.JOB: 'use_job',
+    EntityType.LEAD: 'use_lead',
+    EntityType.JOB_TASK: 'use_job_task',
+    EntityType.JOB_COST: 'use_job_cost',
+    EntityType.JOB_TIME: 'use_job_time',
+    EntityType.QUOTE: 'use_quote',
+}
+
+# Shown in place of an empty value, by field type
+_TYPE_DEFAULT = {CustomFieldType.BOOLEAN: 'false'}
+
 class CustomFieldService:
     """Service for custom field operations."""
     
@@ -57,7 +76,7 @@ class CustomFieldService:
         Raises:
             WorkflowMaxError: If API request fails
         """
-        with Timer("Get field definitions"):
+        with Timer("Get field definitions", service='custom_field'):
             return self._repositories.custom_fields.get_definitions(force_refresh)
     
     @with_logging
@@ -78,7 +97,7 @@ class CustomFieldService:
         Raises:
             WorkflowMaxError: If API request fails
         """
-        with Timer("Get field definition"):
+        with Timer("Get field definition", service='custom_field'):
             if force_refresh:
                 self._repositories.custom_fields.clear_cache()
             return self._repositories.custom_fields.get_definition(field_name)
@@ -101,7 +120,7 @@ class CustomFieldService:
         Raises:
             WorkflowMaxError: If API request fails
         """
-        with Timer("Validate field value"):
+        with Timer("Validate field value", service='custom_field'):
             try:
                 self._repositories.custom_fields.validate_field_value(
                     field_name,
@@ -114,12 +133,14 @@ class CustomFieldService:
     @with_logging
     def validate_fields(
         self,
-        fields: Dict[str, str]
+        fields: Dict[str, str],
+        definitions: Optional[Dict[str, CustomFieldDefinition]] = None
     ) -> List[str]:
         """Validate multiple field values.
         
         Args:
             fields: Dictionary mapping field names to values
+            definitions: Optional prefetched definitions keyed by name
             
         Returns:
             List of validation error messages (empty if all valid)
@@ -127,8 +148,11 @@ class CustomFieldService:
         Raises:
             WorkflowMaxError: If API request fails
         """
-        with Timer("Validate fields"):
-            return self._repositories.custom_fields.validate_fields(fields)
+        with Timer("Validate fields", service='custom_field'):
+            return self._repositories.custom_fields.validate_fields(
+                fields,
+                definitions
+            )
     
     @with_logging
     def get_field_values_for_contacts(
@@ -149,37 +173,34 @@ class CustomFieldService:
         Raises:
             WorkflowMaxError: If API request fails
         """
-        with Timer("Get field values for contacts"):
-            result = {}
-            
-            for uuid in contact_uuids:
+        with Timer("Get field values for contacts", service='custom_field'):
+            def fetch(uuid: str) -> Dict[str, str]:
                 try:
                     # Get all custom fields for contact
                     custom_fields = self._repositories.contacts.get_custom_fields(uuid)
                     
                     # Filter fields if specific ones requested
                     if field_names:
-                        field_values = {
+                        return {
                             field.name: field.value
                             for field in custom_fields
                             if field.name in field_names
                         }
-                    else:
-                        field_values = {
-                            field.name: field.value
-                            for field in custom_fields
-                        }
-                    
-                    result[uuid] = field_values
+                    return {
+                        field.name: field.value
+                        for field in custom_fields
+                    }
                     
                 except WorkflowMaxError as e:
                     logger.warning(
                         f"Failed to get custom fields for contact {uuid}",
                         error=str(e)
                     )
-                    result[uuid] = {}
+                    return {}
             
-            return result
+            # Contacts are independent, so overlap the requests
+            with self._fan_out_pool(len(contact_uuids)) as pool:
+                return dict(zip(contact_uuids, pool.map(fetch, contact_uuids)))
     
     @with_logging
     def update_field_values(
@@ -200,38 +221,61 @@ class CustomFieldService:
         Raises:
             WorkflowMaxError: If API request fails
         """
-        with Timer("Update field values"):
-            results = {}
+        with Timer("Update field values", service='custom_field'):
+            results: Dict[str, List[str]] = {}
+            pending: Dict[str, Dict[str, str]] = {}
             
-            for uuid, fields in updates.items():
+            # Fetch definitions once for the whole batch
+            definitions = None
+            if validate:
                 try:
-                    # Validate contact exists
-                    if not self._repositories.contacts.exists(uuid):
-                        results[uuid] = [f"Contact {uuid} not found"]
+                    definitions = self._repositories.custom_fields.get_definitions_map()
+                except WorkflowMaxError as e:
+                    return {uuid: [str(e)] for uuid in updates}
+            
+            # Validate fields if requested. Bulk updates often send the same
+            # fields to many contacts, so each distinct set is checked once.
+            validation_cache: Dict[Tuple[Tuple[str, str], ...], List[str]] = {}
+            for uuid, fields in updates.items():
+                if validate:
+                    key = tuple(sorted(fields.items()))
+                    errors = validation_cache.get(key)
+                    if errors is None:
+                        try:
+                            errors = self.validate_fields(fields, definitions)
+                        except WorkflowMaxError as e:
+                            errors = [str(e)]
+                        validation_cache[key] = errors
+                    if errors:
+                        results[uuid] = list(errors)  # Don't share cached lists
                         continue
-                    
-                    # Validate fields if requested
-                    if validate:
-                        errors = self.validate_fields(fields)
-                        if errors:
-                            results[uuid] = errors
-                            continue
-                    
-                    # Update fields
+                
+                pending[uuid] = fields
+            
+            def update(uuid: str, fields: Dict[str, str]) -> List[str]:
+                try:
                     success = self._repositories.contacts.update_custom_fields(
                         uuid,
                         fields
                     )
                     
                     if not success:
-                        results[uuid] = ["Failed to update custom fields"]
-                    else:
-                        results[uuid] = []
-                        
+                        return ["Failed to update custom fields"]
+                    return []
+                
+                except ResourceNotFoundError:
+                    # The update itself reports missing contacts, so there is
+                    # no separate existence check up front
+                    return [f"Contact {uuid} not found"]
                 except WorkflowMaxError as e:
-                    results[uuid] = [str(e)]
+                    return [str(e)]
             
-            return results
+            # Contacts are independent, so overlap the requests
+            with self._fan_out_pool(len(pending)) as pool:
+                results.update(zip(pending, pool.map(update, pending, pending.values())))
+            
+            # Report in input order
+            return {uuid: results[uuid] for uuid in updates}
 
     @with_logging
     def update_field(
@@ -256,7 +300,7 @@ class CustomFieldService:
             WorkflowMaxError: If API request fails
             ValidationError: If validation fails
         """
-        with Timer("Update field"):
+        with Timer("Update field", service='custom_field'):
             # Validate field value if requested
             if validate:
                 errors = self.validate_field_value(field_name, field_value)
@@ -279,7 +323,7 @@ class CustomFieldService:
         
         Args:
             field_name: Name of the field
-            page_size: Number of contacts to process per page
+            page_size: Number of clients per page; each page holds their contacts
             
         Returns:
             Dictionary of value frequencies
@@ -288,47 +332,49 @@ class CustomFieldService:
             ValidationError: If field not found
             WorkflowMaxError: If API request fails
         """
-        with Timer("Get field statistics"):
+        with Timer("Get field statistics", service='custom_field'):
             # Verify field exists
             if not self.get_field_definition(field_name):
                 raise ValidationError(f"Custom field '{field_name}' not found")
             
-            stats = {}
-            page = 1
+            def field_value(contact) -> Optional[str]:
+                try:
+                    field = self._repositories.contacts.get_custom_field(
+                        contact.uuid,
+                        field_name
+                    )
+                    if field is not None:
+                        return field.value or 'None'
+                            
+                except WorkflowMaxError as e:
+                    logger.warning(
+                        f"Failed to get custom fields for contact {contact.uuid}",
+                        error=str(e)
+                    )
+                return None
             
-            while True:
-                # Get batch of contacts
-                contacts = self._repositories.contacts.search(
-                    page=page,
-                    page_size=page_size
-                )
-                
-                if not contacts:
-                    break
-                
-                # Process contacts
-                for contact in contacts:
-                    try:
-                        custom_fields = self._repositories.contacts.get_custom_fields(
-                            contact.uuid
-                        )
-                        
-                        for field in custom_fields:
-                            if field.name == field_name:
-                                value = field.value or 'None'
-                                stats[value] = stats.get(value, 0) + 1
-                                break
-                                
-                    except WorkflowMaxError as e:
-                        logger.warning(
-                            f"Failed to get custom fields for contact {contact.uuid}",
-                            error=str(e)
-                        )
-                
-                page += 1
+            stats = Counter()
             
-            return stats
-
+            with self._fan_out_pool(page_size) as pool:
+                for contacts in self._repositories.contacts.iter_pages(page_size):
+                    # Fetch the page's custom fields concurrently, then
+                    # count the whole page at once
+                    stats.update(
+                        value for value in pool.map(field_value, contacts)
+                        if value is not None
+                    )
+            
+            return dict(stats)
+    
+    @staticmethod
+    def _fan_out_pool(task_count: int) -> ThreadPoolExecutor:
+        """Create a thread pool for per-contact API calls."""
+        return fan_out_pool(
+            task_count,
+            config.api.rate_limit.concurrent_limit,
+            name='custom-field'
+        )
+    
     def print_fields(
         self,
         fields: List[CustomFieldValue],
@@ -342,12 +388,11 @@ class CustomFieldService:
             entity_type: Type of entity the fields belong to
             indent: Indentation level
         """
-        with Timer("Get field definitions"):
+        with Timer("Get field definitions", service='custom_field'):
             # Get all field definitions that are valid for the entity type
-            definitions = {
-                d.name: d for d in self.get_field_definitions()
-                if self._is_field_valid_for_entity(d, entity_type)
-            }
+            definitions = self._repositories.custom_fields.get_definitions_map(
+                _ENTITY_ATTR[entity_type]
+            )
         
         # Create value map for quick lookup
         field_values = {
@@ -356,13 +401,12 @@ class CustomFieldService:
         }
         
         # Print fields that are valid for the entity type
-        print("\nCustom Fields:")
+        prefix = ' ' * indent
+        lines = ["\nCustom Fields:\n"]
         for name, definition in definitions.items():
-            value = field_values.get(name, '')
-            if not value and definition.type == CustomFieldType.CHECKBOX:
-                value = 'false'
-                
-            print(f"{' ' * indent}{name} ({definition.type.value}): {value}")
+            value = field_values.get(name) or _TYPE_DEFAULT.get(definition.type, '')
+            lines.append(f"{prefix}{name} ({definition.type.value}): {value}\n")
+        sys.stdout.write(''.join(lines))
             
     def _is_field_valid_for_entity(
         self,
@@ -378,22 +422,4 @@ class CustomFieldService:
         Returns:
             True if field is valid for entity type
         """
-        if entity_type == EntityType.CLIENT:
-            return definition.use_client
-        elif entity_type == EntityType.CONTACT:
-            return definition.use_contact
-        elif entity_type == EntityType.SUPPLIER:
-            return definition.use_supplier
-        elif entity_type == EntityType.JOB:
-            return definition.use_job
-        elif entity_type == EntityType.LEAD:
-            return definition.use_lead
-        elif entity_type == EntityType.JOB_TASK:
-            return definition.use_job_task
-        elif entity_type == EntityType.JOB_COST:
-            return definition.use_job_cost
-        elif entity_type == EntityType.JOB_TIME:
-            return definition.use_job_time
-        elif entity_type == EntityType.QUOTE:
-            return definition.use_quote
-        return False
+        return getattr(definition, _ENTITY_ATTR.get(entity_type, ''), False)
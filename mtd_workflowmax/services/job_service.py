@@ -2,20 +2,67 @@
 
 from typing import Optional, List, Dict, Any
 from datetime import datetime
+from functools import lru_cache
 
 from ..core.exceptions import (
     ValidationError,
-    ResourceNotFoundError,
-    WorkflowMaxError
+    ResourceNotFoundError
 )
 from ..core.logging import get_logger, with_logging
 from ..core.utils import Timer
-from ..models import Job, CustomFieldValue, CustomFieldType
+from ..models import Job, CustomFieldDefinition, CustomFieldValue, CustomFieldType
 from ..repositories import repositories
 from ..config import config
 
 logger = get_logger('workflowmax.services.job')
 
+@lru_cache(maxsize=256)
+def _empty_field_template(name: str, field_type: CustomFieldType) -> CustomFieldValue:
+    """Get the validated template for a field with no value.
+    
+    Never handed out directly; callers take a copy, so each job gets its
+    own ordinary field without re-running model validation.
+    
+    Args:
+        name: Field name
+        field_type: Field type from the definition
+        
+    Returns:
+        Empty field value
+    """
+    return CustomFieldValue(
+        Name=name,  # Name is required
+        value=None,
+        type=field_type
+    )
+
+def _merge_custom_fields(
+    definitions: Dict[str, CustomFieldDefinition],
+    custom_fields: List[CustomFieldValue]
+) -> List[CustomFieldValue]:
+    """Build the full list of job fields, including empty ones.
+    
+    Args:
+        definitions: Job field definitions keyed by name
+        custom_fields: The job's current field values
+        
+    Returns:
+        One field per definition, in definition order
+    """
+    pop_value = {f.name: f for f in custom_fields}.pop
+    merged = []
+    append = merged.append
+    for name, definition in definitions.items():
+        field = pop_value(name, None)
+        if field is None:
+            # Empty field with correct type from definition
+            field = _empty_field_template(name, definition.type).model_copy()
+        else:
+            # Ensure field has correct type from definition
+            field.type = definition.type
+        append(field)
+    return merged
+
 class JobService:
     """Service for job operations."""
     
@@ -34,39 +81,19 @@ class JobService:
             ResourceNotFoundError: If job not found
             WorkflowMaxError: If API request fails
         """
-        with Timer("Get job"):
+        with Timer("Get job", service='job'):
             # Get basic job info
             job = repositories.jobs.get_by_uuid(uuid)
             
             # Add custom fields if requested
             if include_custom_fields:
-                # Get field definitions
-                definitions = {
-                    d.name: d for d in repositories.custom_fields.get_definitions()
-                    if d.use_job  # Only include fields that can be used on jobs
-                }
+                # Get definitions of fields that can be used on jobs
+                definitions = repositories.custom_fields.get_definitions_map('use_job')
                 
                 # Get current field values
                 custom_fields = repositories.jobs.get_custom_fields(uuid)
-                field_values = {f.name: f for f in custom_fields}
-                
-                # Create list of all fields, including empty ones
-                all_fields = []
-                for name, definition in definitions.items():
-                    if name in field_values:
-                        field = field_values[name]
-                        # Ensure field has correct type from definition
-                        field.type = definition.type
-                        all_fields.append(field)
-                    else:
-                        # Create empty field with correct type from definition
-                        all_fields.append(CustomFieldValue(
-                            Name=name,  # Name is required
-                            value=None,
-                            type=definition.type  # Use type from definition
-                        ))
                 
-                job.custom_fields = all_fields
+                job.custom_fields = _merge_custom_fields(definitions, custom_fields)
                 
             return job
     
@@ -92,17 +119,15 @@ class JobService:
             ValidationError: If validation fails
             WorkflowMaxError: If API request fails
         """
-        with Timer("Update job custom fields"):
+        with Timer("Update job custom fields", service='job'):
             # Verify job exists
             if not repositories.jobs.exists(uuid):
                 raise ResourceNotFoundError('Job', uuid)
             
             # Get field definitions if validation requested
             if validate:
-                definitions = {
-                    d.name: d for d in repositories.custom_fields.get_definitions()
-                    if d.use_job  # Only include fields that can be used on jobs
-                }
+                # Get definitions of fields that can be used on jobs
+                definitions = repositories.custom_fields.get_definitions_map('use_job')
                 
                 # Validate each field
                 errors = []
@@ -170,48 +195,26 @@ class JobService:
             ValidationError: If invalid parameters
             WorkflowMaxError: If API request fails
         """
-        with Timer("Search jobs"):
+        with Timer("Search jobs", service='job'):
             # Search for jobs
             jobs = repositories.jobs.search(query, page, page_size)
             
             # Add custom fields if requested
             if include_custom_fields and jobs:
-                # Get field definitions
-                definitions = {
-                    d.name: d for d in repositories.custom_fields.get_definitions()
-                    if d.use_job  # Only include fields that can be used on jobs
-                }
+                # Get definitions of fields that can be used on jobs
+                definitions = repositories.custom_fields.get_definitions_map('use_job')
+                
+                # Get current field values for the whole page at once
+                job_fields = repositories.jobs.get_custom_fields_bulk(
+                    [job.uuid for job in jobs]
+                )
                 
                 for job in jobs:
-                    try:
-                        # Get current field values
-                        custom_fields = repositories.jobs.get_custom_fields(
-                            job.uuid
-                        )
-                        field_values = {f.name: f for f in custom_fields}
-                        
-                        # Create list of all fields, including empty ones
-                        all_fields = []
-                        for name, definition in definitions.items():
-                            if name in field_values:
-                                field = field_values[name]
-                                # Ensure field has correct type from definition
-                                field.type = definition.type
-                                all_fields.append(field)
-                            else:
-                                # Create empty field with correct type from definition
-                                all_fields.append(CustomFieldValue(
-                                    Name=name,  # Name is required
-                                    value=None,
-                                    type=definition.type  # Use type from definition
-                                ))
-                        
-                        job.custom_fields = all_fields
-                        
-                    except WorkflowMaxError as e:
-                        logger.warning(
-                            f"Failed to get custom fields for job {job.uuid}",
-                            error=str(e)
+                    custom_fields = job_fields.get(job.uuid)
+                    if custom_fields is not None:
+                        job.custom_fields = _merge_custom_fields(
+                            definitions,
+                            custom_fields
                         )
             
             return jobs
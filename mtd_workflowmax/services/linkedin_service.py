@@ -2,19 +2,248 @@
 
 import os
 import json
+import logging
 import re
-from typing import Optional, Dict, List, Tuple, Any
-from difflib import SequenceMatcher
+import threading
+from concurrent.futures import Future
+from functools import lru_cache
+from typing import Optional, Dict, List, Tuple, Any, Callable
+import requests
+from requests.adapters import HTTPAdapter
+from cachetools import TTLCache
 from linkedin_api import Linkedin
+from tenacity import (
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential_jitter
+)
 
+try:
+    from rapidfuzz import fuzz as _fuzz, process as _process
+    _HAS_RAPIDFUZZ = True
+except ImportError:
+    from difflib import SequenceMatcher
+    _HAS_RAPIDFUZZ = False
+
+# process.cdist hands back a numpy array, so it needs numpy as well
+_HAS_CDIST = False
+if _HAS_RAPIDFUZZ:
+    try:
+        import numpy  # noqa: F401
+        _HAS_CDIST = True
+    except ImportError:
+        pass
+
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+from ..config import config
 from ..core.exceptions import WorkflowMaxError
 from ..core.logging import get_logger, with_logging
-from ..core.utils import Timer
+from ..core.utils import Timer, fan_out_pool
 from ..repositories import Repositories
 from ..models.profile_data import ProfileData
 
 logger = get_logger('workflowmax.services.linkedin')
 
+_CLEAN_RE = re.compile(r'[^a-z0-9\s]')
+
+# Below this many profile pairs, starting cdist worker threads costs more
+# than it saves
+_PARALLEL_SCORE_MIN_PAIRS = 10_000
+
+@lru_cache(maxsize=4096)
+def _clean(text: str) -> str:
+    """Clean text by replacing special characters with spaces.
+    
+    Module-level so the cache is keyed on the text alone; the same names,
+    companies and titles come up across candidates and searches.
+    """
+    if not text:
+        return ""
+    
+    # Lowercase, replace special characters with spaces and collapse runs
+    # of whitespace
+    return ' '.join(_CLEAN_RE.sub(' ', text.lower()).split())
+
+# Scorers return 0-100, like rapidfuzz's
+if _HAS_RAPIDFUZZ:
+    _ratio_score = _fuzz.ratio
+    _token_sort_score = _fuzz.token_sort_ratio
+    _token_set_score = _fuzz.token_set_ratio
+    _weighted_score = _fuzz.WRatio
+else:
+    def _ratio_score(a: str, b: str) -> float:
+        """Ratcliff-Obershelp similarity of two strings."""
+        return SequenceMatcher(None, a, b).ratio() * 100
+    
+    def _token_sort_score(a: str, b: str) -> float:
+        """Similarity of two strings with their words put in sorted order."""
+        return _ratio_score(' '.join(sorted(a.split())), ' '.join(sorted(b.split())))
+    
+    def _token_set_score(a: str, b: str) -> float:
+        """Word-order independent similarity, ignoring repeated words.
+        
+        Compares the shared words against each side's full word set, so
+        one string being a subset of the other scores 100.
+        """
+        words_a, words_b = set(a.split()), set(b.split())
+        if not words_a or not words_b:
+            return 0.0
+        common = ' '.join(sorted(words_a & words_b))
+        rest_a = ' '.join(sorted(words_a - words_b))
+        rest_b = ' '.join(sorted(words_b - words_a))
+        if common and (not rest_a or not rest_b):
+            return 100.0
+        full_a = f"{common} {rest_a}".strip()
+        full_b = f"{common} {rest_b}".strip()
+        return max(
+            _ratio_score(common, full_a),
+            _ratio_score(common, full_b),
+            _ratio_score(full_a, full_b)
+        )
+    
+    def _weighted_score(a: str, b: str) -> float:
+        """Best of the plain and (slightly discounted) token-set scores."""
+        return max(_ratio_score(a, b), _token_set_score(a, b) * 0.95)
+
+def _name_similarity(a: str, b: str) -> float:
+    """Similarity of two cleaned names in the range 0.0-1.0.
+    
+    Word order is ignored, so "smith john" matches "john smith".
+    """
+    return _token_sort_score(a, b) / 100.0
+
+def _best_match(
+    target: str,
+    choices: List[str],
+    clean_choices: List[str],
+    scorer: Callable[[str, str], float] = _ratio_score
+) -> Tuple[Optional[str], float]:
+    """Find the choice most similar to a target.
+    
+    With rapidfuzz the whole list is scored in a single native call rather
+    than one Python-level comparison per choice.
+    
+    Args:
+        target: Cleaned text to compare against
+        choices: Raw candidate strings
+        clean_choices: The same candidates passed through _clean
+        scorer: Similarity function returning 0-100
+        
+    Returns:
+        Tuple of (best raw choice, similarity 0.0-1.0); (None, 0.0) when
+        nothing is similar at all. An exact match wins outright; otherwise
+        ties go to the earliest choice.
+    """
+    # Screens that settle the common cases without scoring: contacts often
+    # have no company or title, and LinkedIn often has the same one verbatim
+    if not target:
+        return None, 0.0
+    try:
+        return choices[clean_choices.index(target)], 1.0
+    except ValueError:
+        pass
+    
+    if _HAS_RAPIDFUZZ:
+        match = _process.extractOne(target, clean_choices, scorer=scorer, processor=None)
+        if match is None or not match[1]:
+            return None, 0.0
+        return choices[match[2]], match[1] / 100.0
+    
+    best, best_score = None, 0.0
+    for choice, clean_choice in zip(choices, clean_choices):
+        score = scorer(target, clean_choice)
+        if score > best_score:
+            best, best_score = choice, score
+    return best, best_score / 100.0
+
+def _score_matrix(
+    queries: List[str],
+    choices: List[str],
+    scorer: Callable[[str, str], float],
+    workers: int = 1
+) -> List[List[float]]:
+    """Score every query against every choice.
+    
+    Args:
+        queries: Cleaned query strings
+        choices: Cleaned choice strings
+        scorer: Similarity function returning 0-100
+        workers: cdist worker threads; -1 for one per core
+        
+    Returns:
+        One row of 0-100 scores per query, one column per choice
+    """
+    if _HAS_CDIST and queries and choices:
+        # One native call for the whole matrix
+        return _process.cdist(queries, choices, scorer=scorer, workers=workers).tolist()
+    return [[scorer(query, choice) for choice in choices] for query in queries]
+
+def _best_scores(
+    queries: List[str],
+    choice_groups: List[List[str]],
+    scorer: Callable[[str, str], float],
+    workers: int = 1
+) -> List[List[float]]:
+    """Find each query's best score within each group of choices.
+    
+    All groups are scored together in one matrix and then split up again.
+    
+    Args:
+        queries: Cleaned query strings
+        choice_groups: Lists of cleaned choice strings
+        scorer: Similarity function returning 0-100
+        workers: cdist worker threads; -1 for one per core
+        
+    Returns:
+        One row of 0.0-1.0 scores per query, one column per group; 0.0 for
+        empty queries and empty groups
+    """
+    matrix = _score_matrix(
+        queries, [c for group in choice_groups for c in group], scorer, workers
+    )
+    
+    best = []
+    for query, row in zip(queries, matrix):
+        scores = []
+        start = 0
+        for group in choice_groups:
+            end = start + len(group)
+            scores.append(max(row[start:end], default=0.0) / 100.0 if query else 0.0)
+            start = end
+        best.append(scores)
+    return best
+
+def _cleaned_experience(linkedin_profile: Dict) -> Tuple[List[str], List[str], List[str], List[str]]:
+    """Get a profile's company names and titles, raw and cleaned.
+    
+    Computed once per profile and stored on the profile dict, which is
+    reused from the profile cache when the same person comes up again.
+    
+    Args:
+        linkedin_profile: LinkedIn profile data
+        
+    Returns:
+        Tuple of (companies, cleaned companies, titles, cleaned titles)
+    """
+    cleaned = linkedin_profile.get('_cleaned_experience')
+    if cleaned is None:
+        experience = linkedin_profile.get('experience') or ()
+        companies = [role['companyName'] for role in experience if role.get('companyName')]
+        titles = [role['title'] for role in experience if role.get('title')]
+        cleaned = linkedin_profile['_cleaned_experience'] = (
+            companies,
+            [_clean(company) for company in companies],
+            titles,
+            [_clean(title) for title in titles]
+        )
+    return cleaned
+
 def log_section(title: str) -> str:
     """Create a visually distinct section header."""
     border = "=" * 80
@@ -25,6 +254,43 @@ def log_subsection(title: str) -> str:
     border = "-" * 40
     return f"\n{border}\n{title}\n{border}"
 
+# LinkedIn answers throttled requests with 429 (or its own 999)
+_TRANSIENT_STATUSES = frozenset({429, 999, 500, 502, 503, 504})
+
+def _is_transient(error: BaseException) -> bool:
+    """Check whether a failed LinkedIn request is worth retrying.
+    
+    Connection problems, timeouts and throttling/server errors are; any
+    other failure (bad request, auth, parsing) would fail the same way again.
+    """
+    if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+        return True
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        return error.response.status_code in _TRANSIENT_STATUSES
+    return False
+
+def _log_retry(retry_state) -> None:
+    """Log a LinkedIn request about to be retried."""
+    logger.warning(
+        "Retrying LinkedIn request",
+        attempt=retry_state.attempt_number,
+        error=str(retry_state.outcome.exception()),
+        error_type=type(retry_state.outcome.exception()).__name__
+    )
+
+# Fixed headers, built once
+_SECTION_PROFILE_COMPARISON = log_section("PROFILE COMPARISON")
+_SECTION_LINKEDIN_SEARCH = log_section("LINKEDIN SEARCH")
+_SECTION_ANALYZING_MATCHES = log_section("ANALYZING MATCHES")
+_SECTION_MATCH_FOUND = log_section("MATCH FOUND")
+_SECTION_NO_MATCH = log_section("NO MATCH")
+_SUBSECTION_NAME_COMPARISON = log_subsection("Name Comparison")
+_SUBSECTION_EXPERIENCE_ANALYSIS = log_subsection("Experience Analysis")
+_SUBSECTION_FINAL_SCORE = log_subsection("Final Score")
+
+if _HAS_ORJSON:
+    _ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
 def log_json(obj: Any, fields: Optional[List[str]] = None) -> str:
     """Format object as indented JSON for logging.
     
@@ -33,8 +299,9 @@ def log_json(obj: Any, fields: Optional[List[str]] = None) -> str:
         fields: Optional list of fields to include. If None, includes all fields.
     """
     if fields:
-        filtered = {k: obj.get(k) for k in fields if k in obj}
-        return json.dumps(filtered, indent=2, default=str)
+        obj = {k: obj.get(k) for k in fields if k in obj}
+    if _HAS_ORJSON:
+        return orjson.dumps(obj, default=str, option=_ORJSON_OPTIONS).decode()
     return json.dumps(obj, indent=2, default=str)
 
 class LinkedInService:
@@ -44,9 +311,13 @@ class LinkedInService:
     NAME_THRESHOLD = 0.8  # Minimum name similarity required
     EXPERIENCE_THRESHOLD = 0.3  # Minimum experience similarity required
     DEFAULT_CACHE_DIR = '.linkedin'
-    MAX_SEARCH_RESULTS = 10  # Limit search results to prevent timeouts
+    MAX_SEARCH_RESULTS = 3  # Search results requested; each one is a matching candidate
+    EXCELLENT_MATCH_SCORE = 0.95  # Score at which remaining candidates are skipped
+    MAX_PROFILE_FETCHERS = 3  # Concurrent profile requests, kept low for LinkedIn's rate limits
     REQUEST_TIMEOUT = 30  # Request timeout in seconds
     LINKEDIN_BASE_URL = "https://www.linkedin.com/in/"
+    PROFILE_CACHE_SIZE = 1024  # Searches, profiles and contact infos kept between searches
+    PROFILE_CACHE_TTL = 3600  # Seconds before a cached profile is fetched again
     
     # Fields to include in profile logging
     PROFILE_LOG_FIELDS = ['lastName', 'firstName', 'location', 'experience', 'companyName', 'title', 'locationName']
@@ -78,28 +349,145 @@ class LinkedInService:
                 cookies=cookies,
                 cookies_dir=cookies_dir
             )
+            # linkedin_api's session keeps requests' default of 10 connections,
+            # fewer than the contact workers and their profile fetchers use at
+            # once; the surplus would be opened and dropped on every request
+            pool_size = config.api.rate_limit.concurrent_limit * (self.MAX_PROFILE_FETCHERS + 1)
+            self.api.client.session.mount('https://', HTTPAdapter(pool_maxsize=pool_size))
             self.repositories = repositories
+            self._profile_cache: TTLCache[str, Dict] = TTLCache(
+                maxsize=self.PROFILE_CACHE_SIZE, ttl=self.PROFILE_CACHE_TTL
+            )
+            self._contact_info_cache: TTLCache[str, Dict] = TTLCache(
+                maxsize=self.PROFILE_CACHE_SIZE, ttl=self.PROFILE_CACHE_TTL
+            )
+            self._search_cache: TTLCache[Tuple[str, str], List[Dict]] = TTLCache(
+                maxsize=self.PROFILE_CACHE_SIZE, ttl=self.PROFILE_CACHE_TTL
+            )
+            self._inflight: Dict[Tuple[int, Any], Future] = {}
+            self._cache_lock = threading.Lock()
             logger.info("LinkedIn API client initialized successfully")
             
         except Exception as e:
             logger.error("Failed to initialize LinkedIn API client", error=str(e))
             raise WorkflowMaxError("LinkedIn authentication failed") from e
     
-    def _clean_text(self, text: str) -> str:
-        """Clean text by replacing special characters with spaces."""
-        if not text:
-            return ""
+    _clean_text = staticmethod(_clean)
+    
+    def _cached_fetch(self, cache: TTLCache, key: Any, fetch: Callable[[], Any]) -> Any:
+        """Fetch LinkedIn data, reusing a recent response.
+        
+        Concurrent misses for the same request are coalesced: the first
+        caller makes the API call and the others wait for its result.
+        
+        Args:
+            cache: Cache holding responses for this kind of request
+            key: Cache key identifying the request
+            fetch: Makes the API call on a cache miss
             
-        # Convert to lowercase
-        cleaned = text.lower()
+        Returns:
+            API response
+        """
+        # Caches share keys (profiles and contact info are both keyed by URN)
+        inflight_key = (id(cache), key)
+        with self._cache_lock:
+            data = cache.get(key)
+            if data is not None:
+                return data
+            future = self._inflight.get(inflight_key)
+            if future is None:
+                future = self._inflight[inflight_key] = Future()
+                owner = True
+            else:
+                owner = False
         
-        # Replace special characters with spaces
-        cleaned = re.sub(r'[^a-z0-9\s]', ' ', cleaned)
+        if not owner:
+            # Another thread is already making this request
+            return future.result()
+        
+        try:
+            data = fetch()
+        except BaseException as e:
+            with self._cache_lock:
+                del self._inflight[inflight_key]
+            future.set_exception(e)
+            raise
+        
+        with self._cache_lock:
+            if data:
+                cache[key] = data
+            del self._inflight[inflight_key]
+        future.set_result(data)
+        return data
+    
+    @staticmethod
+    @retry(
+        retry=retry_if_exception(_is_transient),
+        wait=wait_exponential_jitter(initial=1, max=60),
+        stop=stop_after_attempt(4),
+        before_sleep=_log_retry,
+        reraise=True
+    )
+    def _call_api(method: Callable[..., Any], **kwargs) -> Any:
+        """Call a LinkedIn API method, backing off on transient failures.
         
-        # Normalize spaces (remove duplicates)
-        cleaned = ' '.join(part for part in cleaned.split() if part)
+        Args:
+            method: Bound LinkedIn client method
+            **kwargs: Arguments for the method
+            
+        Returns:
+            API response
+        """
+        return method(**kwargs)
+    
+    def _search_people(self, first_name: str, last_name: str) -> List[Dict]:
+        """Search LinkedIn by name, cached for PROFILE_CACHE_TTL seconds.
         
-        return cleaned
+        Contacts sharing a name share one search.
+        """
+        return self._cached_fetch(
+            self._search_cache,
+            (first_name, last_name),
+            lambda: self._call_api(
+                self.api.search_people,
+                keyword_first_name=first_name,
+                keyword_last_name=last_name,
+                include_private_profiles=True,
+                limit=self.MAX_SEARCH_RESULTS
+            )
+        )
+    
+    def _get_profile(self, urn_id: str) -> Dict:
+        """Get a LinkedIn profile, cached for PROFILE_CACHE_TTL seconds."""
+        return self._cached_fetch(
+            self._profile_cache,
+            urn_id,
+            lambda: self._call_api(self.api.get_profile, urn_id=urn_id)
+        )
+    
+    def _get_contact_info(self, urn_id: str) -> Dict:
+        """Get a profile's contact info, cached for PROFILE_CACHE_TTL seconds."""
+        return self._cached_fetch(
+            self._contact_info_cache,
+            urn_id,
+            lambda: self._call_api(self.api.get_profile_contact_info, urn_id=urn_id)
+        )
+    
+    @staticmethod
+    def _search_key(profile: ProfileData) -> Optional[Tuple[str, str]]:
+        """Get the cleaned first and last name a profile is searched by.
+        
+        Args:
+            profile: Profile to search for
+            
+        Returns:
+            Tuple of (first name, last name), or None if the name cannot be
+            split into the two
+        """
+        name_parts = profile.name.split(maxsplit=1)
+        if len(name_parts) != 2:
+            return None
+        return _clean(name_parts[0]), _clean(name_parts[1])
 
     def _analyze_experience(self, linkedin_profile: Dict, target_company: str, target_title: str) -> Dict[str, Any]:
         """Analyze experience entries to find potential matches.
@@ -109,6 +497,23 @@ class LinkedInService:
             target_company: Company name to look for
             target_title: Job title to look for
             
+        Returns:
+            Dict containing analysis results
+        """
+        return self._analyze_experience_clean(
+            linkedin_profile,
+            self._clean_text(target_company),
+            self._clean_text(target_title)
+        )
+    
+    def _analyze_experience_clean(self, linkedin_profile: Dict, target_company: str, target_title: str) -> Dict[str, Any]:
+        """Analyze experience entries against already-cleaned targets.
+        
+        Args:
+            linkedin_profile: LinkedIn profile data
+            target_company: Company name, as returned by _clean_text
+            target_title: Job title, as returned by _clean_text
+            
         Returns:
             Dict containing analysis results
         """
@@ -123,54 +528,35 @@ class LinkedInService:
                 'title_similarity': 0.0
             }
 
-        # Clean target values
-        target_company = self._clean_text(target_company)
-        target_title = self._clean_text(target_title)
-
-        # Track best matches
-        best_company = None
-        best_title = None
-        best_company_score = 0.0
-        best_title_score = 0.0
-        has_company_match = False
-        has_title_match = False
-
         # Log experience entries
-        logger.debug("\nExperience Entries:")
-        for i, role in enumerate(experience):
-            logger.debug(f"\nRole {i + 1}:")
-            company = role.get('companyName', '')
-            title = role.get('title', '')
-            logger.debug(f"Company: {company}")
-            logger.debug(f"Title: {title}")
-            
-            if 'timePeriod' in role:
-                period = role['timePeriod']
-                start = period.get('startDate', {})
-                end = period.get('endDate', {})
-                logger.debug(f"Period: {start.get('month', '')}/{start.get('year', '')} - {end.get('month', '')}/{end.get('year', '')}")
-            if 'description' in role:
-                logger.debug(f"Description: {role['description']}")
+        if logger.logger.isEnabledFor(logging.DEBUG):
+            logger.debug("\nExperience Entries:")
+            for i, role in enumerate(experience):
+                logger.debug(f"\nRole {i + 1}:")
+                logger.debug(f"Company: {role.get('companyName', '')}")
+                logger.debug(f"Title: {role.get('title', '')}")
+                if 'timePeriod' in role:
+                    period = role['timePeriod']
+                    start = period.get('startDate', {})
+                    end = period.get('endDate', {})
+                    logger.debug(f"Period: {start.get('month', '')}/{start.get('year', '')} - {end.get('month', '')}/{end.get('year', '')}")
+                if 'description' in role:
+                    logger.debug(f"Description: {role['description']}")
 
-            # Compare company names
-            if company:
-                company_clean = self._clean_text(company)
-                score = SequenceMatcher(None, target_company, company_clean).ratio()
-                if score > best_company_score:
-                    best_company_score = score
-                    best_company = company
-                if score >= 0.8:  # High confidence match
-                    has_company_match = True
-
-            # Compare job titles
-            if title:
-                title_clean = self._clean_text(title)
-                score = SequenceMatcher(None, target_title, title_clean).ratio()
-                if score > best_title_score:
-                    best_title_score = score
-                    best_title = title
-                if score >= 0.8:  # High confidence match
-                    has_title_match = True
+        # Compare company names and job titles, each against all roles at
+        # once. Both are word-based: company names gain and lose suffixes
+        # ("Pty Ltd") and titles get reordered and abbreviated
+        companies, clean_companies, titles, clean_titles = _cleaned_experience(linkedin_profile)
+        best_company, best_company_score = _best_match(
+            target_company, companies, clean_companies, _token_set_score
+        )
+        best_title, best_title_score = _best_match(
+            target_title, titles, clean_titles, _weighted_score
+        )
+        
+        # 0.8 and above counts as a high confidence match
+        has_company_match = best_company_score >= 0.8
+        has_title_match = best_title_score >= 0.8
 
         return {
             'has_company_match': has_company_match,
@@ -181,54 +567,99 @@ class LinkedInService:
             'title_similarity': best_title_score
         }
     
+    def calculate_similarity(
+        self,
+        profile: ProfileData,
+        linkedin_profile: Dict,
+        clean_targets: Optional[Tuple[str, str]] = None
+    ) -> float:
+        """Calculate similarity score between a profile and LinkedIn profile.
+        
+        Args:
+            profile: WorkflowMax profile data
+            linkedin_profile: LinkedIn profile data
+            clean_targets: Optional (company, title) pair already passed
+                through _clean_text, to avoid re-cleaning per candidate
+            
+        Returns:
+            Weighted similarity score
+        """
+        return self.score_profile(profile, linkedin_profile, clean_targets)[0]
+    
     @with_logging
-    def calculate_similarity(self, profile: ProfileData, linkedin_profile: Dict) -> float:
-        """Calculate similarity score between a profile and LinkedIn profile."""
-        with Timer("Calculate profile similarity"):
-            logger.debug(log_section("PROFILE COMPARISON"))
+    def score_profile(
+        self,
+        profile: ProfileData,
+        linkedin_profile: Dict,
+        clean_targets: Optional[Tuple[str, str]] = None
+    ) -> Tuple[float, Dict[str, Any]]:
+        """Score a LinkedIn profile and keep the experience analysis behind it.
+        
+        Args:
+            profile: WorkflowMax profile data
+            linkedin_profile: LinkedIn profile data
+            clean_targets: Optional (company, title) pair already passed
+                through _clean_text, to avoid re-cleaning per candidate
+            
+        Returns:
+            Tuple of (weighted similarity score, experience analysis)
+        """
+        with Timer("Calculate profile similarity", service='linkedin'):
+            # Building these messages (notably the JSON dumps) is far more
+            # expensive than scoring, so skip it unless it will be emitted
+            debug = logger.logger.isEnabledFor(logging.DEBUG)
+            if debug:
+                logger.debug(_SECTION_PROFILE_COMPARISON)
             
             # Log filtered LinkedIn profile data
-            logger.debug("\nRaw LinkedIn Profile:")
-            logger.debug(log_json(linkedin_profile, self.PROFILE_LOG_FIELDS))
+            if debug:
+                logger.debug("\nRaw LinkedIn Profile:")
+                logger.debug(log_json(linkedin_profile, self.PROFILE_LOG_FIELDS))
             
             # Analyze experience data
-            experience_analysis = self._analyze_experience(
-                linkedin_profile,
-                profile.company_name,
-                profile.position_title
-            )
+            if clean_targets is None:
+                clean_targets = (
+                    self._clean_text(profile.company_name),
+                    self._clean_text(profile.position_title)
+                )
+            experience_analysis = self._analyze_experience_clean(linkedin_profile, *clean_targets)
             
             # Log profile details
-            logger.debug("\nWorkflowMax Contact:")
-            logger.debug(f"    Name: {profile.name}")
-            logger.debug(f"    Company: {profile.company_name or 'N/A'}")
-            logger.debug(f"    Position: {profile.position_title or 'N/A'}")
-            
-            logger.debug("\nLinkedIn Profile:")
-            logger.debug(f"    Name: {linkedin_profile.get('firstName', '')} {linkedin_profile.get('lastName', '')}")
-            logger.debug(f"    Company: {experience_analysis['best_company'] or 'N/A'}")
-            logger.debug(f"    Title: {experience_analysis['best_title'] or 'N/A'}")
+            if debug:
+                logger.debug("\nWorkflowMax Contact:")
+                logger.debug(f"    Name: {profile.name}")
+                logger.debug(f"    Company: {profile.company_name or 'N/A'}")
+                logger.debug(f"    Position: {profile.position_title or 'N/A'}")
+                
+                logger.debug("\nLinkedIn Profile:")
+                logger.debug(f"    Name: {linkedin_profile.get('firstName', '')} {linkedin_profile.get('lastName', '')}")
+                logger.debug(f"    Company: {experience_analysis['best_company'] or 'N/A'}")
+                logger.debug(f"    Title: {experience_analysis['best_title'] or 'N/A'}")
             
             # Calculate name similarity
-            profile_name = self._clean_text(profile.name)
-            linkedin_name = self._clean_text(f"{linkedin_profile.get('firstName', '')} {linkedin_profile.get('lastName', '')}")
-            name_similarity = SequenceMatcher(None, profile_name, linkedin_name).ratio()
+            # Name parts are cleaned separately; cleaning is cached per string
+            # and the same parts come back for cached profiles
+            profile_name = _clean(profile.name)
+            linkedin_name = f"{_clean(linkedin_profile.get('firstName', ''))} {_clean(linkedin_profile.get('lastName', ''))}"
+            name_similarity = _name_similarity(profile_name, linkedin_name)
             
-            logger.debug(log_subsection("Name Comparison"))
-            logger.debug(f"    WorkflowMax: {profile_name}")
-            logger.debug(f"    LinkedIn: {linkedin_name}")
-            logger.debug(f"    Similarity: {name_similarity:.1%}")
+            if debug:
+                logger.debug(_SUBSECTION_NAME_COMPARISON)
+                logger.debug(f"    WorkflowMax: {profile_name}")
+                logger.debug(f"    LinkedIn: {linkedin_name}")
+                logger.debug(f"    Similarity: {name_similarity:.1%}")
             
             # Log experience matches
-            logger.debug(log_subsection("Experience Analysis"))
-            logger.debug(f"    Has Company Match: {experience_analysis['has_company_match']}")
-            logger.debug(f"    Has Title Match: {experience_analysis['has_title_match']}")
-            if experience_analysis['best_company']:
-                logger.debug(f"    Best Company: {experience_analysis['best_company']}")
-                logger.debug(f"    Company Similarity: {experience_analysis['company_similarity']:.1%}")
-            if experience_analysis['best_title']:
-                logger.debug(f"    Best Title: {experience_analysis['best_title']}")
-                logger.debug(f"    Title Similarity: {experience_analysis['title_similarity']:.1%}")
+            if debug:
+                logger.debug(_SUBSECTION_EXPERIENCE_ANALYSIS)
+                logger.debug(f"    Has Company Match: {experience_analysis['has_company_match']}")
+                logger.debug(f"    Has Title Match: {experience_analysis['has_title_match']}")
+                if experience_analysis['best_company']:
+                    logger.debug(f"    Best Company: {experience_analysis['best_company']}")
+                    logger.debug(f"    Company Similarity: {experience_analysis['company_similarity']:.1%}")
+                if experience_analysis['best_title']:
+                    logger.debug(f"    Best Title: {experience_analysis['best_title']}")
+                    logger.debug(f"    Title Similarity: {experience_analysis['title_similarity']:.1%}")
             
             # Calculate experience similarity score
             # Take the maximum of company and title similarity
@@ -237,137 +668,258 @@ class LinkedInService:
                 experience_analysis['title_similarity']
             )
             
-            # Check if both name and experience meet minimum thresholds
-            if name_similarity < self.NAME_THRESHOLD or experience_similarity < self.EXPERIENCE_THRESHOLD:
-                weighted_score = 0.0
-            else:
-                # Calculate weighted score only if both thresholds are met
-                weighted_score = (
-                    name_similarity * 0.6 +        # 60% weight for name
-                    experience_similarity * 0.4     # 40% weight for experience
-                )
+            weighted_score = self._combine_scores(name_similarity, experience_similarity)
+            
+            if debug:
+                logger.debug(_SUBSECTION_FINAL_SCORE)
+                logger.debug("    Component Scores:")
+                logger.debug(f"        Name:       {name_similarity:.1%} (threshold {self.NAME_THRESHOLD:.1%})")
+                logger.debug(f"        Experience: {experience_similarity:.1%} (threshold {self.EXPERIENCE_THRESHOLD:.1%})")
+                logger.debug(f"    Total Score: {weighted_score:.1%}")
+                logger.debug(f"    Required Score: {self.SIMILARITY_THRESHOLD:.1%}")
+                logger.debug(f"    Match Status: {'✓ PASS' if weighted_score >= self.SIMILARITY_THRESHOLD else '✗ FAIL'}")
+            
+            return weighted_score, experience_analysis
+    
+    def _combine_scores(self, name_similarity: float, experience_similarity: float) -> float:
+        """Combine name and experience similarity into the overall score.
+        
+        Args:
+            name_similarity: Name similarity, 0.0-1.0
+            experience_similarity: Best of company and title similarity, 0.0-1.0
+            
+        Returns:
+            Weighted score, or 0.0 unless both meet their minimum thresholds
+        """
+        # Check if both name and experience meet minimum thresholds
+        if name_similarity < self.NAME_THRESHOLD or experience_similarity < self.EXPERIENCE_THRESHOLD:
+            return 0.0
+        
+        # Calculate weighted score only if both thresholds are met
+        return (
+            name_similarity * 0.6 +        # 60% weight for name
+            experience_similarity * 0.4     # 40% weight for experience
+        )
+    
+    @with_logging
+    def batch_calculate_similarity(
+        self,
+        profiles: List[ProfileData],
+        linkedin_profiles: List[Dict]
+    ) -> List[List[float]]:
+        """Score every profile against every LinkedIn profile.
+        
+        Gives the same scores as calculate_similarity, but names, companies
+        and titles are each scored as one matrix (a single native call when
+        rapidfuzz and numpy are installed) instead of pair by pair.
+        
+        Args:
+            profiles: WorkflowMax profile data
+            linkedin_profiles: LinkedIn profile data
             
-            logger.debug(log_subsection("Final Score"))
-            logger.debug("    Component Scores:")
-            logger.debug(f"        Name:       {name_similarity:.1%} (threshold {self.NAME_THRESHOLD:.1%})")
-            logger.debug(f"        Experience: {experience_similarity:.1%} (threshold {self.EXPERIENCE_THRESHOLD:.1%})")
-            logger.debug(f"    Total Score: {weighted_score:.1%}")
-            logger.debug(f"    Required Score: {self.SIMILARITY_THRESHOLD:.1%}")
-            logger.debug(f"    Match Status: {'✓ PASS' if weighted_score >= self.SIMILARITY_THRESHOLD else '✗ FAIL'}")
+        Returns:
+            One row of weighted scores per profile, one column per LinkedIn
+            profile
+        """
+        with Timer("Batch calculate profile similarity", service='linkedin'):
+            cleaned = [_cleaned_experience(lp) for lp in linkedin_profiles]
+            # Only spread big matrices over all cores
+            large = len(profiles) * len(linkedin_profiles) >= _PARALLEL_SCORE_MIN_PAIRS
+            workers = -1 if large else 1
             
-            return weighted_score
+            name_scores = _score_matrix(
+                [_clean(p.name) for p in profiles],
+                [
+                    f"{_clean(lp.get('firstName', ''))} {_clean(lp.get('lastName', ''))}"
+                    for lp in linkedin_profiles
+                ],
+                _token_sort_score,
+                workers
+            )
+            company_scores = _best_scores(
+                [_clean(p.company_name) for p in profiles],
+                [c[1] for c in cleaned],
+                _token_set_score,
+                workers
+            )
+            title_scores = _best_scores(
+                [_clean(p.position_title) for p in profiles],
+                [c[3] for c in cleaned],
+                _weighted_score,
+                workers
+            )
+            
+            combine = self._combine_scores
+            return [
+                [
+                    combine(name / 100.0, max(company, title))
+                    for name, company, title in zip(name_row, company_row, title_row)
+                ]
+                for name_row, company_row, title_row in zip(name_scores, company_scores, title_scores)
+            ]
     
     @with_logging
     def find_linkedin_profile(self, profile: ProfileData) -> Optional[Dict[str, Any]]:
         """Search for matching LinkedIn profile."""
-        with Timer("Find LinkedIn profile"):
+        with Timer("Find LinkedIn profile", service='linkedin'):
             try:
-                logger.debug(log_section("LINKEDIN SEARCH"))
+                debug = logger.logger.isEnabledFor(logging.DEBUG)
+                if debug:
+                    logger.debug(_SECTION_LINKEDIN_SEARCH)
                 
                 # Split name into first and last name
-                name_parts = profile.name.split(maxsplit=1)
-                if len(name_parts) != 2:
+                search_key = self._search_key(profile)
+                if search_key is None:
                     logger.warning(f"Could not split name '{profile.name}' into first and last name")
                     return None
                 
-                first_name, last_name = name_parts
-                first_name = self._clean_text(first_name)
-                last_name = self._clean_text(last_name)
+                first_name, last_name = search_key
                 
-                logger.debug("\nSearch Parameters:")
-                logger.debug(f"    First Name: {first_name}")
-                logger.debug(f"    Last Name: {last_name}")
+                if debug:
+                    logger.debug("\nSearch Parameters:")
+                    logger.debug(f"    First Name: {first_name}")
+                    logger.debug(f"    Last Name: {last_name}")
                 
                 # Search by name only, including private profiles
-                search_results = self.api.search_people(
-                    keyword_first_name=first_name,
-                    keyword_last_name=last_name,
-                    include_private_profiles=True,
-                    limit=self.MAX_SEARCH_RESULTS
-                )
+                search_results = self._search_people(first_name, last_name)
                 
                 # Log raw search results
-                logger.debug("\nRaw Search Results:")
-                logger.debug(log_json(search_results))
+                if debug:
+                    logger.debug("\nRaw Search Results:")
+                    logger.debug(log_json(search_results))
                 
                 if not search_results:
-                    logger.debug(f"\nNo LinkedIn profiles found for {profile.name}")
+                    logger.debug("\nNo LinkedIn profiles found for %s", profile.name)
                     return None
                 
-                logger.debug(f"\nFound {len(search_results)} potential matches")
+                if debug:
+                    logger.debug(f"\nFound {len(search_results)} potential matches")
+                
+                # Targets are the same for every candidate; clean them once
+                clean_targets = (
+                    self._clean_text(profile.company_name),
+                    self._clean_text(profile.position_title)
+                )
+                clean_name = self._clean_text(profile.name)
                 
                 # Process results
                 best_match = None
                 best_score = 0.0
+                best_urn = None
                 
-                logger.debug(log_section("ANALYZING MATCHES"))
+                if debug:
+                    logger.debug(_SECTION_ANALYZING_MATCHES)
                 
-                for i, result in enumerate(search_results[:5]):
+                # Score every search result's name against the contact in
+                # one call rather than one comparison per result
+                name_scores = _score_matrix(
+                    [clean_name],
+                    [self._clean_text(result.get('name')) for result in search_results],
+                    _token_sort_score
+                )[0]
+                
+                # Pick the candidates worth a profile request
+                candidates = []
+                for i, result in enumerate(search_results):
                     profile_urn = result.get('urn_id')
                     if not profile_urn:
                         continue
                     
-                    logger.debug(f"\nAnalyzing Match #{i + 1}")
-                    logger.debug(f"URN: {profile_urn}")
-                    logger.debug("\nRaw Search Result:")
-                    logger.debug(log_json(result))
-                    
-                    linkedin_profile = self.api.get_profile(urn_id=profile_urn)
-                    logger.debug("\nRaw Profile Data:")
-                    logger.debug(log_json(linkedin_profile, self.PROFILE_LOG_FIELDS))
-                    
-                    score = self.calculate_similarity(profile, linkedin_profile)
+                    if debug:
+                        logger.debug(f"\nAnalyzing Match #{i + 1}")
+                        logger.debug(f"URN: {profile_urn}")
+                        logger.debug("\nRaw Search Result:")
+                        logger.debug(log_json(result))
                     
-                    # Get contact info for this profile
-                    contact_info = self.api.get_profile_contact_info(urn_id=profile_urn)
-                    logger.debug("\nRaw Contact Info:")
-                    logger.debug(log_json(contact_info))
+                    # A candidate can only match if its name does, and the
+                    # search result already carries the name: skip the
+                    # profile request for names that cannot reach the threshold
+                    result_name = result.get('name')
+                    if result_name:
+                        name_similarity = name_scores[i] / 100.0
+                        if name_similarity < self.NAME_THRESHOLD:
+                            if debug:
+                                logger.debug(f"Skipping {result_name}: name similarity {name_similarity:.1%}")
+                            continue
                     
-                    # Store match if score meets threshold
-                    if score > best_score:
-                        best_score = score
-                        experience_analysis = self._analyze_experience(
-                            linkedin_profile,
-                            profile.company_name,
-                            profile.position_title
-                        )
+                    candidates.append(profile_urn)
+                
+                # Profile requests are independent round-trips; overlap them
+                # and score the results in search order
+                with fan_out_pool(
+                    len(candidates),
+                    self.MAX_PROFILE_FETCHERS,
+                    name='linkedin-profile'
+                ) as pool:
+                    futures = [pool.submit(self._get_profile, urn) for urn in candidates]
+                    for profile_urn, future in zip(candidates, futures):
+                        linkedin_profile = future.result()
+                        if debug:
+                            logger.debug(f"\nRaw Profile Data ({profile_urn}):")
+                            logger.debug(log_json(linkedin_profile, self.PROFILE_LOG_FIELDS))
                         
-                        # Get profile URL from contact info or construct from public_id
-                        profile_url = contact_info.get('public_profile_url')
-                        if not profile_url and linkedin_profile.get('public_id'):
-                            profile_url = f"{self.LINKEDIN_BASE_URL}{linkedin_profile['public_id']}"
+                        score, experience_analysis = self.score_profile(profile, linkedin_profile, clean_targets)
                         
-                        best_match = {
-                            'url': profile_url,
-                            'score': score,
-                            'name': f"{linkedin_profile.get('firstName', '')} {linkedin_profile.get('lastName', '')}",
-                            'company': experience_analysis['best_company'],
-                            'title': experience_analysis['best_title'],
-                            'public_id': linkedin_profile.get('public_id')
-                        }
-                        logger.debug("\nNew best match found!")
-                        logger.debug(f"Score: {score:.1%}")
-                        logger.debug("Match Details:")
-                        logger.debug(log_json(best_match))
+                        # Store match if score meets threshold
+                        if score > best_score:
+                            best_score = score
+                            best_urn = profile_urn
+                            
+                            # Construct the URL from public_id for now; contact
+                            # info is only fetched for the final match
+                            profile_url = None
+                            if linkedin_profile.get('public_id'):
+                                profile_url = f"{self.LINKEDIN_BASE_URL}{linkedin_profile['public_id']}"
+                            
+                            best_match = {
+                                'url': profile_url,
+                                'score': score,
+                                'name': f"{linkedin_profile.get('firstName', '')} {linkedin_profile.get('lastName', '')}",
+                                'company': experience_analysis['best_company'],
+                                'title': experience_analysis['best_title'],
+                                'public_id': linkedin_profile.get('public_id')
+                            }
+                            if debug:
+                                logger.debug("\nNew best match found!")
+                                logger.debug(f"Score: {score:.1%}")
+                                logger.debug("Match Details:")
+                                logger.debug(log_json(best_match))
+                        
+                        # Nothing can meaningfully beat a near-perfect match;
+                        # drop fetches that have not started yet
+                        if score >= self.EXCELLENT_MATCH_SCORE:
+                            for pending in futures:
+                                pending.cancel()
+                            break
                 
                 # Return the best match if it meets the threshold
                 if best_match and best_match['score'] >= self.SIMILARITY_THRESHOLD:
-                    logger.debug(log_section("MATCH FOUND"))
-                    logger.debug(f"Found LinkedIn profile for {profile.name}")
-                    logger.debug(f"Score: {best_score:.1%}")
-                    logger.debug(f"Threshold: {self.SIMILARITY_THRESHOLD:.1%}")
-                    logger.debug(f"Status: ✓ PASS")
-                    logger.debug("Final Match Details:")
-                    logger.debug(log_json(best_match))
+                    # Prefer the public URL from contact info when it has one
+                    contact_info = self._get_contact_info(best_urn)
+                    if debug:
+                        logger.debug("\nRaw Contact Info:")
+                        logger.debug(log_json(contact_info))
+                    if contact_info and contact_info.get('public_profile_url'):
+                        best_match['url'] = contact_info['public_profile_url']
+                    
+                    if debug:
+                        logger.debug(_SECTION_MATCH_FOUND)
+                        logger.debug(f"Found LinkedIn profile for {profile.name}")
+                        logger.debug(f"Score: {best_score:.1%}")
+                        logger.debug(f"Threshold: {self.SIMILARITY_THRESHOLD:.1%}")
+                        logger.debug(f"Status: ✓ PASS")
+                        logger.debug("Final Match Details:")
+                        logger.debug(log_json(best_match))
                     return best_match
                 else:
-                    logger.debug(log_section("NO MATCH"))
-                    if best_match:
-                        logger.debug(f"Best match found but score ({best_score:.1%}) below threshold ({self.SIMILARITY_THRESHOLD:.1%})")
-                        logger.debug("Best Match Details:")
-                        logger.debug(log_json(best_match))
-                    else:
-                        logger.debug(f"No LinkedIn profiles found for {profile.name}")
+                    if debug:
+                        logger.debug(_SECTION_NO_MATCH)
+                        if best_match:
+                            logger.debug(f"Best match found but score ({best_score:.1%}) below threshold ({self.SIMILARITY_THRESHOLD:.1%})")
+                            logger.debug("Best Match Details:")
+                            logger.debug(log_json(best_match))
+                        else:
+                            logger.debug(f"No LinkedIn profiles found for {profile.name}")
                     return None
                     
             except Exception as e:
@@ -9,9 +9,10 @@ from ..core.exceptions import (
     WorkflowMaxError
 )
 from ..core.logging import get_logger, with_logging
-from ..core.utils import Timer
+from ..core.utils import Timer, fan_out_pool
 from ..models.relationship import Relationship
 from ..repositories import repositories
+from ..config import config
 
 logger = get_logger('workflowmax.services.relationship')
 
@@ -48,7 +49,7 @@ class RelationshipService:
             ResourceNotFoundError: If client not found
             WorkflowMaxError: If API request fails
         """
-        with Timer("Add client relationship"):
+        with Timer("Add client relationship", service='relationship'):
             # Verify clients exist
             if not repositories.contacts.exists(client_uuid):
                 raise ResourceNotFoundError('Client', client_uuid)
@@ -95,21 +96,23 @@ class RelationshipService:
             ResourceNotFoundError: If relationship not found
             WorkflowMaxError: If API request fails
         """
-        with Timer("Update client relationship"):
-            # Get existing relationship from client
-            relationships = []
-            for client in repositories.contacts.search():
-                client_relationships = repositories.relationships.get_relationships_for_client(
-                    client.uuid
-                )
-                relationships.extend(client_relationships)
-            
-            # Find relationship to update
-            relationship = None
-            for rel in relationships:
-                if rel.uuid == uuid:
-                    relationship = rel
-                    break
+        with Timer("Update client relationship", service='relationship'):
+            # Look the relationship up on the client it was last seen on
+            relationship = repositories.relationships.get_by_uuid(uuid)
+            
+            if relationship is None:
+                # Not seen yet: check clients one at a time, stopping at the
+                # first one that has it
+                for client in repositories.contacts.search():
+                    client_relationships = repositories.relationships.get_relationships_for_client(
+                        client.uuid
+                    )
+                    relationship = next(
+                        (rel for rel in client_relationships if rel.uuid == uuid),
+                        None
+                    )
+                    if relationship is not None:
+                        break
             
             if relationship is None:
                 raise ResourceNotFoundError('Relationship', uuid)
@@ -141,7 +144,7 @@ class RelationshipService:
             ResourceNotFoundError: If relationship not found
             WorkflowMaxError: If API request fails
         """
-        with Timer("Delete client relationship"):
+        with Timer("Delete client relationship", service='relationship'):
             return repositories.relationships.delete_relationship(uuid)
     
     @with_logging
@@ -163,7 +166,7 @@ class RelationshipService:
             ResourceNotFoundError: If client not found
             WorkflowMaxError: If API request fails
         """
-        with Timer("Get client relationships"):
+        with Timer("Get client relationships", service='relationship'):
             # Verify client exists
             if not repositories.contacts.exists(client_uuid):
                 raise ResourceNotFoundError('Client', client_uuid)
@@ -210,31 +213,47 @@ class RelationshipService:
             ResourceNotFoundError: If client not found
             WorkflowMaxError: If API request fails
         """
-        with Timer("Get relationship network"):
+        with Timer("Get relationship network", service='relationship'):
+            # Only the starting client needs checking; every other client
+            # in the network was reached through a relationship
+            if not repositories.contacts.exists(client_uuid):
+                raise ResourceNotFoundError('Client', client_uuid)
+            
             network = {client_uuid: []}
-            visited = {client_uuid}
+            fetch = repositories.relationships.get_relationships_for_client
             
-            def traverse(current_uuid: str, depth: int):
-                if depth >= max_depth:
-                    return
-                    
-                relationships = self.get_relationships(current_uuid)
+            # Breadth-first, one layer per depth; the clients in a layer are
+            # independent, so their relationships are fetched concurrently
+            layer = [client_uuid]
+            for depth in range(max_depth):
+                if not layer:
+                    break
                 
-                for rel in relationships:
-                    related_uuid = rel.related_client_uuid
-                    
-                    # Add to network
-                    network[current_uuid].append({
-                        'uuid': related_uuid,
-                        'type': rel.type,
-                        'depth': depth
-                    })
-                    
-                    # Traverse further if not visited
-                    if related_uuid not in visited:
-                        visited.add(related_uuid)
-                        network[related_uuid] = []
-                        traverse(related_uuid, depth + 1)
-            
-            traverse(client_uuid, 0)
+                with fan_out_pool(
+                    len(layer),
+                    config.api.rate_limit.concurrent_limit,
+                    name='relationship-network'
+                ) as pool:
+                    layer_relationships = list(pool.map(fetch, layer))
+                
+                next_layer = []
+                for current_uuid, relationships in zip(layer, layer_relationships):
+                    entries = network[current_uuid]
+                    for rel in relationships:
+                        related_uuid = rel.related_client_uuid
+                        
+                        # Add to network
+                        entries.append({
+                            'uuid': related_uuid,
+                            'type': rel.type,
+                            'depth': depth
+                        })
+                        
+                        # Traverse further if not visited
+                        if related_uuid not in network:
+                            network[related_uuid] = []
+                            next_layer.append(related_uuid)
+                
+                layer = next_layer
+            
             return network
@@ -2,18 +2,83 @@
 
 import os
 import json
-from typing import Optional, Dict, Any, Tuple
-from ..core.logging import get_logger, with_logging
-from ..core.utils import Timer
+import time
+import hashlib
+import threading
+from collections import deque
+from typing import Optional, Dict, Any, Tuple, Deque
+from ..config import config
+from ..core.logging import get_logger, with_logging, contact_uuid as contact_uuid_var
+from ..core.utils import Timer, fan_out_pool
 from ..core.exceptions import WorkflowMaxError
+from ..models import Contact
 from ..repositories import Repositories
-from .linkedin_service import LinkedInService, log_section, log_subsection
+from .linkedin_service import LinkedInService, log_section
 
 logger = get_logger('workflowmax.services.linkedin')
 
+# Fixed headers, built once
+_SECTION_BATCH_PROCESSING = log_section("BATCH PROCESSING CONTACTS")
+_SECTION_PROCESSING_COMPLETE = log_section("PROCESSING COMPLETE")
+
+# Returned by a contact lookup that raised
+_LOOKUP_FAILED = object()
+
+class _CircuitBreaker:
+    """Sliding window of recent contact lookup outcomes."""
+    
+    def __init__(self, window: int, failure_rate: float, min_lookups: int):
+        """Initialize breaker.
+        
+        Args:
+            window: Number of recent outcomes kept
+            failure_rate: Failure share above which the breaker trips
+            min_lookups: Outcomes needed before the breaker can trip
+        """
+        self._outcomes: Deque[bool] = deque(maxlen=window)
+        self._failure_rate = failure_rate
+        self._min_lookups = min_lookups
+        self.consecutive_successes = 0
+    
+    def __len__(self) -> int:
+        """Number of outcomes in the window."""
+        return len(self._outcomes)
+    
+    def record(self, success: bool) -> None:
+        """Record the outcome of one lookup."""
+        self._outcomes.append(success)
+        self.consecutive_successes = self.consecutive_successes + 1 if success else 0
+    
+    @property
+    def failures(self) -> int:
+        """Number of failed lookups in the window."""
+        return self._outcomes.count(False)
+    
+    @property
+    def tripped(self) -> bool:
+        """Whether too many recent lookups failed."""
+        return (
+            len(self._outcomes) >= self._min_lookups and
+            self.failures > self._failure_rate * len(self._outcomes)
+        )
+    
+    def clear(self) -> None:
+        """Forget recorded outcomes, e.g. after backing off."""
+        self._outcomes.clear()
+        self.consecutive_successes = 0
+
 class WorkflowMaxLinkedInService:
     """Service for matching WorkflowMax contacts with LinkedIn profiles."""
     
+    MATCH_CACHE_FILE = 'matches.json'  # Stored alongside the LinkedIn cookies
+    MATCH_CACHE_TTL = 180 * 24 * 3600  # Seconds before a contact is looked up again
+    NO_MATCH_CACHE_TTL = 30 * 24 * 3600  # Seconds before an unmatched contact is retried
+    BREAKER_WINDOW = 50  # Recent contact lookups considered by the circuit breaker
+    BREAKER_MIN_LOOKUPS = 10  # Lookups needed in the window before it can trip
+    BREAKER_FAILURE_RATE = 0.5  # Failure share above which the breaker trips
+    BREAKER_COOLDOWN = 30  # Seconds to pause after tripping
+    BREAKER_RESET_SUCCESSES = 5  # Consecutive successes before full concurrency returns
+    
     def __init__(
         self,
         linkedin_username: str,
@@ -40,6 +105,13 @@ class WorkflowMaxLinkedInService:
                 'cookies_dir': cookies_dir
             }
             self._linkedin: Optional[LinkedInService] = None
+            self._match_cache_path = os.path.join(
+                cookies_dir or LinkedInService.DEFAULT_CACHE_DIR,
+                self.MATCH_CACHE_FILE
+            )
+            self._match_cache: Optional[Dict[str, Dict[str, Any]]] = None
+            self._match_cache_dirty = False
+            self._match_cache_lock = threading.Lock()
             logger.info("WorkflowMax LinkedIn service initialized successfully")
             
         except Exception as e:
@@ -58,60 +130,189 @@ class WorkflowMaxLinkedInService:
             )
         return self._linkedin
     
-    @with_logging
-    def update_single_contact(
+    @staticmethod
+    def _match_cache_key(contact: Contact) -> str:
+        """Build the match cache key for a contact's identifying details."""
+        details = (contact.name, contact.company_name, contact.email)
+        return hashlib.sha1(json.dumps(details).encode('utf-8')).hexdigest()
+    
+    def _load_match_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Get the persisted match cache, reading it from disk on first use.
+        
+        Must be called with the match cache lock held.
+        """
+        if self._match_cache is None:
+            try:
+                with open(self._match_cache_path) as f:
+                    self._match_cache = json.load(f)
+            except FileNotFoundError:
+                self._match_cache = {}
+            except (OSError, ValueError) as e:
+                logger.warning("Ignoring unreadable LinkedIn match cache", error=str(e))
+                self._match_cache = {}
+        return self._match_cache
+    
+    def _save_match_cache(self) -> None:
+        """Write the match cache to disk if it has changed."""
+        with self._match_cache_lock:
+            if not self._match_cache_dirty:
+                return
+            
+            # Drop expired entries, then replace the file in one step so an
+            # interrupted run never leaves a truncated cache behind
+            now = time.time()
+            cache = {
+                key: entry for key, entry in self._match_cache.items()
+                if now - entry['scraped_at'] < self._cache_ttl(entry)
+            }
+            temp_path = f"{self._match_cache_path}.tmp"
+            try:
+                os.makedirs(os.path.dirname(self._match_cache_path) or '.', exist_ok=True)
+                with open(temp_path, 'w') as f:
+                    json.dump(cache, f)
+                os.replace(temp_path, self._match_cache_path)
+            except OSError as e:
+                logger.warning("Failed to save LinkedIn match cache", error=str(e))
+                return
+            
+            self._match_cache = cache
+            self._match_cache_dirty = False
+    
+    def _cache_ttl(self, entry: Dict[str, Any]) -> float:
+        """Get how long a match cache entry stays valid, in seconds."""
+        return self.NO_MATCH_CACHE_TTL if entry['score'] is None else self.MATCH_CACHE_TTL
+    
+    def _find_profile(self, contact: Contact, refresh_cache: bool = False) -> Optional[Dict[str, Any]]:
+        """Find a contact's LinkedIn profile, reusing a previous run's match.
+        
+        Matches are kept on disk for MATCH_CACHE_TTL, keyed by the contact's
+        name, company and email. Contacts with no match are cached too, for
+        the shorter NO_MATCH_CACHE_TTL, so they are not searched every run.
+        
+        Args:
+            contact: Contact to match
+            refresh_cache: Look the contact up again even if a cached match
+                exists (the new match is still cached)
+            
+        Returns:
+            Match dictionary, or None if no profile was found
+        """
+        key = self._match_cache_key(contact)
+        if not refresh_cache:
+            with self._match_cache_lock:
+                entry = self._load_match_cache().get(key)
+            if entry is not None and time.time() - entry['scraped_at'] < self._cache_ttl(entry):
+                if entry['score'] is None:
+                    logger.debug("Using cached LinkedIn no-match for %s", contact.name)
+                    return None
+                logger.debug("Using cached LinkedIn match for %s", contact.name)
+                return {field: value for field, value in entry.items() if field != 'scraped_at'}
+        
+        # Lookup failures raise, so None here is a genuine no-match
+        match = self.linkedin.find_linkedin_profile(contact)
+        with self._match_cache_lock:
+            self._load_match_cache()[key] = {
+                'score': match['score'] if match else None,
+                'url': match.get('url') if match else None,
+                'public_id': match.get('public_id') if match else None,
+                'scraped_at': time.time()
+            }
+            self._match_cache_dirty = True
+        return match
+    
+    def _match_contact(
         self,
         contact_uuid: str,
-        dry_run: bool = False
-    ) -> Optional[Dict[str, Any]]:
-        """Update LinkedIn profile for a single contact."""
-        try:
-            logger.debug(log_section("UPDATING CONTACT"))
+        refresh_cache: bool = False,
+        contact: Optional[Contact] = None
+    ) -> Optional[Tuple[Contact, Dict[str, Any], str]]:
+        """Find the LinkedIn profile to record for a contact.
+        
+        Args:
+            contact_uuid: Contact UUID
+            refresh_cache: Bypass cached LinkedIn matches
+            contact: Contact already loaded and known to have no LinkedIn
+                profile; skips fetching it again
             
+        Returns:
+            Tuple of (contact, match, profile URL), or None if the contact
+            already has a profile or no usable match was found
+        """
+        if contact is None:
             # Get contact
             logger.debug("\nFetching contact details...")
             contact = self.repositories.contacts.get_by_uuid(contact_uuid)
-            logger.debug(f"Retrieved contact: {contact.name}")
+            logger.debug("Retrieved contact: %s", contact.name)
             
             # Check existing LinkedIn profile
             current_linkedin = contact.get_custom_field_value('LINKEDIN PROFILE')
             if current_linkedin:
-                logger.info(log_subsection("Already Has LinkedIn Profile"))
-                logger.info(f"Contact: {contact.name}")
-                logger.info(f"LinkedIn: {current_linkedin}")
-                return None
-            
-            # Search for LinkedIn profile
-            match = self.linkedin.find_linkedin_profile(contact)
-            if not match:
-                logger.info(log_subsection("No Match Found"))
-                logger.info(f"No LinkedIn profile found for {contact.name}")
+                logger.info(
+                    "%s already has a LinkedIn profile", contact.name,
+                    url=current_linkedin
+                )
                 return None
-            
-            # Get profile URL or construct from public_id
-            profile_url = match.get('url')
-            if not profile_url and match.get('public_id'):
-                profile_url = f"{self.linkedin.LINKEDIN_BASE_URL}{match['public_id']}"
-            
-            # Skip update if no URL available
-            if not profile_url:
-                logger.info(log_subsection("No URL Available"))
-                logger.info(f"No LinkedIn URL available for {contact.name}")
+        
+        # Search for LinkedIn profile
+        match = self._find_profile(contact, refresh_cache)
+        if not match:
+            logger.info("No LinkedIn profile found for %s", contact.name)
+            return None
+        
+        # Get profile URL or construct from public_id
+        profile_url = match.get('url')
+        if not profile_url and match.get('public_id'):
+            profile_url = f"{LinkedInService.LINKEDIN_BASE_URL}{match['public_id']}"
+        
+        # Skip update if no URL available
+        if not profile_url:
+            logger.info("No LinkedIn URL available for %s", contact.name)
+            return None
+        
+        threshold = LinkedInService.SIMILARITY_THRESHOLD
+        logger.info(
+            "LinkedIn match found for %s", contact.name,
+            url=profile_url,
+            score=f"{match['score']:.1%}",
+            threshold=f"{threshold:.1%}",
+            status='✓ PASS' if match['score'] >= threshold else '✗ FAIL'
+        )
+        
+        return contact, match, profile_url
+    
+    @staticmethod
+    def _log_dry_run(contact: Contact, match: Dict[str, Any], profile_url: str) -> None:
+        """Log the update a dry run would have made."""
+        logger.info(
+            "Would update LinkedIn profile for %s", contact.name,
+            url=profile_url,
+            score=f"{match['score']:.1%}"
+        )
+    
+    @with_logging
+    def update_single_contact(
+        self,
+        contact_uuid: str,
+        dry_run: bool = False,
+        refresh_cache: bool = False,
+        contact: Optional[Contact] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Update LinkedIn profile for a single contact.
+        
+        Pass ``contact`` when the caller has already loaded it and checked
+        that it has no LinkedIn profile, to skip fetching it again.
+        """
+        token = contact_uuid_var.set(contact_uuid)
+        try:
+            result = self._match_contact(contact_uuid, refresh_cache, contact)
+            self._save_match_cache()
+            if result is None:
                 return None
-            
-            # Log match details
-            logger.info(log_subsection("Match Found"))
-            logger.info(f"Contact: {contact.name}")
-            logger.info(f"LinkedIn URL: {profile_url}")
-            logger.info(f"Score: {match['score']:.1%}")
-            logger.info(f"Threshold: {self.linkedin.SIMILARITY_THRESHOLD:.1%}")
-            logger.info(f"Status: {'✓ PASS' if match['score'] >= self.linkedin.SIMILARITY_THRESHOLD else '✗ FAIL'}")
+            contact, match, profile_url = result
             
             # Update contact if not dry run and score meets threshold
-            if not dry_run and match['score'] >= self.linkedin.SIMILARITY_THRESHOLD:
-                logger.debug(log_subsection("Updating Contact"))
-                logger.debug(f"Contact: {contact.name}")
-                logger.debug(f"LinkedIn URL: {profile_url}")
+            if not dry_run and match['score'] >= LinkedInService.SIMILARITY_THRESHOLD:
+                logger.debug("Updating LinkedIn profile for %s", contact.name, url=profile_url)
                 
                 # Update LinkedIn profile field
                 success = self.repositories.contacts.update_custom_field(
@@ -121,79 +322,142 @@ class WorkflowMaxLinkedInService:
                 )
                 
                 if success:
-                    logger.info(log_subsection("Update Successful"))
-                    logger.info(f"✓ Updated LinkedIn profile for {contact.name}")
+                    logger.info("✓ Updated LinkedIn profile for %s", contact.name)
                 else:
-                    logger.error(log_subsection("Update Failed"))
-                    logger.error(f"✗ Failed to update LinkedIn profile for {contact.name}")
+                    logger.error("✗ Failed to update LinkedIn profile for %s", contact.name)
                     return None
             else:
-                logger.info(log_subsection("Dry Run"))
-                logger.info(f"Would update LinkedIn profile for {contact.name}")
-                logger.info(f"URL: {profile_url}")
-                logger.info(f"Score: {match['score']:.1%}")
+                self._log_dry_run(contact, match, profile_url)
             
             return match
             
         except Exception as e:
             logger.error(f"Error updating contact {contact_uuid}", error=str(e))
             raise WorkflowMaxError(f"Failed to update contact {contact_uuid}") from e
+        finally:
+            contact_uuid_var.reset(token)
     
     @with_logging
     def update_missing_linkedin_profiles(
         self,
         batch_size: int = 10,
-        dry_run: bool = False
+        dry_run: bool = False,
+        refresh_cache: bool = False
     ) -> Tuple[int, int]:
-        """Update LinkedIn profile URLs for all contacts missing them."""
-        with Timer("Update missing LinkedIn profiles"):
+        """Update LinkedIn profile URLs for all contacts missing them.
+        
+        Matches found on earlier runs are reused for MATCH_CACHE_TTL, and
+        misses for NO_MATCH_CACHE_TTL; pass ``refresh_cache=True`` to look
+        every contact up again.
+        
+        A failed lookup is logged and skipped. If most recent lookups fail,
+        processing pauses for BREAKER_COOLDOWN and concurrency is halved,
+        stopping altogether once it is down to one worker.
+        """
+        with Timer("Update missing LinkedIn profiles", service='workflowmax_linkedin'):
             processed = 0
             updated = 0
-            page = 1
             
-            logger.debug(log_section("BATCH PROCESSING CONTACTS"))
+            logger.debug(_SECTION_BATCH_PROCESSING)
             
-            while True:
-                # Get batch of contacts
+            # Resolve the lazily created LinkedIn client before fanning out,
+            # so worker threads never race to initialize it
+            threshold = self.linkedin.SIMILARITY_THRESHOLD
+            
+            max_workers = workers = config.api.rate_limit.concurrent_limit
+            breaker = _CircuitBreaker(
+                self.BREAKER_WINDOW,
+                self.BREAKER_FAILURE_RATE,
+                self.BREAKER_MIN_LOOKUPS
+            )
+            
+            def match_contact(contact):
+                token = contact_uuid_var.set(contact.uuid)
                 try:
-                    logger.debug(log_subsection(f"Processing Batch {page}"))
-                    logger.debug(f"Batch size: {batch_size}")
-                    
-                    contacts = self.repositories.contacts.search(
-                        page=page,
-                        page_size=batch_size
+                    # The page's contact was already checked for a profile
+                    return self._match_contact(contact.uuid, refresh_cache, contact)
+                except Exception as e:
+                    logger.error(f"Error updating contact {contact.uuid}", error=str(e))
+                    return _LOOKUP_FAILED
+                finally:
+                    contact_uuid_var.reset(token)
+            
+            try:
+                # The profile check below needs each contact's custom fields
+                pages = self.repositories.contacts.iter_pages(batch_size, include_custom_fields=True)
+                for page, contacts in enumerate(pages, start=1):
+                    logger.debug(
+                        "Processing batch %d", page,
+                        batch_size=batch_size,
+                        contacts=len(contacts)
                     )
                     
-                    if not contacts:
-                        logger.debug("\nNo more contacts to process")
-                        break
+                    processed += len(contacts)
                     
-                    logger.debug(f"\nProcessing {len(contacts)} contacts...")
+                    # Only contacts without a LinkedIn profile need a lookup
+                    missing = [
+                        contact for contact in contacts
+                        if not contact.get_custom_field_value('LINKEDIN PROFILE')
+                    ]
+                    logger.debug(
+                        "%d contacts already have a LinkedIn profile",
+                        len(contacts) - len(missing)
+                    )
                     
-                    for contact in contacts:
-                        processed += 1
-                        logger.debug(f"\nContact {processed}: {contact.name}")
-                        
-                        # Check if LinkedIn profile is missing
-                        current_linkedin = contact.get_custom_field_value('LINKEDIN PROFILE')
-                        if current_linkedin:
-                            logger.debug("Already has LinkedIn profile")
-                            continue
-                        
-                        # Try to update the contact
-                        match = self.update_single_contact(contact.uuid, dry_run=dry_run)
-                        if match and match['score'] >= self.linkedin.SIMILARITY_THRESHOLD:
-                            updated += 1
-                            logger.debug("Successfully processed")
+                    # Look up the page's contacts concurrently, then write
+                    # all of its accepted matches in one bulk update
+                    pending = {}
+                    with fan_out_pool(len(missing), workers, name='linkedin-contacts') as pool:
+                        for result in pool.map(match_contact, missing):
+                            breaker.record(result is not _LOOKUP_FAILED)
+                            if result is None or result is _LOOKUP_FAILED:
+                                continue
+                            contact, match, profile_url = result
+                            accepted = match['score'] >= threshold
+                            if accepted and not dry_run:
+                                pending[contact.uuid] = (contact, profile_url)
+                            else:
+                                self._log_dry_run(contact, match, profile_url)
+                                if accepted:
+                                    updated += 1
                     
-                    page += 1
-                    logger.debug(f"\nCompleted batch {page - 1}")
+                    if pending:
+                        updated += self._write_profile_urls(pending)
+                    self._save_match_cache()
+                    logger.debug("\nCompleted batch %d", page)
                     
-                except WorkflowMaxError as e:
-                    logger.error("Error processing contacts batch", error=str(e))
-                    break
+                    # Most recent lookups failing means LinkedIn (or the
+                    # WorkflowMax API) is down; pause and slow down rather
+                    # than spend the rate limit on the remaining contacts
+                    if breaker.tripped:
+                        failures, lookups = breaker.failures, len(breaker)
+                        if workers == 1:
+                            logger.error(
+                                "%d of the last %d contact lookups failed; stopping",
+                                failures, lookups
+                            )
+                            break
+                        workers = max(1, workers // 2)
+                        logger.error(
+                            "%d of the last %d contact lookups failed; pausing %ds "
+                            "and reducing concurrency to %d",
+                            failures, lookups, self.BREAKER_COOLDOWN, workers
+                        )
+                        time.sleep(self.BREAKER_COOLDOWN)
+                        breaker.clear()
+                    elif workers < max_workers and breaker.consecutive_successes >= self.BREAKER_RESET_SUCCESSES:
+                        workers = max_workers
+                        logger.info("Contact lookups recovered; concurrency restored to %d", workers)
+                
+                else:
+                    logger.debug("\nNo more contacts to process")
+                
+            except WorkflowMaxError as e:
+                logger.error("Error processing contacts batch", error=str(e))
+            
+            self._save_match_cache()
             
-            logger.info(log_section("PROCESSING COMPLETE"))
+            logger.info(_SECTION_PROCESSING_COMPLETE)
             mode = "[DRY RUN] " if dry_run else ""
             success_rate = (updated/processed*100) if processed > 0 else 0.0
             
@@ -203,3 +467,29 @@ class WorkflowMaxLinkedInService:
             logger.info(f"    Success Rate: {success_rate:.1f}%")
             
             return processed, updated
+    
+    def _write_profile_urls(self, pending: Dict[str, Tuple[Contact, str]]) -> int:
+        """Record LinkedIn profile URLs for several contacts at once.
+        
+        Args:
+            pending: Dictionary mapping contact UUIDs to (contact, profile URL)
+            
+        Returns:
+            Number of contacts successfully updated
+        """
+        logger.debug("Updating %d contacts", len(pending))
+        
+        results = self.repositories.contacts.update_custom_fields_bulk({
+            uuid: {'LINKEDIN PROFILE': profile_url}
+            for uuid, (_, profile_url) in pending.items()
+        })
+        
+        updated = 0
+        for uuid, success in results.items():
+            name = pending[uuid][0].name
+            if success:
+                updated += 1
+                logger.info("✓ Updated LinkedIn profile for %s", name)
+            else:
+                logger.error("✗ Failed to update LinkedIn profile for %s", name)
+        return updated
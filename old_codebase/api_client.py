@@ -11,7 +11,7 @@ from urllib3.util.retry import Retry
 from urllib3.poolmanager import PoolManager
 import urllib3
 
-from .config import Config
+from .config import Config, get_config
 from .exceptions import (
     AuthenticationError,
     RateLimitError,
@@ -33,7 +33,7 @@ class RateLimiter:
         Args:
             config: Optional Config instance. If not provided, will create new one.
         """
-        self.config = config or Config()
+        self.config = config or get_config()
         rate_limit_config = self.config.get_rate_limit_config()
         
         self.concurrent_limit = rate_limit_config.concurrent_limit
@@ -130,7 +130,7 @@ class APIClient:
     
     def __init__(self):
         """Initialize the API client with configuration."""
-        self.config = Config()
+        self.config = get_config()
         api_config = self.config.get_api_config()
         
         self.base_url = api_config.base_url
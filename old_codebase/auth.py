@@ -12,7 +12,7 @@ from datetime import datetime, timezone
 from urllib.parse import urlencode, parse_qs
 from typing import Dict, Optional, Tuple
 from dataclasses import dataclass
-from .config import Config
+from .config import get_config
 from .exceptions import (
     AuthenticationError,
     TokenExpiredError,
@@ -55,7 +55,7 @@ class OAuthCallbackHandler(BaseHTTPRequestHandler):
                     raise AuthenticationError("Missing authorization code")
                 
                 code = query_components['code'][0]
-                config = Config()
+                config = get_config()
                 
                 # Exchange code for tokens
                 token_data = {
@@ -116,7 +116,7 @@ class OAuthManager:
     
     def __init__(self):
         """Initialize the OAuth manager."""
-        self.config = Config()
+        self.config = get_config()
         self.token_info: Optional[TokenInfo] = None
         
     def _generate_state(self) -> str:
@@ -1,15 +1,47 @@
 """Configuration management for WorkflowMax API client."""
 
 import os
-import yaml
-from typing import Dict, Any, Optional
-from dataclasses import dataclass
+import functools
+from typing import Dict, Any, Optional, Tuple
+from dataclasses import asdict, dataclass, fields, replace
 from .exceptions import ConfigurationError
 from .logging_config import get_logger
 
 logger = get_logger('workflowmax.config')
 
-@dataclass
+# Parsed config files keyed by path, with the modification time they were
+# parsed at; an edited file replaces its entry rather than adding one
+_parsed_files: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
+def _read_config_file(path: str) -> Dict[str, Any]:
+    """Parse a YAML config file, reusing the result while it is unchanged.
+    
+    yaml is imported here rather than at module level, since config.yml
+    is optional and most processes never need the parser.
+    
+    Args:
+        path: Path to the YAML file
+        
+    Returns:
+        Parsed configuration (empty if the file is empty)
+    """
+    key = os.path.abspath(path)
+    mtime = os.stat(path).st_mtime_ns
+    cached = _parsed_files.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    
+    import yaml
+    
+    # libyaml-backed loader when available, much faster than the
+    # pure-Python one
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    with open(path, 'r') as f:
+        parsed = yaml.load(f, Loader=loader) or {}
+    _parsed_files[key] = (mtime, parsed)
+    return parsed
+
+@dataclass(frozen=True, slots=True)
 class OAuth2Config:
     """OAuth2 configuration settings."""
     redirect_uri: str = 'http://localhost:8000/callback'
@@ -18,7 +50,7 @@ class OAuth2Config:
     cache_file: str = '.oauth_cache.json'
     scope: str = 'openid profile email workflowmax offline_access'
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class APIConfig:
     """API configuration settings."""
     base_url: str = 'https://api.workflowmax2.com'
@@ -27,7 +59,7 @@ class APIConfig:
     pool_connections: int = 200
     pool_maxsize: int = 200
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RateLimitConfig:
     """Rate limiting configuration."""
     concurrent_limit: int = 5
@@ -36,22 +68,14 @@ class RateLimitConfig:
     requests_per_second: float = 2.0
 
 class Config:
-    """Central configuration management."""
+    """Central configuration management.
     
-    _instance = None
+    Use get_config() to obtain the shared instance.
+    """
     
-    def __new__(cls):
-        """Singleton pattern to ensure only one config instance exists."""
-        if cls._instance is None:
-            cls._instance = super(Config, cls).__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
-
     def __init__(self):
-        """Initialize configuration if not already initialized."""
-        if not self._initialized:
-            self._load_config()
-            self._initialized = True
+        """Initialize configuration."""
+        self._load_config()
 
     def _load_config(self):
         """Load and validate configuration from multiple sources."""
@@ -64,8 +88,7 @@ class Config:
         config_file = 'config.yml'
         if os.path.exists(config_file):
             try:
-                with open(config_file, 'r') as f:
-                    file_config = yaml.safe_load(f) or {}
+                file_config = _read_config_file(config_file)
                 self._update_from_dict(file_config)
                 logger.info("Loaded configuration from config.yml")
             except Exception as e:
@@ -79,20 +102,15 @@ class Config:
 
     def _update_from_dict(self, config_dict: Dict[str, Any]):
         """Update configuration from dictionary."""
-        if 'oauth' in config_dict:
-            for key, value in config_dict['oauth'].items():
-                if hasattr(self.oauth, key):
-                    setattr(self.oauth, key, value)
-                    
-        if 'api' in config_dict:
-            for key, value in config_dict['api'].items():
-                if hasattr(self.api, key):
-                    setattr(self.api, key, value)
-                    
-        if 'rate_limit' in config_dict:
-            for key, value in config_dict['rate_limit'].items():
-                if hasattr(self.rate_limit, key):
-                    setattr(self.rate_limit, key, value)
+        for section in ('oauth', 'api', 'rate_limit'):
+            if section in config_dict:
+                current = getattr(self, section)
+                known = {f.name for f in fields(current)}
+                overrides = {
+                    key: value for key, value in config_dict[section].items()
+                    if key in known
+                }
+                setattr(self, section, replace(current, **overrides))
 
     def _load_from_env(self):
         """Load configuration from environment variables."""
@@ -102,11 +120,11 @@ class Config:
         
         # Override configs from env vars if present
         if api_url := os.getenv('WORKFLOWMAX_API_URL'):
-            self.api.base_url = api_url
+            self.api = replace(self.api, base_url=api_url)
             
         if max_retries := os.getenv('WORKFLOWMAX_MAX_RETRIES'):
             try:
-                self.api.max_retries = int(max_retries)
+                self.api = replace(self.api, max_retries=int(max_retries))
             except ValueError:
                 logger.warning(f"Invalid max_retries value in env: {max_retries}")
 
@@ -144,24 +162,16 @@ class Config:
     def to_dict(self) -> Dict[str, Any]:
         """Convert configuration to dictionary."""
         return {
-            'oauth': {
-                'redirect_uri': self.oauth.redirect_uri,
-                'auth_url': self.oauth.auth_url,
-                'token_url': self.oauth.token_url,
-                'cache_file': self.oauth.cache_file,
-                'scope': self.oauth.scope
-            },
-            'api': {
-                'base_url': self.api.base_url,
-                'max_retries': self.api.max_retries,
-                'timeout': self.api.timeout,
-                'pool_connections': self.api.pool_connections,
-                'pool_maxsize': self.api.pool_maxsize
-            },
-            'rate_limit': {
-                'concurrent_limit': self.rate_limit.concurrent_limit,
-                'minute_limit': self.rate_limit.minute_limit,
-                'daily_limit': self.rate_limit.daily_limit,
-                'requests_per_second': self.rate_limit.requests_per_second
-            }
+            'oauth': asdict(self.oauth),
+            'api': asdict(self.api),
+            'rate_limit': asdict(self.rate_limit)
         }
+
+@functools.lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Get the shared configuration, loading it on first use.
+    
+    Returns:
+        Config instance
+    """
+    return Config()
@@ -1,7 +1,14 @@
 """Custom field management for WorkflowMax API."""
 
 from typing import Dict, List, Any, Optional
-import xml.etree.ElementTree as ET
+
+try:
+    from lxml import etree as ET
+    _FIELDS_XPATH = ET.XPath('CustomFields/CustomField')
+except ImportError:
+    import xml.etree.ElementTree as ET
+    _FIELDS_XPATH = None
+
 from .xml_parser import XMLParser
 from .api_client import APIClient
 from .exceptions import WorkflowMaxAPIError
@@ -43,7 +50,7 @@ class CustomFieldManager:
                 logger.error(f"Failed to fetch custom field definitions: {response.status_code}")
                 raise WorkflowMaxAPIError(f"Failed to fetch custom field definitions: {response.status_code}")
                 
-            definitions_xml = ET.fromstring(response.text.encode('utf-8'))
+            definitions_xml = XMLParser.parse_response(response.content)
             self._definitions = XMLParser.parse_custom_field_definitions(definitions_xml)
             
             # Update definitions map
@@ -86,17 +93,19 @@ class CustomFieldManager:
             logger.error(f"Failed to fetch custom fields: {response.status_code}")
             raise WorkflowMaxAPIError(f"Failed to fetch custom fields: {response.status_code}")
             
-        custom_fields_xml = ET.fromstring(response.text.encode('utf-8'))
+        custom_fields_xml = XMLParser.parse_response(response.content)
         XMLParser.check_response(custom_fields_xml)
         
         custom_fields = []
-        custom_fields_elem = custom_fields_xml.find('CustomFields')
-        if custom_fields_elem is not None:
-            for field_elem in custom_fields_elem.findall('CustomField'):
-                field = XMLParser.parse_custom_field_value(field_elem)
-                if field.get('Name'):  # Only add fields with a name
-                    custom_fields.append(field)
-                    logger.debug(f"Parsed custom field: {field}")
+        if _FIELDS_XPATH is not None:
+            field_elems = _FIELDS_XPATH(custom_fields_xml)
+        else:
+            field_elems = custom_fields_xml.findall('CustomFields/CustomField')
+        for field_elem in field_elems:
+            field = XMLParser.parse_custom_field_value(field_elem)
+            if field.get('Name'):  # Only add fields with a name
+                custom_fields.append(field)
+                logger.debug(f"Parsed custom field: {field}")
                     
         return custom_fields
 
@@ -140,7 +149,7 @@ class CustomFieldManager:
             return False
             
         # Parse response and check status
-        response_xml = ET.fromstring(response.text.encode('utf-8'))
+        response_xml = XMLParser.parse_response(response.content)
         try:
             XMLParser.check_response(response_xml)
             logger.info(f"Successfully updated custom field '{field_name}' for contact {contact_uuid}")
@@ -2,8 +2,9 @@
 
 import functools
 import logging
-from typing import Type, Callable, Any, Union, Tuple
-from requests.exceptions import RequestException
+import random
+import time
+from typing import Type, Callable, Any, Union, Tuple, Optional
 
 logger = logging.getLogger('workflowmax.exceptions')
 
@@ -52,15 +53,23 @@ class XMLParsingError(WorkflowMaxAPIError):
 
 def handle_api_errors(
     retries: int = 3,
-    retry_exceptions: Tuple[Type[Exception], ...] = (RateLimitError, RequestException),
-    exclude_exceptions: Tuple[Type[Exception], ...] = (AuthenticationError, ValidationError)
+    retry_exceptions: Optional[Tuple[Type[Exception], ...]] = None,
+    exclude_exceptions: Tuple[Type[Exception], ...] = (AuthenticationError, ValidationError),
+    backoff_base: float = 0.5,
+    backoff_cap: float = 30.0
 ) -> Callable:
     """Decorator for handling API errors with retries.
     
+    Retries wait with jittered exponential backoff. A RateLimitError that
+    reports when the limit resets waits at least that long (up to the cap).
+    
     Args:
         retries: Number of times to retry the operation
-        retry_exceptions: Exceptions that should trigger a retry
+        retry_exceptions: Exceptions that should trigger a retry. Defaults
+            to RateLimitError and requests' RequestException.
         exclude_exceptions: Exceptions that should not be retried
+        backoff_base: Delay in seconds before the first retry
+        backoff_cap: Maximum delay in seconds between attempts
         
     Returns:
         Callable: Decorated function
@@ -70,6 +79,11 @@ def handle_api_errors(
         def make_api_call():
             # API call implementation
     """
+    if retry_exceptions is None:
+        # Imported here so that importing this module doesn't load requests
+        from requests.exceptions import RequestException
+        retry_exceptions = (RateLimitError, RequestException)
+    
     def decorator(func: Callable) -> Callable:
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
@@ -86,11 +100,17 @@ def handle_api_errors(
                     
                 except retry_exceptions as e:
                     last_exception = e
-                    if attempt < retries - 1:  # Don't log on last attempt
+                    if attempt < retries - 1:  # Don't log or wait after the last attempt
+                        delay = min(backoff_cap, backoff_base * 2 ** attempt * random.uniform(0.5, 1.5))
+                        reset_time = getattr(e, 'reset_time', None)
+                        if reset_time:
+                            delay = max(delay, min(reset_time, backoff_cap))
                         logger.warning(
                             f"{func.__name__} failed with {type(e).__name__}, "
-                            f"attempt {attempt + 1}/{retries}: {str(e)}"
+                            f"attempt {attempt + 1}/{retries}: {str(e)}; "
+                            f"retrying in {delay:.1f}s"
                         )
+                        time.sleep(delay)
                     continue
                     
                 except Exception as e:
@@ -110,6 +130,31 @@ def handle_api_errors(
         return wrapper
     return decorator
 
+def _raise_not_found(response: Any) -> None:
+    raise ResourceNotFoundError(f"Resource not found: {response.url}")
+
+def _raise_unauthorized(response: Any) -> None:
+    raise AuthenticationError("Authentication failed")
+
+def _raise_forbidden(response: Any) -> None:
+    raise AuthenticationError("Access forbidden")
+
+def _raise_rate_limited(response: Any) -> None:
+    reset_time = response.headers.get('X-RateLimit-Reset')
+    raise RateLimitError(
+        "Rate limit exceeded",
+        reset_time=int(reset_time) if reset_time else None
+    )
+
+# Status codes with a dedicated exception; others fall back to the
+# generic server/request errors in validate_response
+_STATUS_HANDLERS = {
+    404: _raise_not_found,
+    401: _raise_unauthorized,
+    403: _raise_forbidden,
+    429: _raise_rate_limited,
+}
+
 def validate_response(func: Callable) -> Callable:
     """Decorator for validating API responses.
     
@@ -122,37 +167,23 @@ def validate_response(func: Callable) -> Callable:
     def wrapper(*args: Any, **kwargs: Any) -> Any:
         response = func(*args, **kwargs)
         
-        if not hasattr(response, 'status_code'):
+        status_code = getattr(response, 'status_code', None)
+        if status_code is None or status_code < 400:
             return response
             
-        if response.status_code == 404:
-            raise ResourceNotFoundError(f"Resource not found: {response.url}")
-            
-        if response.status_code == 401:
-            raise AuthenticationError("Authentication failed")
-            
-        if response.status_code == 403:
-            raise AuthenticationError("Access forbidden")
-            
-        if response.status_code == 429:
-            reset_time = response.headers.get('X-RateLimit-Reset')
-            raise RateLimitError(
-                "Rate limit exceeded",
-                reset_time=int(reset_time) if reset_time else None
-            )
-            
-        if response.status_code >= 500:
-            raise WorkflowMaxAPIError(
-                f"Server error: {response.status_code}",
-                status_code=response.status_code
-            )
+        handler = _STATUS_HANDLERS.get(status_code)
+        if handler is not None:
+            handler(response)
             
-        if not response.ok:
+        if status_code >= 500:
             raise WorkflowMaxAPIError(
-                f"API request failed: {response.status_code}",
-                status_code=response.status_code
+                f"Server error: {status_code}",
+                status_code=status_code
             )
             
-        return response
+        raise WorkflowMaxAPIError(
+            f"API request failed: {status_code}",
+            status_code=status_code
+        )
         
     return wrapper
@@ -1,10 +1,12 @@
 """Main LinkedIn profile fetching logic for MTD's WorkflowMax 2 API client."""
 
 import asyncio
-from typing import Dict, List, Optional, Generator, AsyncGenerator, Callable
+import threading
+from io import BytesIO
+from typing import Dict, List, Optional, Generator, AsyncGenerator, Callable, Iterator, Tuple
 from concurrent.futures import ThreadPoolExecutor
 from functools import partial
-from cachetools import TTLCache, cached
+from cachetools import LRUCache
 from lxml import etree
 from tqdm import tqdm
 
@@ -16,35 +18,42 @@ from . import metrics
 # Set up logger for this module
 logger = get_logger('workflowmax.linkedin_fetcher')
 
-# Configure caches with TTL of 1 hour (3600 seconds)
-CUSTOM_FIELDS_CACHE = TTLCache(maxsize=5000, ttl=3600)  # Increased cache size
-XML_CACHE = TTLCache(maxsize=500, ttl=3600)  # Increased cache size
+# Contact custom fields don't change during a run, so entries are only
+# evicted to make room
+CUSTOM_FIELDS_CACHE = LRUCache(maxsize=8192)
+# cachetools caches aren't thread-safe; held only around cache access
+_CUSTOM_FIELDS_CACHE_LOCK = threading.Lock()
+_CUSTOM_FIELDS_CACHE_HITS = metrics.CACHE_HITS.labels(cache_name='contact_custom_fields')
+_CUSTOM_FIELDS_CACHE_MISSES = metrics.CACHE_MISSES.labels(cache_name='contact_custom_fields')
 
 class LinkedInProfileFetcher:
     """Main class for fetching LinkedIn profiles from WorkflowMax."""
     
+    # XPath expressions, compiled once when the class is defined
+    custom_field_xpath = etree.XPath(".//CustomFieldDefinition")
+    client_xpath = etree.XPath(".//Client")
+    contact_field_xpath = etree.XPath(".//CustomField")
+    value_xpath = etree.XPath(".//Value/text()|.//LinkURL/text()|.//Text/text()|.//Boolean/text()|.//Number/text()|.//Decimal/text()")
+    name_xpath = etree.XPath(".//Name/text()")
+    
     def __init__(self, api_client: APIClient, config: Dict):
         """Initialize the LinkedIn profile fetcher."""
         self.api_client = api_client
         self.config = config
         
-        # Pre-compile XPath expressions for better performance
-        self.custom_field_xpath = etree.XPath(".//CustomFieldDefinition")
-        self.client_xpath = etree.XPath(".//Client")
-        self.value_xpath = etree.XPath(".//Value/text()|.//LinkURL/text()|.//Text/text()|.//Boolean/text()|.//Number/text()|.//Decimal/text()")
-        self.name_xpath = etree.XPath(".//Name/text()")
-        
         # Initialize caches
         self.custom_fields_cache = CUSTOM_FIELDS_CACHE
-        self.xml_cache = XML_CACHE
         
         # Batch processing settings
         self.batch_size = 50  # Batch size for contacts
-        self.max_workers = config.get('max_workers', 40)  # Increased default workers
         self.page_size = 250  # Page size for client list
         
-        # Create a single thread pool for reuse
-        self.executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        # The API client lets at most concurrent_limit requests through at
+        # once; threads beyond that would only poll its rate limiter
+        self.max_workers = min(
+            config.get('max_workers', 40),
+            api_client.rate_limiter.concurrent_limit
+        )
     
     def _parse_xml(self, xml_text: str) -> etree._Element:
         """Parse XML text using lxml for better performance."""
@@ -54,6 +63,39 @@ class LinkedInProfileFetcher:
             logger.error("Failed to parse XML: %s", e)
             raise
     
+    def _iter_page_clients(self, content: bytes, totals: Dict[str, str]) -> Iterator[Client]:
+        """Stream the clients in a client list response.
+        
+        Each Client element is cleared, and dropped from its parent, once it
+        has been turned into a Client, so a page never sits in memory as a
+        whole tree.
+        
+        Args:
+            content: Raw client list response body.
+            totals: Filled in with the response's TotalRecords and Page
+                values as they are parsed.
+            
+        Yields:
+            Client: Each client on the page, in document order.
+        """
+        events = etree.iterparse(
+            BytesIO(content),
+            tag=('Client', 'TotalRecords', 'Page'),
+            no_network=True
+        )
+        for _, elem in events:
+            if elem.tag == 'Client':
+                # Only list entries; clearing a Client nested inside one
+                # would strip data from the entry being built
+                if elem.getparent().tag != 'Clients':
+                    continue
+                yield Client(elem)
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+            else:
+                totals[elem.tag] = elem.text
+    
     def get_custom_field_definitions(self) -> List[CustomField]:
         """Get all custom field definitions with caching."""
         logger.info("Fetching custom field definitions")
@@ -92,15 +134,20 @@ class LinkedInProfileFetcher:
         """Get custom fields for a contact with caching."""
         try:
             # Check cache first
-            if contact_uuid in self.custom_fields_cache:
-                return self.custom_fields_cache[contact_uuid]
+            with _CUSTOM_FIELDS_CACHE_LOCK:
+                custom_fields = self.custom_fields_cache.get(contact_uuid)
+            if custom_fields is not None:
+                _CUSTOM_FIELDS_CACHE_HITS.inc()
+                return custom_fields
+            _CUSTOM_FIELDS_CACHE_MISSES.inc()
             
             response = self.api_client.get(f'client.api/contact/{contact_uuid}/customfield')
             custom_fields_xml = self._parse_xml(response.text)
             custom_fields = []
             
-            for field in custom_fields_xml.findall('.//CustomField'):
-                names = self.name_xpath(field)
+            name_xpath = self.name_xpath
+            for field in self.contact_field_xpath(custom_fields_xml):
+                names = name_xpath(field)
                 if names:
                     name = names[0]
                     field_value = self.get_field_value(field)
@@ -110,7 +157,8 @@ class LinkedInProfileFetcher:
                     })
             
             # Cache the result
-            self.custom_fields_cache[contact_uuid] = custom_fields
+            with _CUSTOM_FIELDS_CACHE_LOCK:
+                self.custom_fields_cache[contact_uuid] = custom_fields
             return custom_fields
             
         except Exception as e:
@@ -145,10 +193,15 @@ class LinkedInProfileFetcher:
             return None
     
     def process_contact(self, contact: Contact, client: Client, 
-                       linkedin_field: CustomField) -> Optional[Dict]:
-        """Process a single contact."""
+                       linkedin_field: CustomField,
+                       custom_fields: Optional[List[Dict[str, str]]] = None) -> Optional[Dict]:
+        """Process a single contact.
+        
+        The contact's custom fields are fetched unless already passed in.
+        """
         try:
-            custom_fields = self.get_contact_custom_fields(contact.uuid)
+            if custom_fields is None:
+                custom_fields = self.get_contact_custom_fields(contact.uuid)
             contact.custom_fields = custom_fields
             
             # Check if LinkedIn field exists and has a value
@@ -181,6 +234,46 @@ class LinkedInProfileFetcher:
             logger.error("Failed to process contact %s: %s", contact.name, str(e))
             return None
     
+    def _process_contacts(self, contacts: List[Tuple[Contact, Client]],
+                          linkedin_field: CustomField) -> Iterator[Dict]:
+        """Process a batch of contacts.
+        
+        The custom fields of every contact in the batch are fetched
+        concurrently first, then each contact is checked against them.
+        
+        Args:
+            contacts: (contact, client) pairs to process.
+            linkedin_field: The LinkedIn custom field definition.
+            
+        Yields:
+            Dict: Profile of each contact without a LinkedIn URL, in input order.
+        """
+        if not contacts:
+            return
+        
+        # A contact with positions at several clients is listed once per
+        # client; fetch each one's fields once, skipping any still cached
+        cache = self.custom_fields_cache
+        with _CUSTOM_FIELDS_CACHE_LOCK:
+            pending = list(dict.fromkeys(
+                contact.uuid for contact, _ in contacts if contact.uuid not in cache
+            ))
+        fields_by_uuid = {}
+        if pending:
+            workers = min(self.max_workers, len(pending))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                fields_by_uuid = dict(zip(
+                    pending,
+                    executor.map(self.get_contact_custom_fields, pending)
+                ))
+        
+        for contact, client in contacts:
+            result = self.process_contact(
+                contact, client, linkedin_field, fields_by_uuid.get(contact.uuid)
+            )
+            if result:
+                yield result
+    
     def fetch_profiles(self, limit: Optional[int] = None, start_page: int = 1,
                       client_name: Optional[str] = None, contact_name: Optional[str] = None,
                       progress_callback: Optional[Callable] = None) -> List[Dict]:
@@ -231,24 +324,13 @@ class LinkedInProfileFetcher:
                     contacts = contacts[:limit]
                 
                 # Process contacts in parallel
-                futures = []
-                for contact in contacts:
-                    futures.append(
-                        self.executor.submit(
-                            self.process_contact,
-                            contact,
-                            client,
-                            linkedin_field
-                        )
-                    )
-                
-                # Collect results as they complete
-                for future in futures:
-                    result = future.result()
-                    if result:
-                        linkedin_profiles.append(result)
-                        if progress_callback:
-                            progress_callback()
+                for result in self._process_contacts(
+                    [(contact, client) for contact in contacts],
+                    linkedin_field
+                ):
+                    linkedin_profiles.append(result)
+                    if progress_callback:
+                        progress_callback()
                 
             else:
                 # Original implementation for fetching all clients
@@ -262,15 +344,10 @@ class LinkedInProfileFetcher:
                         'detailed': 'true'
                     })
                     
-                    clients_xml = self._parse_xml(response.text)
-                    total_records = int(clients_xml.find('.//TotalRecords').text)
-                    current_page = int(clients_xml.find('.//Page').text)
-                    
                     # Collect all contacts first
+                    totals = {}
                     all_contacts = []
-                    for client_elem in self.client_xpath(clients_xml):
-                        client = Client(client_elem)
-                        
+                    for client in self._iter_page_clients(response.content, totals):
                         if contact_name:
                             client.contacts = [c for c in client.contacts 
                                             if contact_name.lower() in c.name.lower()]
@@ -287,29 +364,18 @@ class LinkedInProfileFetcher:
                             break
                     
                     # Process contacts in parallel
-                    futures = []
-                    for contact, client in all_contacts:
-                        futures.append(
-                            self.executor.submit(
-                                self.process_contact,
-                                contact,
-                                client,
-                                linkedin_field
-                            )
-                        )
-                    
-                    # Collect results as they complete
-                    for future in futures:
-                        result = future.result()
-                        if result:
-                            linkedin_profiles.append(result)
-                            if progress_callback:
-                                progress_callback()
+                    for result in self._process_contacts(all_contacts, linkedin_field):
+                        linkedin_profiles.append(result)
+                        if progress_callback:
+                            progress_callback()
                     
-                    # Check pagination
-                    if contact_name and linkedin_profiles:
+                    # Check pagination; a page cut short by the limit may not
+                    # have been read as far as its totals
+                    if not has_more or (contact_name and linkedin_profiles):
                         has_more = False
                     else:
+                        total_records = int(totals['TotalRecords'])
+                        current_page = int(totals['Page'])
                         has_more = ((current_page * self.page_size) < total_records and 
                                   (not limit or contacts_processed < limit))
                         page += 1
@@ -320,8 +386,3 @@ class LinkedInProfileFetcher:
         
         logger.info("Completed profile fetch: processed %d contacts", len(linkedin_profiles))
         return linkedin_profiles
-    
-    def __del__(self):
-        """Clean up resources."""
-        if hasattr(self, 'executor'):
-            self.executor.shutdown(wait=False)
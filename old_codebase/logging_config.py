@@ -3,6 +3,7 @@
 import os
 import sys
 import logging
+import threading
 import logging.handlers
 from datetime import datetime
 from typing import Optional
@@ -25,30 +26,53 @@ class CustomFormatter(logging.Formatter):
         logging.CRITICAL: bold_red + "%(asctime)s - %(name)s - %(levelname)s - %(message)s" + reset
     }
     
+    # One formatter per level, built once rather than per record
+    FORMATTERS = {
+        level: logging.Formatter(fmt, datefmt='%Y-%m-%d %H:%M:%S')
+        for level, fmt in FORMATS.items()
+    }
+    
     def format(self, record):
         """Format the log record with appropriate color."""
-        log_fmt = self.FORMATS.get(record.levelno)
-        formatter = logging.Formatter(log_fmt, datefmt='%Y-%m-%d %H:%M:%S')
+        formatter = self.FORMATTERS.get(record.levelno)
+        if formatter is None:
+            formatter = logging.Formatter(self.FORMATS.get(record.levelno), datefmt='%Y-%m-%d %H:%M:%S')
         return formatter.format(record)
 
+class FileFormatter(logging.Formatter):
+    """Formatter for file output that formats each record only once.
+    
+    The formatted text is cached on the record, so every file handler sharing
+    this formatter writes the same string without re-formatting it.
+    """
+    
+    def format(self, record):
+        """Format the log record, reusing a previously formatted result."""
+        cached = record.__dict__.get('_file_formatted')
+        if cached is None:
+            cached = super().format(record)
+            record._file_formatted = cached
+        return cached
+
+# Shared by all file handlers
+FILE_FORMATTER = FileFormatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
 class LogManager:
     """Manages logging configuration and setup."""
     
     _instance = None
-    _initialized = False
     
     def __new__(cls):
-        """Singleton pattern to ensure only one log manager exists."""
-        if cls._instance is None:
-            cls._instance = super(LogManager, cls).__new__(cls)
+        """Return the module-level log manager.
+        
+        Logging is configured once when this module is imported, so there is
+        no initialization state to check (or race on) here.
+        """
         return cls._instance
     
-    def __init__(self):
-        """Initialize logging if not already initialized."""
-        if not self._initialized:
-            self._setup_logging()
-            self._initialized = True
-    
     def _setup_logging(self):
         """Set up logging configuration."""
         # Create logs directory
@@ -96,10 +120,7 @@ class LogManager:
             logs_dir: Directory for log files
         """
         # Detailed formatter for file output
-        file_formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
+        file_formatter = FILE_FORMATTER
         
         # Main log file with rotation
         main_handler = logging.handlers.RotatingFileHandler(
@@ -137,9 +158,6 @@ def get_logger(name: str) -> logging.Logger:
         >>> logger.info('API request successful')
         >>> logger.error('API request failed', exc_info=True)
     """
-    # Ensure LogManager is initialized
-    LogManager()
-    
     # Get and return logger
     logger = logging.getLogger(name)
     
@@ -170,5 +188,8 @@ class ContextFilter(logging.Filter):
         
         return True
 
-# Initialize logging when module is imported
-LogManager()
+# Initialize logging when module is imported. Module import is serialized by
+# the import lock, so setup runs exactly once.
+_MANAGER = object.__new__(LogManager)
+_MANAGER._setup_logging()
+LogManager._instance = _MANAGER
@@ -1,16 +1,88 @@
 """Base XML parsing functionality for WorkflowMax API responses."""
 
-import xml.etree.ElementTree as ET
+import re
+import sys
 from typing import Optional, Dict, Any, List
 from datetime import datetime
+from xml.sax.saxutils import escape
+
+try:
+    from lxml import etree as ET
+    _HAS_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    _HAS_LXML = False
+
 from .exceptions import WorkflowMaxAPIError
 from .logging_config import get_logger
 
 logger = get_logger('workflowmax.xml_parser')
 
+# Value element tag -> (priority rank, field type, value converter)
+_TYPE_MAP = {
+    'Boolean': (0, 'Boolean', str.lower),
+    'Date': (1, 'Date', None),
+    'Decimal': (2, 'Decimal', None),
+    'Number': (3, 'Number', None),
+    'Text': (4, 'Text', None),
+    'LinkURL': (5, 'Link', None),
+}
+
+# Field definition type -> element carrying the value in update payloads
+_VALUE_ELEMENTS = {
+    'Checkbox': 'Boolean',
+    'Date': 'Date',
+    'Decimal': 'Decimal',
+    'Number': 'Number',
+    'Link': 'LinkURL',
+}
+
+if _HAS_LXML:
+    # Strict parser shared by all responses; never resolves network entities
+    _RESPONSE_PARSER = ET.XMLParser(recover=False, no_network=True)
+    _DEFS_XPATH = ET.XPath('./CustomFieldDefinitions/CustomFieldDefinition')
+else:
+    _RESPONSE_PARSER = None
+    _DEFS_XPATH = None
+
+# Definition child tags, shared by every definition lookup
+_TAG_NAME, _TAG_TYPE, _TAG_UUID, _TAG_USECONTACT = map(
+    sys.intern, ('Name', 'Type', 'UUID', 'UseContact')
+)
+
+_DATE_RE = re.compile(r'^(\d{4})-(\d{2})-(\d{2})$')
+
+def _validate_ymd(value: str) -> bool:
+    """Check that a string is a valid YYYY-MM-DD date without strptime."""
+    match = _DATE_RE.match(value)
+    if match is None:
+        return False
+    year, month, day = int(match[1]), int(match[2]), int(match[3])
+    if not (1 <= month <= 12 and 1 <= day <= 31):
+        return False
+    if day > 28:
+        # Only month-end days need the calendar
+        try:
+            datetime(year, month, day)
+        except ValueError:
+            return False
+    return True
+
 class XMLParser:
     """Base class for XML parsing operations."""
     
+    @staticmethod
+    def parse_response(content: bytes) -> ET.Element:
+        """Parse a raw API response body.
+        
+        Args:
+            content: Undecoded response body
+            
+        Returns:
+            ET.Element: Root element of the response
+        """
+        return ET.fromstring(content, _RESPONSE_PARSER)
+
     @staticmethod
     def get_text(element: Optional[ET.Element], tag_name: str) -> Optional[str]:
         """Extract text from XML elements safely.
@@ -24,8 +96,8 @@ class XMLParser:
         """
         if element is None:
             return None
-        tag = element.find(tag_name)
-        return tag.text if tag is not None else None
+        # findtext returns '' for an empty element; keep reporting None there
+        return element.findtext(tag_name) or None
 
     @staticmethod
     def check_response(response_xml: ET.Element) -> bool:
@@ -57,34 +129,25 @@ class XMLParser:
         Returns:
             Dict[str, Any]: Dictionary containing the parsed field data
         """
-        field = {
-            'Name': XMLParser.get_text(field_elem, 'Name'),
-            'UUID': XMLParser.get_text(field_elem, 'UUID')
-        }
+        field = {'Name': None, 'UUID': None}
         
-        # Check each possible value type
-        if (value := XMLParser.get_text(field_elem, 'Boolean')) is not None:
-            field['Type'] = 'Boolean'
-            field['Value'] = value.lower()
-        elif (value := XMLParser.get_text(field_elem, 'Date')) is not None:
-            field['Type'] = 'Date'
-            try:
-                date_obj = datetime.strptime(value, '%Y-%m-%d')
-                field['Value'] = date_obj.strftime('%Y-%m-%d')
-            except ValueError:
-                field['Value'] = value
-        elif (value := XMLParser.get_text(field_elem, 'Decimal')) is not None:
-            field['Type'] = 'Decimal'
-            field['Value'] = value
-        elif (value := XMLParser.get_text(field_elem, 'Number')) is not None:
-            field['Type'] = 'Number'
-            field['Value'] = value
-        elif (value := XMLParser.get_text(field_elem, 'Text')) is not None:
-            field['Type'] = 'Text'
-            field['Value'] = value
-        elif (value := XMLParser.get_text(field_elem, 'LinkURL')) is not None:
-            field['Type'] = 'Link'
-            field['Value'] = value
+        # Single pass over the children: pick up Name/UUID and the value
+        # element with the highest priority (lowest rank)
+        best = None
+        for child in field_elem:
+            tag = child.tag
+            if tag in field:
+                field[tag] = child.text
+                continue
+            entry = _TYPE_MAP.get(tag)
+            if entry is not None and child.text is not None:
+                if best is None or entry[0] < best[0][0]:
+                    best = (entry, child.text)
+        
+        if best is not None:
+            (_, field_type, convert), value = best
+            field['Type'] = field_type
+            field['Value'] = convert(value) if convert else value
         else:
             field['Type'] = 'Text'
             field['Value'] = ''
@@ -104,27 +167,35 @@ class XMLParser:
         XMLParser.check_response(definitions_xml)
         
         definitions = []
-        custom_field_defs = definitions_xml.find('CustomFieldDefinitions')
-        if custom_field_defs is not None:
-            for field_elem in custom_field_defs.findall('CustomFieldDefinition'):
-                definition = {
-                    'Name': XMLParser.get_text(field_elem, 'Name'),
-                    'Type': XMLParser.get_text(field_elem, 'Type'),
-                    'UUID': XMLParser.get_text(field_elem, 'UUID'),
-                    'UseContact': XMLParser.get_text(field_elem, 'UseContact')
-                }
-                
-                if options := field_elem.find('Options'):
-                    definition['Options'] = options.text
-                if mandatory := field_elem.find('Mandatory'):
-                    definition['Mandatory'] = mandatory.text
-                
-                if (definition['UseContact'] == 'true' and 
-                    definition['Name'] and 
-                    definition['Type'] and 
-                    definition['UUID']):
-                    definitions.append(definition)
-                    logger.debug(f"Found contact custom field definition: {definition}")
+        append = definitions.append
+        get_text = XMLParser.get_text
+        intern = sys.intern
+        if _DEFS_XPATH is not None:
+            field_elems = _DEFS_XPATH(definitions_xml)
+        else:
+            field_elems = definitions_xml.findall('CustomFieldDefinitions/CustomFieldDefinition')
+        for field_elem in field_elems:
+            # Type values repeat across definitions and are used as lookup
+            # keys downstream, so keep one shared copy of each
+            field_type = get_text(field_elem, _TAG_TYPE)
+            definition = {
+                _TAG_NAME: get_text(field_elem, _TAG_NAME),
+                _TAG_TYPE: intern(field_type) if field_type else field_type,
+                _TAG_UUID: get_text(field_elem, _TAG_UUID),
+                _TAG_USECONTACT: get_text(field_elem, _TAG_USECONTACT)
+            }
+            
+            if options := field_elem.find('Options'):
+                definition['Options'] = options.text
+            if mandatory := field_elem.find('Mandatory'):
+                definition['Mandatory'] = mandatory.text
+            
+            if (definition['UseContact'] == 'true' and 
+                definition['Name'] and 
+                definition['Type'] and 
+                definition['UUID']):
+                append(definition)
+                logger.debug(f"Found contact custom field definition: {definition}")
         
         return definitions
 
@@ -146,39 +217,23 @@ class XMLParser:
         if 'Type' not in field_def:
             raise ValueError(f"Field definition for {field_name} missing Type")
             
-        root = ET.Element('CustomFields')
-        custom_field = ET.SubElement(root, 'CustomField')
-        
-        # Add UUID element (required)
-        uuid_elem = ET.SubElement(custom_field, 'UUID')
-        uuid_elem.text = field_def['UUID']
-        
-        # Add Name element (required)
-        name_elem = ET.SubElement(custom_field, 'Name')
-        name_elem.text = field_name
-        
-        # Add value under type-specific element
-        if field_def['Type'] == 'Checkbox':
-            value_elem = ET.SubElement(custom_field, 'Boolean')
-            value_elem.text = str(field_value).lower()
-        elif field_def['Type'] == 'Date':
-            value_elem = ET.SubElement(custom_field, 'Date')
-            try:
-                date_obj = datetime.strptime(field_value, '%Y-%m-%d')
-                value_elem.text = date_obj.strftime('%Y-%m-%d')
-            except ValueError:
+        # Value goes under a type-specific element
+        field_type = field_def['Type']
+        value_tag = _VALUE_ELEMENTS.get(field_type, 'Text')
+        if field_type == 'Checkbox':
+            value = str(field_value).lower()
+        elif field_type == 'Date':
+            if not _validate_ymd(field_value):
                 raise ValueError(f"Invalid date format for {field_name}. Expected YYYY-MM-DD")
-        elif field_def['Type'] == 'Decimal':
-            value_elem = ET.SubElement(custom_field, 'Decimal')
-            value_elem.text = field_value
-        elif field_def['Type'] == 'Number':
-            value_elem = ET.SubElement(custom_field, 'Number')
-            value_elem.text = field_value
-        elif field_def['Type'] == 'Link':
-            value_elem = ET.SubElement(custom_field, 'LinkURL')
-            value_elem.text = field_value
+            value = field_value
         else:
-            value_elem = ET.SubElement(custom_field, 'Text')
-            value_elem.text = field_value
+            value = '' if field_value is None else escape(field_value)
         
-        return ET.tostring(root, encoding='unicode', xml_declaration=True)
+        return (
+            "<?xml version='1.0' encoding='UTF-8'?>\n"
+            '<CustomFields><CustomField>'
+            f'<UUID>{escape(field_def["UUID"])}</UUID>'
+            f'<Name>{escape(field_name)}</Name>'
+            f'<{value_tag}>{value}</{value_tag}>'
+            '</CustomField></CustomFields>'
+        )
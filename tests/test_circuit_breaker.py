@@ -0,0 +1,145 @@
+"""Tests for the LinkedIn lookup circuit breaker."""
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from mtd_workflowmax.config import config
+from mtd_workflowmax.services import workflowmax_linkedin_service as service_module
+from mtd_workflowmax.services.workflowmax_linkedin_service import (
+    WorkflowMaxLinkedInService,
+    _CircuitBreaker
+)
+
+def test_breaker_needs_min_lookups_before_tripping():
+    breaker = _CircuitBreaker(window=50, failure_rate=0.5, min_lookups=10)
+    for _ in range(9):
+        breaker.record(False)
+    assert not breaker.tripped
+    breaker.record(False)
+    assert breaker.tripped
+
+def test_breaker_trips_above_failure_rate_only():
+    breaker = _CircuitBreaker(window=50, failure_rate=0.5, min_lookups=10)
+    for success in [True, False] * 5:
+        breaker.record(success)
+    assert not breaker.tripped
+    breaker.record(False)
+    assert breaker.tripped
+
+def test_breaker_window_drops_old_outcomes():
+    breaker = _CircuitBreaker(window=10, failure_rate=0.5, min_lookups=10)
+    for _ in range(10):
+        breaker.record(False)
+    for _ in range(10):
+        breaker.record(True)
+    assert len(breaker) == 10
+    assert breaker.failures == 0
+    assert not breaker.tripped
+
+def test_breaker_counts_consecutive_successes_and_clears():
+    breaker = _CircuitBreaker(window=50, failure_rate=0.5, min_lookups=10)
+    for success in [True, True, False, True, True, True]:
+        breaker.record(success)
+    assert breaker.consecutive_successes == 3
+    breaker.clear()
+    assert len(breaker) == 0
+    assert breaker.consecutive_successes == 0
+
+class _Contact:
+    """Contact stand-in without a LinkedIn profile."""
+    
+    def __init__(self, uuid: str, fails: bool):
+        self.uuid = uuid
+        self.fails = fails
+    
+    def get_custom_field_value(self, name):
+        return None
+
+class _Contacts:
+    """Contact repository stand-in yielding fixed pages."""
+    
+    def __init__(self, pages):
+        self.pages = pages
+        self.fetched = 0
+    
+    def iter_pages(self, page_size, include_custom_fields=False):
+        for page in self.pages:
+            self.fetched += 1
+            yield page
+
+def _page(size, fails):
+    return [_Contact(f"{fails}-{i}", fails) for i in range(size)]
+
+@pytest.fixture
+def run_pages(monkeypatch):
+    """Run update_missing_linkedin_profiles over pages of failing/passing lookups.
+    
+    Returns:
+        Function taking the pages and returning (worker counts used per
+        page, cooldown sleeps, pages fetched)
+    """
+    monkeypatch.setattr(config.api.rate_limit, 'concurrent_limit', 4)
+    workers_used = []
+    sleeps = []
+    real_pool = service_module.fan_out_pool
+    
+    def spy_pool(task_count, max_workers, name='fan-out'):
+        workers_used.append(max_workers)
+        return real_pool(task_count, max_workers, name)
+    
+    monkeypatch.setattr(service_module, 'fan_out_pool', spy_pool)
+    monkeypatch.setattr(service_module.time, 'sleep', sleeps.append)
+    
+    def run(pages):
+        contacts = _Contacts(pages)
+        service = WorkflowMaxLinkedInService.__new__(WorkflowMaxLinkedInService)
+        service.repositories = SimpleNamespace(contacts=contacts)
+        service._linkedin = SimpleNamespace(SIMILARITY_THRESHOLD=0.7)
+        service._match_cache = {}
+        service._match_cache_dirty = False
+        service._match_cache_lock = threading.Lock()
+        
+        def match_contact(contact_uuid, refresh_cache, contact):
+            if contact.fails:
+                raise RuntimeError("lookup failed")
+            return None
+        
+        service._match_contact = match_contact
+        service.update_missing_linkedin_profiles(batch_size=10, dry_run=True)
+        return workers_used, sleeps, contacts.fetched
+    
+    return run
+
+def test_breaker_opens_half_opens_and_closes(run_pages):
+    cooldown = WorkflowMaxLinkedInService.BREAKER_COOLDOWN
+    workers, sleeps, fetched = run_pages([
+        _page(10, fails=True),   # closed -> open: pause, halve concurrency
+        _page(4, fails=False),   # half-open: too few successes to close
+        _page(10, fails=False),  # enough consecutive successes: closed again
+        _page(10, fails=False),
+    ])
+    assert workers == [4, 2, 2, 4]
+    assert sleeps == [cooldown]
+    assert fetched == 4
+
+def test_breaker_reopens_from_half_open(run_pages):
+    workers, sleeps, _ = run_pages([
+        _page(10, fails=True),
+        _page(10, fails=True),   # still failing at half concurrency
+        _page(10, fails=False),
+    ])
+    assert workers == [4, 2, 1]
+    assert len(sleeps) == 2
+
+def test_breaker_stops_when_failing_at_one_worker(run_pages):
+    workers, sleeps, fetched = run_pages([
+        _page(10, fails=True),
+        _page(10, fails=True),
+        _page(10, fails=True),   # trips at one worker: stop
+        _page(10, fails=False),
+    ])
+    assert workers == [4, 2, 1]
+    assert len(sleeps) == 2
+    assert fetched == 3
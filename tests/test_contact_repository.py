@@ -0,0 +1,77 @@
+"""Tests for contact listing and paging."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from mtd_workflowmax.core.exceptions import WorkflowMaxError
+from mtd_workflowmax.models import CustomFieldValue
+from mtd_workflowmax.repositories.contact_repository import ContactRepository
+
+def _client(number, contact_uuids):
+    contacts = ''.join(
+        f'<Contact><UUID>{uuid}</UUID><Name>Contact {uuid}</Name>'
+        f'<Position>Director</Position><IsPrimary>{"true" if uuid == "a" else "false"}</IsPrimary>'
+        f'</Contact>'
+        for uuid in contact_uuids
+    )
+    return (
+        f'<Client><UUID>cl{number}</UUID><Name>Client {number}</Name>'
+        f'<Contacts>{contacts}</Contacts></Client>'
+    )
+
+# Pages of two clients; contact 'a' is listed under clients 1 and 2 and
+# contact 'b' under clients 1 and 3
+PAGES = {
+    1: _client(1, 'ab') + _client(2, 'a'),
+    2: _client(3, 'bc') + _client(4, ''),
+    3: _client(5, 'd'),
+}
+
+class _ListClient:
+    """API client stand-in serving client.api/list pages."""
+    
+    def __init__(self, status='OK'):
+        self.status = status
+        self.pages_requested = []
+    
+    def get(self, endpoint, params=None):
+        page = int(params['page'])
+        self.pages_requested.append(page)
+        body = (
+            f'<Response><Status>{self.status}</Status>'
+            f'<Clients>{PAGES[page]}</Clients></Response>'
+        ).encode()
+        return SimpleNamespace(content=body, text=body.decode())
+
+def test_search_merges_positions_of_contacts_listed_twice():
+    contacts = ContactRepository(_ListClient()).search(page=1, page_size=2)
+    assert [contact.uuid for contact in contacts] == ['a', 'b']
+    positions = [(p.client_name, p.client_uuid, p.is_primary) for p in contacts[0].positions]
+    assert positions == [('Client 1', 'cl1', True), ('Client 2', 'cl2', True)]
+    assert contacts[1].positions[0].position == 'Director'
+
+def test_search_raises_on_error_status():
+    with pytest.raises(WorkflowMaxError, match='ERROR'):
+        ContactRepository(_ListClient(status='ERROR')).search(page=1, page_size=2)
+
+def test_iter_pages_stops_at_short_page_and_skips_repeats():
+    api = _ListClient()
+    pages = list(ContactRepository(api).iter_pages(2))
+    assert [[contact.uuid for contact in page] for page in pages] == [['a', 'b'], ['c'], ['d']]
+    assert api.pages_requested == [1, 2, 3]
+
+def test_iter_pages_loads_custom_fields_and_drops_failures():
+    repo = ContactRepository(_ListClient())
+    
+    def get_custom_field_map(uuid):
+        if uuid == 'c':
+            raise WorkflowMaxError("fields unavailable")
+        return {'LINKEDIN PROFILE': CustomFieldValue(name='LINKEDIN PROFILE', type='Text', value=uuid)}
+    
+    repo.get_custom_field_map = get_custom_field_map
+    pages = list(repo.iter_pages(2, include_custom_fields=True))
+    assert [
+        [(contact.uuid, contact.get_custom_field_value('LINKEDIN PROFILE')) for contact in page]
+        for page in pages
+    ] == [[('a', 'a'), ('b', 'b')], [('d', 'd')]]
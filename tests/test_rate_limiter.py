@@ -0,0 +1,97 @@
+"""Tests for the API client's rate limiter."""
+
+import threading
+import time
+
+import pytest
+
+from mtd_workflowmax.api.client import RateLimiter
+from mtd_workflowmax.config import config
+
+@pytest.fixture
+def limits(monkeypatch):
+    """Set the rate limits a new RateLimiter picks up."""
+    def set_limits(concurrent=10, minute=60, daily=5000):
+        rate_limit = config.api.rate_limit
+        monkeypatch.setattr(rate_limit, 'concurrent_limit', concurrent)
+        monkeypatch.setattr(rate_limit, 'minute_limit', minute)
+        monkeypatch.setattr(rate_limit, 'daily_limit', daily)
+        return RateLimiter()
+    return set_limits
+
+def _run_concurrently(limiter, calls, hold=0.01):
+    """Make calls through the limiter from one thread each.
+    
+    Returns:
+        Highest number of calls seen inside the limiter at once
+    """
+    lock = threading.Lock()
+    active = peak = 0
+    start = threading.Barrier(calls)
+    
+    def call():
+        nonlocal active, peak
+        start.wait()
+        with limiter.acquire():
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(hold)
+            with lock:
+                active -= 1
+    
+    threads = [threading.Thread(target=call) for _ in range(calls)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+        assert not thread.is_alive()
+    return peak
+
+def test_concurrent_limit_holds_under_contention(limits):
+    limiter = limits(concurrent=3)
+    peak = _run_concurrently(limiter, calls=24)
+    assert peak == 3
+    assert limiter.active_calls == 0
+    # Every call is counted against the windows exactly once
+    assert limiter.minute_calls == 24
+    assert limiter.daily_calls == 24
+
+def test_released_slot_wakes_a_waiter(limits):
+    limiter = limits(concurrent=1)
+    acquired = threading.Event()
+    
+    def waiter():
+        with limiter.acquire():
+            acquired.set()
+    
+    with limiter.acquire():
+        thread = threading.Thread(target=waiter)
+        thread.start()
+        assert not acquired.wait(0.1)
+    # Woken by the release rather than a polling interval
+    assert acquired.wait(1)
+    thread.join()
+
+def test_minute_window_blocks_until_reset(limits):
+    limiter = limits(minute=5)
+    for _ in range(5):
+        with limiter.acquire():
+            pass
+    limiter.minute_reset = time.time() + 0.2
+    
+    started = time.monotonic()
+    with limiter.acquire():
+        pass
+    assert time.monotonic() - started >= 0.15
+    # The new window holds only the call that waited for it
+    assert limiter.minute_calls == 1
+    assert limiter.daily_calls == 6
+
+def test_minute_window_is_shared_between_waiting_threads(limits):
+    limiter = limits(minute=4)
+    limiter.minute_reset = time.time() + 0.3
+    _run_concurrently(limiter, calls=8, hold=0)
+    # Four calls fit the first window; the rest start the next one
+    assert limiter.minute_calls == 4
+    assert limiter.daily_calls == 8
@@ -0,0 +1,46 @@
+"""Tests for the Relationship model."""
+
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from mtd_workflowmax.core.exceptions import ValidationError
+from mtd_workflowmax.models.relationship import Relationship
+
+def _element(xml: str) -> ET.Element:
+    return ET.fromstring(xml)
+
+def test_from_xml_round_trips_through_to_xml():
+    rel = Relationship.from_xml(_element(
+        '<Relationship><UUID>r1</UUID><ClientUUID>c1</ClientUUID>'
+        '<RelatedClientUUID>c2</RelatedClientUUID><Type>Director</Type>'
+        '<StartDate>2024-01-05</StartDate><Percentage>12.5</Percentage></Relationship>'
+    ))
+    assert (rel.client_uuid, rel.related_client_uuid, rel.type) == ('c1', 'c2', 'Director')
+    assert rel.percentage == 12.5
+    assert '<ClientUUID>c1</ClientUUID>' in rel.to_xml()
+
+@pytest.mark.parametrize('missing', ['ClientUUID', 'RelatedClientUUID', 'Type'])
+def test_from_xml_rejects_missing_required_element(missing):
+    fields = {'ClientUUID': 'c1', 'RelatedClientUUID': 'c2', 'Type': 'Director'}
+    del fields[missing]
+    body = ''.join(f'<{tag}>{value}</{tag}>' for tag, value in fields.items())
+    with pytest.raises(ValidationError, match='required'):
+        Relationship.from_xml(_element(f'<Relationship>{body}</Relationship>'))
+
+@pytest.mark.parametrize('kwargs', [
+    {'client_uuid': None},
+    {'related_client_uuid': ''},
+    {'type': 'Cousin'},
+    {'start_date': '2024-13-01'},
+    {'end_date': '2024-01-01\n'},
+    {'percentage': 101},
+])
+def test_constructor_rejects_invalid_values(kwargs):
+    values = {'client_uuid': 'c1', 'related_client_uuid': 'c2', 'type': 'Director', **kwargs}
+    with pytest.raises(ValidationError):
+        Relationship(**values)
+
+def test_alias_keywords_are_not_accepted():
+    with pytest.raises(TypeError):
+        Relationship(ClientUUID='c1', RelatedClientUUID='c2', Type='Director')
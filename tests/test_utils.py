@@ -0,0 +1,77 @@
+"""Tests for core utility helpers."""
+
+from datetime import datetime
+
+import pytest
+
+from mtd_workflowmax.core.utils import compile_date_format, is_valid_ymd
+
+def _strptime_accepts(value: str) -> bool:
+    try:
+        datetime.strptime(value, '%Y-%m-%d')
+    except ValueError:
+        return False
+    return True
+
+@pytest.mark.parametrize('value', [
+    '2024-01-01',
+    '2024-12-31',
+    '2024-02-29',
+    '2023-02-29',
+    '2023-04-31',
+    '2024-00-10',
+    '2024-13-01',
+    '2024-01-00',
+    '2024-01-32',
+    '0999-01-01',
+    '2024/01/01',
+    '2024-01-01\n',
+    '2024-01-01 ',
+    ' 2024-01-01',
+    '2024-01-01T00:00',
+    '',
+])
+def test_is_valid_ymd_matches_strptime(value):
+    assert is_valid_ymd(value) == _strptime_accepts(value)
+
+@pytest.mark.parametrize('value', ['2024-1-5', '2024-01-5', '2024-1-05'])
+def test_is_valid_ymd_requires_zero_padding(value):
+    # strptime accepts these; WorkflowMax dates are always zero-padded
+    assert _strptime_accepts(value)
+    assert not is_valid_ymd(value)
+
+@pytest.mark.parametrize('fmt, value', [
+    ('%Y-%m-%d', '2024-01-05'),
+    ('%Y-%m-%d', '2024-1-5'),
+    ('%Y-%m-%d', '2024-01-05\n'),
+    ('%Y-%m-%d', '2024-02-30'),
+    ('%Y-%m-%d', '24-01-05'),
+    ('%Y-%m-%d', '2024-01- 5'),
+    ('%Y%m%d', '20240105'),
+    ('%Y%m%d', '2024015'),
+    ('%Y%m%d', '202401051'),
+    ('%Y-%m-%d %H:%M:%S%z', '2024-01-05 10:00:00+0000'),
+    ('%Y-%m-%d %H:%M:%S%z', '2024-01-05 10:00:00+0000\n'),
+    ('%Y-%m-%d %H:%M:%S%z', '2024-1-5 1:2:3+00:00'),
+    ('%Y-%m-%d %H:%M:%S%z', '2024-01-05  10:00:00-05:30'),
+    ('%Y-%m-%d %H:%M:%S%z', '2024-01-05 10:00:00Z'),
+    ('%Y-%m-%d %H:%M:%S%z', '2024-01-05 10:00:00z'),
+    ('%Y-%m-%d %H:%M:%S%z', '2024-01-05 10:00:00+01:00:30'),
+    ('%Y-%m-%d %H:%M:%S%z', '2024-01-05 10:00:00+01:0030'),
+    ('%Y-%m-%d %H:%M:%S%z', '2024-01-05 10:00:00+010030.5'),
+    ('%Y-%m-%d %H:%M:%S%z', '2024-01-05 10:00:60+0000'),
+    ('%Y-%m-%d %H:%M:%S%z', '2024-01-05 24:00:00+0000'),
+    ('%Y-%m-%d %H:%M:%S%z', '2024-01-05 10:00:00'),
+    ('%Y-%m-%dT%H:%M:%S', '2024-01-05t10:00:00'),
+    ('%d/%m/%Y %%', '05/01/2024 %'),
+])
+def test_compile_date_format_matches_strptime(fmt, value):
+    try:
+        expected = datetime.strptime(value, fmt)
+    except ValueError:
+        with pytest.raises(ValueError):
+            compile_date_format(fmt)(value)
+    else:
+        parsed = compile_date_format(fmt)(value)
+        assert parsed == expected
+        assert parsed.utcoffset() == expected.utcoffset()
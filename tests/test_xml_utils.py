@@ -0,0 +1,73 @@
+"""Tests for streamed XML response parsing."""
+
+from io import BytesIO
+from types import SimpleNamespace
+
+import pytest
+
+from mtd_workflowmax.core.exceptions import WorkflowMaxError
+from mtd_workflowmax.core.xml_utils import iter_elements
+from mtd_workflowmax.repositories.custom_field_repository import CustomFieldRepository
+from mtd_workflowmax.repositories.relationship_repository import RelationshipRepository
+
+ERROR_BODY = (
+    b'<Response><Status>ERROR</Status>'
+    b'<ErrorDescription>Client not found</ErrorDescription></Response>'
+)
+
+OK_BODY = (
+    b'<Response><Status>OK</Status><Relationships>'
+    b'<Relationship><UUID>r1</UUID><Type>Director</Type>'
+    b'<ClientUUID>c1</ClientUUID><RelatedClientUUID>c2</RelatedClientUUID></Relationship>'
+    b'<Relationship><UUID>r2</UUID><Type>Shareholder</Type>'
+    b'<ClientUUID>c1</ClientUUID><RelatedClientUUID>c3</RelatedClientUUID></Relationship>'
+    b'</Relationships></Response>'
+)
+
+DEFINITIONS_BODY = (
+    b'<Response><Status>OK</Status><CustomFieldDefinitions>'
+    b'<CustomFieldDefinition><UUID>f1</UUID><Name>LINKEDIN PROFILE</Name>'
+    b'<Type>Text</Type><UseContact>true</UseContact></CustomFieldDefinition>'
+    b'</CustomFieldDefinitions></Response>'
+)
+
+class _StreamingClient:
+    """API client stand-in returning a fixed streamed body."""
+    
+    def __init__(self, body: bytes):
+        self.body = body
+    
+    def get(self, endpoint, params=None, stream=False):
+        return SimpleNamespace(raw=BytesIO(self.body), close=lambda: None)
+
+def test_iter_elements_yields_matches_in_order():
+    uuids = [
+        elem.findtext('UUID')
+        for elem in iter_elements(BytesIO(OK_BODY), ('Relationships', 'Relationship'))
+    ]
+    assert uuids == ['r1', 'r2']
+
+def test_iter_elements_raises_on_error_status():
+    with pytest.raises(WorkflowMaxError, match='ERROR'):
+        list(iter_elements(BytesIO(ERROR_BODY), ('Relationships', 'Relationship')))
+
+def test_get_relationships_for_client_raises_on_error_status():
+    repo = RelationshipRepository(_StreamingClient(ERROR_BODY))
+    with pytest.raises(WorkflowMaxError, match='ERROR'):
+        repo.get_relationships_for_client('missing')
+
+def test_get_relationships_for_client_parses_relationships():
+    repo = RelationshipRepository(_StreamingClient(OK_BODY))
+    relationships = repo.get_relationships_for_client('c1')
+    assert [rel.uuid for rel in relationships] == ['r1', 'r2']
+    assert [rel.related_client_uuid for rel in relationships] == ['c2', 'c3']
+
+def test_get_definitions_parses_streamed_definitions():
+    repo = CustomFieldRepository(_StreamingClient(DEFINITIONS_BODY))
+    definitions = repo.get_definitions(force_refresh=True)
+    assert [(d.name, d.use_contact) for d in definitions] == [('LINKEDIN PROFILE', True)]
+
+def test_get_definitions_raises_on_error_status():
+    repo = CustomFieldRepository(_StreamingClient(ERROR_BODY))
+    with pytest.raises(WorkflowMaxError, match='API error: ERROR'):
+        repo.get_definitions(force_refresh=True)